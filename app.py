@@ -1,31 +1,97 @@
 import os
 import sys
-import streamlit as st
-import pandas as pd
-import numpy as np
 from datetime import datetime
+from uuid import uuid4
 
 # 상위 디렉토리 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# 시작 시간 리포트용 임포트 측정 (import_timing은 표준 라이브러리만 사용하므로 무거운 임포트보다 먼저 로드)
+from import_timing import timed_imports, load_page, import_report
+
+# 앱 시작 시 임포트하는 무거운 패키지와 모듈을 의존 순서대로 한 번씩 측정
+# (프로세스의 첫 실행에서만 기록되고, 이후 리런은 sys.modules에서 바로 반환)
+# streamlit은 `streamlit run`이 스크립트 실행 전에 임포트하므로 측정 대상에서 제외
+STARTUP_IMPORTS = [
+    'numpy',
+    'pandas',
+    'pyarrow',  # data_store의 컬럼형 저장소
+    'plotly.express',  # utils.visualization_utils의 차트 테마
+    'utils.visualization_utils',
+    'utils.data_utils',
+    'perf',
+    'metrics',
+    'dataset_cache',
+    'data_store',
+    'data_refresh',
+]
+timed_imports(STARTUP_IMPORTS)
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+# 공유 데이터셋 캐시(dataset_cache)가 데이터프레임을 얕은 복사본으로 나눠 주므로,
+# 세션에서 복사본에 쓴 값이 캐시 원본에 반영되지 않도록 프로세스 전체에 copy-on-write 사용 (pandas 2.x, 3.x는 항상 사용)
+try:
+    pd.set_option('mode.copy_on_write', True)
+except (KeyError, ValueError):  # 옵션이 없는 pandas 버전
+    pass
+
 # 유틸리티 모듈 임포트
 from utils.visualization_utils import apply_custom_css, COLOR_PALETTE
 from utils.data_utils import generate_sample_data
-from components.semiconductor_industry import show_semiconductor_industry_main, show_supply_chain
-from components.construction_industry import show_construction_industry
-from components.information import show_information
-from components.news_component import show_news
-
-# 페이지 설정
-st.set_page_config(
-    page_title="반도체 산업 동향 분석 대시보드",
-    page_icon="🔷",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# CSS 스타일 추가
-st.markdown("""
+from data_store import DATA_DIR, memory_report, pin_snapshot, unpin_snapshot
+from data_refresh import refresh_worker
+from dataset_cache import dataset_cache
+from perf import start_trace, finish_trace, trace_report, TRACE_PATH
+from metrics import start_metrics_server, mark_session_active, page_render_seconds, rerun_seconds
+
+# 메뉴별 페이지 모듈 (무거운 시각화 라이브러리는 페이지를 처음 열 때 임포트)
+PAGES = {
+    "반도체 산업 동향": ("components.semiconductor_industry", "show_semiconductor_industry_main"),
+    "반도체 건설 산업 동향": ("components.construction_industry", "show_construction_industry"),
+    "반도체 건설 원자재 가격": ("components.raw_materials", "show_raw_materials"),
+    "반도체 뉴스": ("components.news_component", "show_news"),
+    "정보": ("components.information", "show_information"),
+}
+
+
+def build_first_snapshot():
+    """
+    샘플 데이터가 없으면 작업 디렉토리(DATA_DIR)에 생성하는 함수
+
+    첫 스냅샷의 builder로 갱신 작업기 스레드에서 실행되므로, 데이터를 다 쓴 뒤에
+    스냅샷으로 복사됩니다 (쓰는 도중의 파일이 스냅샷에 들어가지 않음).
+    """
+    if not os.path.exists(os.path.join(DATA_DIR, 'semiconductor_sales.csv')):
+        generate_sample_data()
+
+
+# 이번 리런의 구간별 소요 시간 기록 시작
+trace = start_trace()
+
+# 메트릭 엔드포인트 시작 (프로세스당 한 번)
+start_metrics_server()
+
+# 이번 리런 동안 읽을 데이터 스냅샷 고정 (리런 도중 갱신되어도 같은 스냅샷에서 읽음)
+data_snapshot = pin_snapshot()
+try:
+    # 아직 스냅샷이 없으면 (필요하면 샘플 데이터를 만든 뒤) 첫 스냅샷을 백그라운드에서 생성
+    # 실패하면 스냅샷이 생길 때까지 이후 리런에서 다시 시도
+    if data_snapshot is None:
+        refresh_worker.request_first_snapshot(build_first_snapshot)
+
+    # 페이지 설정
+    st.set_page_config(
+        page_title="반도체 산업 동향 분석 대시보드",
+        page_icon="🔷",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # CSS 스타일 추가
+    st.markdown("""
 <link href="https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css" rel="stylesheet" />
 <style>
     /* 전체 폰트 스타일 */
@@ -52,48 +118,60 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 메인 제목 추가
-st.markdown('<h1 class="main-title">반도체 산업 동향 분석 대시보드</h1>', unsafe_allow_html=True)
+    # 메인 제목 추가
+    st.markdown('<h1 class="main-title">반도체 산업 동향 분석 대시보드</h1>', unsafe_allow_html=True)
 
-# 커스텀 CSS 적용
-apply_custom_css()
+    # 커스텀 CSS 적용
+    apply_custom_css()
 
-# 사이드바 설정
-with st.sidebar:
-    st.markdown("""
+    # 사이드바 설정
+    with st.sidebar:
+        st.markdown("""
         <div style='text-align: center; margin-bottom: 20px;'>
             <h1 style='font-size: 1.5rem; font-weight: 600; margin-bottom: 0.5rem;'>반도체 산업 동향 대시보드</h1>
             <p style='color: #64748B; font-size: 0.875rem;'>실시간 데이터 기반 분석</p>
         </div>
     """, unsafe_allow_html=True)
-    
-    st.markdown("<hr style='margin: 1rem 0; border-color: #E2E8F0;'>", unsafe_allow_html=True)
-    
-    # 메뉴 선택
-    menu = st.radio(
-        "분석 항목 선택",
-        ["반도체 산업 동향", "반도체 건설 산업 동향", "반도체 뉴스", "정보"]
-    )
-    
-    st.markdown("<hr style='margin: 1rem 0; border-color: #E2E8F0;'>", unsafe_allow_html=True)
-    
-    # 데이터 업데이트 버튼
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.markdown("""
+        
+        st.markdown("<hr style='margin: 1rem 0; border-color: #E2E8F0;'>", unsafe_allow_html=True)
+        
+        # 메뉴 선택
+        menu = st.radio(
+            "분석 항목 선택",
+            ["반도체 산업 동향", "반도체 건설 산업 동향", "반도체 건설 원자재 가격", "반도체 뉴스", "정보"]
+        )
+        trace.page = menu
+        
+        st.markdown("<hr style='margin: 1rem 0; border-color: #E2E8F0;'>", unsafe_allow_html=True)
+        
+        # 데이터 업데이트 버튼
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.markdown("""
             <p style='color: #64748B; font-size: 0.875rem; margin-bottom: 0.5rem;'>
                 데이터 업데이트
             </p>
         """, unsafe_allow_html=True)
-    with col2:
-        if st.button("새로고침"):
-            with st.spinner("데이터를 업데이트하는 중..."):
-                generate_sample_data()
-                st.success("✅ 완료")
-    
-    # 사이드바 푸터
-    st.markdown("<hr style='margin: 1rem 0; border-color: #E2E8F0;'>", unsafe_allow_html=True)
-    st.markdown("""
+        with col2:
+            refresh_clicked = st.button("새로고침")
+        
+        # 데이터는 백그라운드에서 새 스냅샷으로 만든 뒤 교체 (다음 리런부터 반영)
+        if refresh_clicked:
+            if refresh_worker.request(generate_sample_data):
+                st.info("백그라운드에서 데이터를 갱신합니다.")
+            else:
+                st.info("이미 데이터를 갱신하는 중입니다.")
+        
+        refresh_status = refresh_worker.status()
+        if refresh_status['state'] == 'running':
+            st.caption("데이터 갱신 중...")
+        elif refresh_status['state'] == 'failed':
+            st.caption(f"데이터 갱신 실패: {refresh_status['last_error']}")
+        st.caption(f"데이터 스냅샷: {data_snapshot or '기본 데이터'}")
+        
+        # 사이드바 푸터
+        st.markdown("<hr style='margin: 1rem 0; border-color: #E2E8F0;'>", unsafe_allow_html=True)
+        st.markdown("""
         <div style='position: fixed; bottom: 0; padding: 1rem;'>
             <p style='color: #64748B; font-size: 0.75rem; margin-bottom: 0.25rem;'>
                 © 2025 반도체 산업 동향 대시보드
@@ -104,30 +182,53 @@ with st.sidebar:
         </div>
     """, unsafe_allow_html=True)
 
-# 현재 시간 표시
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-st.sidebar.markdown(f"마지막 업데이트: {current_time}")
+    # 현재 시간 표시
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    st.sidebar.markdown(f"마지막 업데이트: {current_time}")
 
-# 메인 컨텐츠
-if menu == "반도체 산업 동향":
-    show_semiconductor_industry_main()
-    
-    # 공급망 분석 표시 여부
-    if st.checkbox("공급망 분석 보기", value=False):
-        show_supply_chain()
-elif menu == "반도체 건설 산업 동향":
-    show_construction_industry()
-elif menu == "반도체 뉴스":
-    show_news()
-elif menu == "정보":
-    show_information()
-
-# 앱 실행
-if __name__ == "__main__":
-    # 샘플 데이터가 없는 경우 자동 생성
-    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
-    sample_file = os.path.join(data_dir, 'semiconductor_sales.csv')
-    
-    if not os.path.exists(sample_file):
-        with st.spinner("초기 샘플 데이터를 생성 중입니다..."):
-            generate_sample_data() 
\ No newline at end of file
+    # 활성 세션 집계용 세션 표시
+    if 'metrics_session_id' not in st.session_state:
+        st.session_state['metrics_session_id'] = uuid4().hex
+    mark_session_active(st.session_state['metrics_session_id'])
+
+    # 메인 컨텐츠
+    show_page = load_page(*PAGES[menu])
+    with page_render_seconds.time(page=show_page.__name__):
+        show_page()
+
+    if menu == "반도체 산업 동향":
+        # 공급망 분석 표시 여부
+        if st.checkbox("공급망 분석 보기", value=False):
+            show_supply_chain = load_page("components.semiconductor_industry", "show_supply_chain")
+            with page_render_seconds.time(page=show_supply_chain.__name__):
+                show_supply_chain()
+
+    # 모듈별 임포트 소요 시간 리포트
+    with st.sidebar.expander("시작 시간 리포트"):
+        report = import_report()
+        if report:
+            st.dataframe(pd.DataFrame(report), hide_index=True)
+        else:
+            st.caption("기록된 임포트가 없습니다.")
+        st.caption("시작: 앱 시작 시 임포트 (streamlit 제외), 페이지: 페이지를 처음 열 때 임포트")
+
+    # 데이터셋별 타입 축소 전후 메모리 리포트
+    with st.sidebar.expander("메모리 리포트"):
+        report = memory_report()
+        if report:
+            st.dataframe(pd.DataFrame(report), hide_index=True)
+            st.caption(f"데이터셋 캐시 사용량: {dataset_cache.total_bytes / 1024 / 1024:.1f} MB")
+        else:
+            st.caption("아직 로드된 데이터셋이 없습니다.")
+
+    # 이번 리런의 구간별 소요 시간 (PERF_TRACE_PATH가 설정되어 있으면 JSON lines로 저장)
+    trace = finish_trace()
+    rerun_seconds.observe(trace.total_ms / 1000, menu=menu)
+    with st.sidebar.expander("성능 패널"):
+        st.caption(f"{trace.page} 리런 전체: {trace.total_ms:.1f} ms")
+        st.dataframe(pd.DataFrame(trace_report(trace)), hide_index=True)
+        if TRACE_PATH:
+            st.caption(f"트레이스 저장 위치: {TRACE_PATH}")
+finally:
+    # 예외나 st.stop()으로 리런이 중단되어도 이 스레드의 스냅샷 고정 해제
+    unpin_snapshot()
@@ -0,0 +1,374 @@
+"""
+대시보드 페이지 벤치마크
+
+현재 CSV를 1x, 10x, 100x, 1000x 크기로 늘린 합성 데이터로 실제 페이지 함수(show_*)를
+Streamlit AppTest로 헤드리스 실행하고, 페이지에 기록된 perf 구간을
+로드 / 필터 / 집계 / 차트 생성 시간으로 나눠 측정합니다.
+저장된 기준값보다 느려지거나, 기준값 파일이 없거나, 측정한 페이지/단계의 기준값이 없으면
+실패(종료 코드 1)합니다.
+
+각 측정은 DASHBOARD_DATA_DIR을 합성 데이터 디렉토리로 지정한 새 프로세스에서 실행하므로
+캐시가 비어 있는 상태(첫 방문)의 시간이며, 다른 측정이나 호출한 프로세스에 영향을 주지 않습니다.
+
+사용 예:
+    python benchmark.py                      # 측정 후 기준값과 비교
+    python benchmark.py --scales 1 10        # 일부 배율만 측정
+    python benchmark.py --pages show_construction_industry
+    python benchmark.py --save-baseline      # 현재 결과를 기준값으로 저장
+
+뉴스 페이지는 NewsAPI 대신 측정 기간을 미리 채운 뉴스 아카이브를 조회합니다.
+"""
+import os
+import sys
+import glob
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime, timedelta, timezone
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(SOURCE_DIR, 'benchmark_baseline.json')
+DEFAULT_SCALES = [1, 10, 100, 1000]
+
+# 기준값 대비 허용 배율과 최소 허용 오차(초)
+REGRESSION_RATIO = 1.5
+REGRESSION_FLOOR = 0.005
+
+# 페이지 한 번 실행의 최대 시간 (초)
+PAGE_TIMEOUT = int(os.environ.get('BENCHMARK_PAGE_TIMEOUT', '600'))
+
+# 측정할 페이지: 이름 -> (모듈, 함수, 키워드 인자)
+# lazy=False이면 모든 탭(섹션)을 한 번에 실행합니다.
+PAGES = {
+    'show_semiconductor_industry_main': ('semiconductor_industry', 'show_semiconductor_industry_main', {'lazy': False}),
+    'show_construction_industry': ('construction_industry', 'show_construction_industry', {'lazy': False}),
+    'show_raw_materials': ('raw_materials', 'show_raw_materials', {}),
+    'show_industry_trend': ('industry_trend', 'show_industry_trend', {}),
+    'show_news': ('news_component', 'show_news', {}),
+}
+
+# 미리 채운 뉴스 아카이브를 조회하는 페이지 (API 키는 형식상 값만 사용)
+NEWS_PAGES = {'show_news'}
+BENCHMARK_NEWS_KEY = 'benchmark-no-request'
+NEWS_DAYS = 30
+
+# 배율만큼 늘릴 CSV: 파일 이름 -> (이름 컬럼, 잡음을 더할 수치 컬럼)
+SCALED_FILES = {
+    'semiconductor_sales.csv': ('Company', ['Sales_Volume', 'Market_Share']),
+    'semiconductor_production.csv': ('Company', ['Production_Volume', 'Efficiency']),
+    'construction_projects.csv': ('Project_Name', ['Investment_Amount', 'Latitude', 'Longitude']),
+    'construction_revenue.csv': ('Company', ['Revenue']),
+    'raw_materials_prices.csv': ('material', []),
+    'market_indicators.csv': ('indicator', []),
+}
+
+STAGES = ('load', 'filter', 'aggregate', 'figure')
+
+
+def stage_category(span_name):
+    """perf 구간 이름을 측정 단계(load/filter/aggregate/figure)로 변환하는 함수 (해당 없으면 None)"""
+    if span_name.startswith('load:'):
+        return 'load'
+    if span_name.startswith('figure:'):
+        return 'figure'
+    if span_name in ('filter', 'aggregate'):
+        return span_name
+    return None
+
+
+def summarize_trace(trace):
+    """
+    트레이스를 단계별 소요 시간(초)으로 합산하는 함수
+
+    각 시간은 가장 안쪽 단계에만 더합니다. 단계 구간 안에 다른 단계 구간이 있으면
+    바깥 단계에서는 그 시간을 뺍니다 (예: aggregate 안의 load:는 load로만 셈).
+    page는 페이지 함수 전체 시간입니다.
+    """
+    times = {stage: 0.0 for stage in STAGES}
+    # 열려 있는 단계 구간 (depth, 단계)
+    open_stages = []
+    for span in trace['spans']:
+        while open_stages and open_stages[-1][0] >= span['depth']:
+            open_stages.pop()
+        category = stage_category(span['name'])
+        if category is None or span['duration_ms'] is None:
+            continue
+        seconds = span['duration_ms'] / 1000
+        times[category] += seconds
+        if open_stages:
+            times[open_stages[-1][1]] -= seconds
+        open_stages.append((span['depth'], category))
+    times['page'] = trace['total_ms'] / 1000
+    return times
+
+
+def scale_frame(df, scale, rng, label_column=None, jitter_columns=()):
+    """데이터프레임을 scale배로 복제하고 수치 컬럼에 잡음을 더하는 함수"""
+    import pandas as pd
+
+    if scale == 1:
+        return df
+    frames = []
+    for k in range(scale):
+        part = df.copy()
+        if k > 0:
+            if label_column:
+                part[label_column] = part[label_column].astype(str) + f"-{k}"
+            for col in jitter_columns:
+                noise = rng.normal(1.0, 0.05, len(part))
+                part[col] = (part[col] * noise).astype(df[col].dtype)
+        frames.append(part)
+    return pd.concat(frames, ignore_index=True)
+
+
+def build_trend_datasets(target_dir, seed=0):
+    """
+    산업 동향 페이지 데이터(market_data.csv, supply_chain.json)를 target_dir에 생성하는 함수
+
+    시장 점유율 추이는 (배율을 적용한) 판매 데이터의 연도 x 기업별 평균 점유율이고,
+    공급망 카드는 공급망 노드를 유형별로 묶은 것입니다.
+    """
+    import numpy as np
+    import pandas as pd
+    from synthetic_data import COUNTRIES
+
+    sales = pd.read_csv(os.path.join(target_dir, 'semiconductor_sales.csv'))
+    market_data = sales.groupby(['Year', 'Company'], as_index=False, sort=False)['Market_Share'].mean()
+    market_data.to_csv(os.path.join(target_dir, 'market_data.csv'), index=False)
+
+    rng = np.random.default_rng(seed)
+    nodes = pd.read_csv(os.path.join(target_dir, 'supply_chain_nodes.csv'))
+    countries = list(COUNTRIES)
+    supply_chain = {
+        node_type: {
+            label: {
+                'country': countries[rng.integers(len(countries))],
+                'share': float(rng.uniform(1, 40)),
+                'products': node_type,
+            }
+            for label in group['label']
+        }
+        for node_type, group in nodes.groupby('type', sort=False)
+    }
+    with open(os.path.join(target_dir, 'supply_chain.json'), 'w', encoding='utf-8') as f:
+        json.dump(supply_chain, f, ensure_ascii=False, indent=2)
+
+
+def build_news_archive(scale, target_dir, seed=0):
+    """
+    배율에 맞는 합성 뉴스를 모든 검색 카테고리의 아카이브에 저장하는 함수
+
+    측정 중 NewsAPI를 호출하지 않도록, 가져온 기간을 현재 시각 이후(하루 뒤)까지로 기록합니다.
+    """
+    from synthetic_data import generate_news
+    from news_archive import NewsArchive, ceil_hour
+    from news_categories import SEARCH_QUERIES
+
+    archive = NewsArchive(os.path.join(target_dir, 'news_archive.sqlite'))
+    now = datetime.now(timezone.utc)
+    generate_news(os.path.join(target_dir, 'news_articles.jsonl'), scale, NEWS_DAYS, seed, archive, end=now)
+    covered_from = ceil_hour(now - timedelta(days=NEWS_DAYS))
+    for query_category in SEARCH_QUERIES:
+        archive.mark_covered(query_category, covered_from, ceil_hour(now + timedelta(days=1)))
+
+
+def build_datasets(scale, target_dir, seed=0):
+    """원본 데이터 파일을 복사하고 주요 CSV를 배율만큼 늘린 합성 데이터를 target_dir에 생성하는 함수"""
+    import numpy as np
+    import pandas as pd
+
+    for pattern in ('*.csv', '*.json'):
+        for path in glob.glob(os.path.join(SOURCE_DIR, pattern)):
+            shutil.copy(path, target_dir)
+
+    rng = np.random.default_rng(seed)
+    for filename, (label_column, jitter_columns) in SCALED_FILES.items():
+        source = os.path.join(SOURCE_DIR, filename)
+        if not os.path.exists(source):
+            continue
+        scaled = scale_frame(pd.read_csv(source), scale, rng, label_column, jitter_columns)
+        scaled.to_csv(os.path.join(target_dir, filename), index=False)
+
+    build_trend_datasets(target_dir, seed)
+    # 뉴스 페이지는 아카이브를 조회하므로 배율에 맞는 기사를 미리 저장
+    build_news_archive(scale, target_dir, seed)
+
+
+def page_script(module_name, function_name, kwargs, trace_path):
+    """AppTest에서 실행할 스크립트 (AppTest.from_function은 함수 본문만 실행하므로 필요한 값은 인자로 받음)"""
+    import importlib
+    import pandas as pd
+    from perf import start_trace, finish_trace
+
+    # app.py와 같이 copy-on-write 사용 (공유 캐시의 얕은 복사본 전제)
+    try:
+        pd.set_option('mode.copy_on_write', True)
+    except (KeyError, ValueError):  # 옵션이 없는 pandas 버전
+        pass
+
+    start_trace(function_name)
+    try:
+        getattr(importlib.import_module(module_name), function_name)(**kwargs)
+    finally:
+        finish_trace(trace_path)
+
+
+def run_worker(page, trace_path):
+    """
+    현재 프로세스에서 페이지를 AppTest로 한 번 실행하고 트레이스를 trace_path에 저장하는 함수
+
+    데이터 디렉토리는 호출한 프로세스가 DASHBOARD_DATA_DIR 환경변수로 지정합니다.
+    """
+    import importlib
+    from streamlit.testing.v1 import AppTest
+
+    module_name, function_name, kwargs = PAGES[page]
+    try:
+        importlib.import_module(module_name)
+    except ImportError as e:
+        print(f"페이지 모듈을 임포트할 수 없습니다 ({module_name}): {str(e)}", file=sys.stderr)
+        return 2
+
+    app = AppTest.from_function(
+        page_script,
+        args=(module_name, function_name, kwargs, trace_path),
+        default_timeout=PAGE_TIMEOUT
+    )
+    if page in NEWS_PAGES:
+        app.secrets['NEWSAPI_KEY'] = BENCHMARK_NEWS_KEY
+    app.run()
+    if app.exception:
+        print(f"AppTest 실행 중 오류 ({page}): {app.exception}", file=sys.stderr)
+        return 1
+    if page in NEWS_PAGES and news_api_requests():
+        # 아카이브 대신 API(실패 시 샘플 뉴스)를 측정한 것이므로 결과를 사용하지 않음
+        print(f"측정 중 NewsAPI 요청이 발생했습니다 ({page})", file=sys.stderr)
+        return 1
+    return 0
+
+
+def news_api_requests():
+    """현재 프로세스에서 보낸 NewsAPI 요청 수를 반환하는 함수"""
+    from metrics import news_api_seconds
+
+    return sum(value for name, _, value in news_api_seconds.samples() if name.endswith('_count'))
+
+
+def measure_page(page, data_dir):
+    """새 프로세스에서 페이지를 한 번 실행하고 단계별 소요 시간(초)을 반환하는 함수"""
+    trace_path = os.path.join(data_dir, f'.trace-{page}-{time.time_ns()}.jsonl')
+    env = dict(os.environ, DASHBOARD_DATA_DIR=data_dir, PERF_TRACE_PATH='', METRICS_PORT='0')
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', page, '--trace', trace_path],
+        cwd=SOURCE_DIR, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip() or f"{page} 실행 실패 (종료 코드 {completed.returncode})")
+
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        trace = json.loads(f.readlines()[-1])
+    os.remove(trace_path)
+    return summarize_trace(trace)
+
+
+def run_benchmarks(scales, pages=None, repeat=3):
+    """배율별로 페이지 벤치마크를 실행하고 {배율: {페이지: {단계: 초}}}를 반환하는 함수 (반복 측정의 중앙값)"""
+    pages = list(pages or PAGES)
+    results = {}
+    for scale in scales:
+        data_dir = tempfile.mkdtemp(prefix=f'bench_{scale}x_')
+        try:
+            build_datasets(scale, data_dir)
+            scale_results = {}
+            for page in pages:
+                samples = [measure_page(page, data_dir) for _ in range(repeat)]
+                scale_results[page] = {
+                    stage: statistics.median(sample[stage] for sample in samples)
+                    for stage in samples[0]
+                }
+                stages = ', '.join(f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in scale_results[page].items())
+                print(f"[{scale}x] {page}: {stages}")
+            results[str(scale)] = scale_results
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+    return results
+
+
+def environment_info():
+    """기준값과 함께 저장할 실행 환경 정보를 반환하는 함수"""
+    info = {'python': platform.python_version(), 'machine': platform.machine(), 'system': platform.system()}
+    for package in ('pandas', 'numpy', 'plotly', 'streamlit', 'pyarrow'):
+        try:
+            info[package] = __import__(package).__version__
+        except ImportError:
+            info[package] = None
+    return info
+
+
+def find_regressions(results, baseline):
+    """
+    기준값과 비교해 (느려진 (배율, 페이지, 단계, 기준값, 측정값) 목록,
+    기준값이 없는 (배율, 페이지, 단계) 목록)을 반환하는 함수
+    """
+    regressions = []
+    missing = []
+    for scale, pages in results.items():
+        for page, stages in pages.items():
+            for stage, seconds in stages.items():
+                base = baseline.get(scale, {}).get(page, {}).get(stage)
+                if base is None:
+                    missing.append((scale, page, stage))
+                elif seconds > base * REGRESSION_RATIO and seconds - base > REGRESSION_FLOOR:
+                    regressions.append((scale, page, stage, base, seconds))
+    return regressions, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 페이지 벤치마크")
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES)
+    parser.add_argument('--pages', nargs='+', choices=list(PAGES), default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--worker', choices=list(PAGES), help=argparse.SUPPRESS)
+    parser.add_argument('--trace', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return run_worker(args.worker, args.trace)
+
+    try:
+        results = run_benchmarks(args.scales, pages=args.pages, repeat=args.repeat)
+    except RuntimeError as e:
+        print(f"벤치마크를 실행하지 못했습니다: {str(e)}")
+        return 2
+
+    if args.save_baseline:
+        baseline = dict(results, _environment=environment_info())
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준값 파일이 없습니다 ({args.baseline}). --save-baseline으로 먼저 저장하세요.")
+        return 1
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions, missing = find_regressions(results, baseline)
+    for scale, page, stage in missing:
+        print(f"기준값 없음: [{scale}x] {page} {stage} (--save-baseline으로 기록)")
+    for scale, page, stage, base, seconds in regressions:
+        print(f"성능 저하: [{scale}x] {page} {stage} {base * 1000:.1f}ms -> {seconds * 1000:.1f}ms")
+    return 1 if regressions or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,5 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import json
 import os
 import sys
 import plotly.express as px
@@ -10,7 +8,16 @@ import pydeck as pdk
 import folium
 from streamlit_folium import folium_static
 from st_aggrid import AgGrid, GridOptionsBuilder, JsCode
-from utils.data_utils import load_semiconductor_data
+from data_store import load_dataset, dataset_version
+from figure_cache import cached_figure
+from downsample import line_figure, is_dense, zoom_range_slider
+from map_aggregation import get_site_bins, DETAIL_ZOOM
+from geo_index import get_geo_index
+from construction_rollups import get_construction_rollup
+from grid_paging import server_side_controls
+from lazy_sections import render_sections
+from perf import stage, timed
+from static_content import render_fragment
 from utils.visualization_utils import (
     create_line_chart, 
     create_bar_chart, 
@@ -30,30 +37,35 @@ def load_construction_data():
     """건설 산업 데이터를 로드하는 함수"""
     try:
         # 프로젝트 데이터 로드
-        projects_df = pd.read_csv('data/construction_projects.csv')
+        projects_df = load_dataset('construction_projects.csv')
         # 매출액 데이터 로드
-        revenue_df = pd.read_csv('data/construction_revenue.csv')
-        # 데이터 소스 정보 로드
-        with open('data/data_sources.json', 'r', encoding='utf-8') as f:
-            sources_info = json.load(f)
+        revenue_df = load_dataset('construction_revenue.csv')
         
-        return projects_df, revenue_df, sources_info
+        return projects_df, revenue_df
     except Exception as e:
         st.error(f"데이터 로드 중 오류가 발생했습니다: {str(e)}")
-        return None, None, None
+        return None, None
 
-def show_aggrid(df, key=None):
+@timed('grid')
+def show_aggrid(df, key=None, server_side=False, page_size=10):
     """
     AgGrid를 사용하여 데이터프레임을 표시하는 함수
+
+    server_side=True이면 정렬/필터/페이지 처리를 서버에서 수행하고
+    현재 페이지 행만 AgGrid로 전송합니다.
     """
+    if server_side:
+        df = server_side_controls(df, key, page_size=page_size)
+    
     gb = GridOptionsBuilder.from_dataframe(df)
-    gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=10)
+    if not server_side:
+        gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=page_size)
     gb.configure_side_bar()
     gb.configure_selection('multiple', use_checkbox=True, groupSelectsChildren=True)
     gb.configure_default_column(groupable=True, value=True, enableRowGroup=True, aggFunc='sum', editable=False)
     
     # 숫자 형식 지정
-    for col in df.select_dtypes(include=['float64', 'int64']).columns:
+    for col in df.select_dtypes(include='number').columns:
         gb.configure_column(col, type=["numericColumn", "numberColumnFilter"], precision=0)
     
     grid_options = gb.build()
@@ -62,7 +74,7 @@ def show_aggrid(df, key=None):
         df,
         gridOptions=grid_options,
         data_return_mode='AS_INPUT',
-        update_mode='MODEL_CHANGED',
+        update_mode='NO_UPDATE' if server_side else 'MODEL_CHANGED',
         fit_columns_on_grid_load=True,
         theme='streamlit',
         enable_enterprise_modules=False,
@@ -71,7 +83,267 @@ def show_aggrid(df, key=None):
         key=key
     )
 
-def show_construction_industry(section="overview"):
+@timed()
+def show_projects_section(projects_df):
+    """
+    반도체 건설 프로젝트 현황 탭을 표시하는 함수
+    """
+    st.header("반도체 건설 프로젝트 현황")
+    
+    # 필터 옵션
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        selected_year = st.selectbox(
+            "연도 선택",
+            sorted(projects_df['Year'].unique()),
+            index=len(projects_df['Year'].unique())-1
+        )
+    with col2:
+        selected_country = st.selectbox(
+            "국가 선택",
+            ['전체'] + sorted(projects_df['Country'].unique())
+        )
+    with col3:
+        selected_status = st.selectbox(
+            "진행 상태",
+            ['전체'] + sorted(projects_df['Status'].unique())
+        )
+    
+    # 데이터 필터링 (테이블 표시용, 원본은 복사하지 않음)
+    with stage('filter'):
+        filtered_df = projects_df
+        if selected_country != '전체':
+            filtered_df = filtered_df[filtered_df['Country'] == selected_country]
+        if selected_status != '전체':
+            filtered_df = filtered_df[filtered_df['Status'] == selected_status]
+    
+    # 프로젝트 테이블 표시
+    st.subheader("프로젝트 목록")
+    show_aggrid(filtered_df, key='projects_table', server_side=True)
+    
+    # 투자금액 차트
+    st.subheader("국가별 투자금액")
+    fig_investment = cached_figure(
+        'investment', dataset_version('construction_projects.csv'), (selected_country, selected_status), None,
+        lambda: px.bar(
+            get_construction_rollup().query(['Country', 'Year'], country=selected_country, status=selected_status),
+            x='Country',
+            y='Investment_Amount',
+            color='Year',
+            title='국가별 연도별 투자금액',
+            labels={
+                'Country': '국가',
+                'Investment_Amount': '투자금액 (억원)',
+                'Year': '연도'
+            }
+        )
+    )
+    st.plotly_chart(fig_investment, use_container_width=True)
+
+@timed()
+def show_revenue_section(revenue_df):
+    """
+    건설사 매출액 분석 탭을 표시하는 함수
+    """
+    st.header("건설사 매출액 분석")
+    
+    # 연도 선택
+    selected_year_revenue = st.selectbox(
+        "연도 선택",
+        sorted(revenue_df['Year'].unique()),
+        index=len(revenue_df['Year'].unique())-1,
+        key='revenue_year'
+    )
+    
+    # 매출액 데이터 필터링
+    with stage('filter'):
+        revenue_filtered = revenue_df[revenue_df['Year'] == selected_year_revenue]
+    
+    # 매출액 테이블
+    st.subheader(f"{selected_year_revenue}년 기업별 매출액")
+    show_aggrid(revenue_filtered, key='revenue_table')
+    
+    # 매출액 추이 차트
+    st.subheader("기업별 매출액 추이")
+    # 데이터가 많으면 구간을 선택해 다시 샘플링
+    revenue_range = None
+    if is_dense(revenue_df, 'Company'):
+        revenue_range = zoom_range_slider(revenue_df, 'Year', key='revenue_range')
+    fig_revenue = cached_figure(
+        'revenue', dataset_version('construction_revenue.csv'), (revenue_range,), None,
+        lambda: line_figure(
+            revenue_df,
+            x='Year',
+            y='Revenue',
+            color='Company',
+            x_range=revenue_range,
+            title='기업별 연도별 매출액 추이',
+            labels={
+                'Year': '연도',
+                'Revenue': '매출액 (억원)',
+                'Company': '기업명'
+            }
+        )
+    )
+    st.plotly_chart(fig_revenue, use_container_width=True)
+
+def show_aggregated_map():
+    """
+    사업장을 서버에서 격자로 집계해 pydeck 지도로 표시하는 함수
+    """
+    metric_options = {
+        "투자금액 (억원)": 'Investment_Amount',
+        "Clean Room 면적 (m²)": 'Clean_Room_Area',
+        "생산장비 금액": 'Equipment_Cost',
+        "전체 도급액": 'Total_Cost',
+        "사업장 수": 'Site_Count',
+    }
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        metric_label = st.selectbox("표시 지표", list(metric_options.keys()), key='map_metric')
+    with col2:
+        zoom = st.slider("확대 수준", min_value=1, max_value=DETAIL_ZOOM, value=3, key='map_zoom')
+    metric = metric_options[metric_label]
+    
+    # 낮은 확대 수준에서는 집계 결과만 브라우저로 전송
+    bins = get_site_bins(zoom)
+    if bins.empty:
+        st.warning("지도에 표시할 위치 데이터가 없습니다.")
+        return
+    
+    max_value = bins[metric].max()
+    layer_data = bins.assign(elevation=bins[metric] / max_value if max_value else 0.0)
+    
+    layer = pdk.Layer(
+        'ColumnLayer',
+        data=layer_data,
+        get_position=['lon', 'lat'],
+        get_elevation='elevation',
+        elevation_scale=500000 / (2 ** zoom),
+        radius=max(2000, 2000000 / (2 ** zoom)),
+        get_fill_color=[79, 70, 229, 180],
+        pickable=True,
+        auto_highlight=True,
+    )
+    
+    view_state = pdk.ViewState(
+        latitude=float(bins['lat'].mean()),
+        longitude=float(bins['lon'].mean()),
+        zoom=zoom,
+        pitch=40,
+    )
+    
+    tooltip = {
+        "html": "사업장 수: {Site_Count}<br>투자금액: {Investment_Amount}<br>"
+                "Clean Room 면적: {Clean_Room_Area}<br>생산장비 금액: {Equipment_Cost}<br>전체 도급액: {Total_Cost}"
+    }
+    
+    st.pydeck_chart(pdk.Deck(layers=[layer], initial_view_state=view_state, tooltip=tooltip))
+    st.caption(f"표시 지점 {len(bins):,}개 (확대 수준 {DETAIL_ZOOM} 이상에서는 개별 사업장 표시)")
+
+def show_proximity_search():
+    """
+    기준 사업장 주변 반경 내의 팹/건설사를 공간 인덱스로 조회하는 함수
+    """
+    geo_index = get_geo_index()
+    sites = geo_index.sites
+    if sites.empty:
+        st.info("검색할 위치 데이터가 없습니다.")
+        return
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        site_names = sites['Name'].astype(str).tolist()
+        selected_site = st.selectbox("기준 사업장", range(len(site_names)),
+                                     format_func=lambda i: site_names[i], key='proximity_site')
+    with col2:
+        radius_km = st.slider("반경 (km)", min_value=1, max_value=500, value=50, key='proximity_radius')
+    
+    center = sites.iloc[selected_site]
+    nearby = geo_index.query_radius(center['lat'], center['lon'], radius_km)
+    # 결과 인덱스는 sites의 행 번호이므로 기준 사업장 행만 제외 (이름이 같은 다른 사업장은 유지)
+    nearby = nearby.drop(index=selected_site, errors='ignore')
+    
+    st.caption(f"{center['Name']} 기준 {radius_km}km 이내 사업장 {len(nearby):,}곳")
+    st.dataframe(
+        nearby[['Name', 'Company', 'Contractor', 'distance_km', 'Investment_Amount', 'Clean_Room_Area', 'Total_Cost']]
+        .rename(columns={
+            'Name': '사업장',
+            'Company': '기업',
+            'Contractor': '시공사',
+            'distance_km': '거리(km)',
+            'Investment_Amount': '투자금액 (억원)',
+            'Clean_Room_Area': 'Clean Room 면적',
+            'Total_Cost': '전체 도급액'
+        })
+        .round({'거리(km)': 1}),
+        hide_index=True
+    )
+
+@timed()
+def show_map_section(projects_df):
+    """
+    건설 프로젝트 지역별 분포 탭을 표시하는 함수
+    """
+    st.header("건설 프로젝트 지역별 분포")
+    
+    # 지도에 프로젝트 위치 표시
+    st.subheader("프로젝트 위치")
+    
+    map_mode = st.radio("지도 모드", ["집계 지도", "개별 위치"], horizontal=True, key='map_mode')
+    
+    if map_mode == "집계 지도":
+        show_aggregated_map()
+    else:
+        # 위도/경도가 있는 데이터만 선택
+        # (전체 프로젝트 테이블을 복사하지 않고 좌표 컬럼만 사용)
+        map_data = projects_df[['Latitude', 'Longitude']].dropna()
+        
+        if not map_data.empty:
+            st.map(map_data, latitude='Latitude', longitude='Longitude')
+        else:
+            st.warning("지도에 표시할 위치 데이터가 없습니다.")
+    
+    # 근접 사업장 검색
+    with st.expander("근접 사업장 검색"):
+        show_proximity_search()
+    
+    # 지역별 프로젝트 수
+    st.subheader("국가별 프로젝트 현황")
+    fig_projects = cached_figure(
+        'projects_by_country', dataset_version('construction_projects.csv'), (), None,
+        lambda: px.pie(
+            get_construction_rollup().query(['Country']),
+            values='Project_Count',
+            names='Country',
+            title='국가별 프로젝트 비중'
+        )
+    )
+    st.plotly_chart(fig_projects, use_container_width=True)
+
+@timed()
+def show_sources_section():
+    """
+    데이터 출처 탭을 표시하는 함수 (미리 변환한 HTML 조각 하나로 표시)
+    """
+    st.header("데이터 출처 및 참고사항")
+    
+    if not render_fragment('data_sources'):
+        st.info("데이터 출처 정보가 없습니다.")
+
+@timed()
+def show_swot_section():
+    """
+    반도체 건설 산업 SWOT 분석 탭을 표시하는 함수
+    """
+    st.header("SWOT 분석")
+    
+    if not render_fragment('swot_construction'):
+        st.info("SWOT 분석 데이터가 없습니다.")
+
+@timed()
+def show_construction_industry(section="overview", lazy=True):
     """
     반도체 건설 산업 동향 페이지를 표시하는 함수
     """
@@ -79,148 +351,19 @@ def show_construction_industry(section="overview"):
     
     try:
         # 데이터 로드
-        projects_df, revenue_df, sources_info = load_construction_data()
+        projects_df, revenue_df = load_construction_data()
         
         if projects_df is None or revenue_df is None:
             return
         
-        # 탭 생성
-        tabs = st.tabs(["프로젝트 현황", "매출액 분석", "지역별 분포", "데이터 출처"])
-        
-        with tabs[0]:
-            st.header("반도체 건설 프로젝트 현황")
-            
-            # 필터 옵션
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                selected_year = st.selectbox(
-                    "연도 선택",
-                    sorted(projects_df['Year'].unique()),
-                    index=len(projects_df['Year'].unique())-1
-                )
-            with col2:
-                selected_country = st.selectbox(
-                    "국가 선택",
-                    ['전체'] + sorted(projects_df['Country'].unique())
-                )
-            with col3:
-                selected_status = st.selectbox(
-                    "진행 상태",
-                    ['전체'] + sorted(projects_df['Status'].unique())
-                )
-            
-            # 데이터 필터링
-            filtered_df = projects_df.copy()
-            if selected_country != '전체':
-                filtered_df = filtered_df[filtered_df['Country'] == selected_country]
-            if selected_status != '전체':
-                filtered_df = filtered_df[filtered_df['Status'] == selected_status]
-            
-            # 프로젝트 테이블 표시
-            st.subheader("프로젝트 목록")
-            show_aggrid(filtered_df, key='projects_table')
-            
-            # 투자금액 차트
-            st.subheader("국가별 투자금액")
-            fig_investment = px.bar(
-                filtered_df.groupby(['Country', 'Year'])['Investment_Amount'].sum().reset_index(),
-                x='Country',
-                y='Investment_Amount',
-                color='Year',
-                title='국가별 연도별 투자금액',
-                labels={
-                    'Country': '국가',
-                    'Investment_Amount': '투자금액 (억원)',
-                    'Year': '연도'
-                }
-            )
-            st.plotly_chart(fig_investment, use_container_width=True)
-        
-        with tabs[1]:
-            st.header("건설사 매출액 분석")
-            
-            # 연도 선택
-            selected_year_revenue = st.selectbox(
-                "연도 선택",
-                sorted(revenue_df['Year'].unique()),
-                index=len(revenue_df['Year'].unique())-1,
-                key='revenue_year'
-            )
-            
-            # 매출액 데이터 필터링
-            revenue_filtered = revenue_df[revenue_df['Year'] == selected_year_revenue]
-            
-            # 매출액 테이블
-            st.subheader(f"{selected_year_revenue}년 기업별 매출액")
-            show_aggrid(revenue_filtered, key='revenue_table')
-            
-            # 매출액 추이 차트
-            st.subheader("기업별 매출액 추이")
-            fig_revenue = px.line(
-                revenue_df,
-                x='Year',
-                y='Revenue',
-                color='Company',
-                title='기업별 연도별 매출액 추이',
-                labels={
-                    'Year': '연도',
-                    'Revenue': '매출액 (억원)',
-                    'Company': '기업명'
-                }
-            )
-            st.plotly_chart(fig_revenue, use_container_width=True)
-        
-        with tabs[2]:
-            st.header("건설 프로젝트 지역별 분포")
-            
-            # 지도에 프로젝트 위치 표시
-            st.subheader("프로젝트 위치")
-            
-            # 위도/경도가 있는 데이터만 선택
-            map_data = projects_df[['Latitude', 'Longitude', 'Project_Name', 'Company', 'Investment_Amount']].copy()
-            map_data = map_data.dropna(subset=['Latitude', 'Longitude'])
-            
-            if not map_data.empty:
-                # 컬럼명 변경
-                map_data.rename(columns={
-                    'Latitude': 'lat',
-                    'Longitude': 'lon'
-                }, inplace=True)
-                st.map(map_data)
-            else:
-                st.warning("지도에 표시할 위치 데이터가 없습니다.")
-            
-            # 지역별 프로젝트 수
-            st.subheader("국가별 프로젝트 현황")
-            fig_projects = px.pie(
-                projects_df.groupby('Country').size().reset_index(name='count'),
-                values='count',
-                names='Country',
-                title='국가별 프로젝트 비중'
-            )
-            st.plotly_chart(fig_projects, use_container_width=True)
-        
-        with tabs[3]:
-            st.header("데이터 출처 및 참고사항")
-            
-            st.subheader("시장 보고서")
-            for report in sources_info['market_reports']:
-                st.markdown(f"- **{report['name']}** ({report['year']})")
-                st.markdown(f"  - 발행: {report['publisher']}")
-                st.markdown(f"  - 설명: {report['description']}")
-            
-            st.subheader("기업 보고서")
-            for report in sources_info['company_reports']:
-                st.markdown(f"- **{report['name']}** ({min(report['years'])}~{max(report['years'])})")
-                st.markdown(f"  - 기업: {report['company']}")
-                st.markdown(f"  - 유형: {report['type']}")
-            
-            st.subheader("데이터 수집 방법론")
-            st.markdown(f"- {sources_info['methodology']['data_collection']}")
-            st.markdown(f"- {sources_info['methodology']['forecast']}")
-            st.markdown(f"- {sources_info['methodology']['verification']}")
-            
-            st.warning(sources_info['methodology']['disclaimer'])
+        # 탭 생성 (lazy=True이면 선택된 탭만 실행)
+        render_sections({
+            "프로젝트 현황": lambda: show_projects_section(projects_df),
+            "매출액 분석": lambda: show_revenue_section(revenue_df),
+            "지역별 분포": lambda: show_map_section(projects_df),
+            "SWOT 분석": show_swot_section,
+            "데이터 출처": show_sources_section,
+        }, key='construction_section', lazy=lazy)
     
     except Exception as e:
         st.error(f'데이터를 불러오는 중 오류가 발생했습니다: {str(e)}')
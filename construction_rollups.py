@@ -0,0 +1,142 @@
+import hashlib
+import threading
+
+import pandas as pd
+
+from data_store import load_dataset, dataset_version
+
+PROJECTS_FILE = 'construction_projects.csv'
+ROLLUP_KEYS = ['Country', 'Year', 'Status', 'Company']
+FILTER_KEYS = ['Country', 'Status', 'Company', 'Year']
+ROLLUP_VALUES = ['Investment_Amount', 'Project_Count']
+
+
+def _rollup(projects_df):
+    """
+    Country x Year x Status x Company 단위로 투자금액 합계와 프로젝트 수를 집계하는 함수
+
+    키 값이 없는 프로젝트도 원본 데이터 합계와 같도록 별도 그룹(NaN)으로 집계합니다.
+    """
+    return (
+        projects_df.groupby(ROLLUP_KEYS, observed=True, sort=False, dropna=False)
+        .agg(Investment_Amount=('Investment_Amount', 'sum'), Project_Count=('Investment_Amount', 'size'))
+    )
+
+
+def _merge_rollups(table, added):
+    """두 집계 테이블을 같은 키끼리 더하는 함수 (키 값이 없는 그룹도 유지)"""
+    combined = pd.concat([table, added])
+    return combined.groupby(level=ROLLUP_KEYS, observed=True, sort=False, dropna=False).sum()
+
+
+def _file_digests(path, split=None):
+    """
+    파일을 한 번 읽어 (앞부분 split 바이트의 해시, 전체 해시, 줄바꿈으로 끝나는지)를 반환하는 함수
+
+    split이 None이면 앞부분 해시는 None입니다.
+    """
+    digest = hashlib.sha1()
+    prefix = None
+    read = 0
+    last = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            if split is not None and prefix is None and read + len(chunk) >= split:
+                digest.update(chunk[:split - read])
+                prefix = digest.hexdigest()
+                digest.update(chunk[split - read:])
+            else:
+                digest.update(chunk)
+            read += len(chunk)
+            last = chunk[-1:]
+    return prefix, digest.hexdigest(), last == b'\n'
+
+
+class ConstructionRollup:
+    """
+    건설 프로젝트 집계를 미리 만들어 두고 필터 조합별 결과를 집계 테이블에서 찾는 클래스
+
+    (집계 기준, 필터 컬럼) 조합마다 한 번 만든 테이블에서 인덱스로 조회하며,
+    행이 추가되면 추가된 행만 집계해 기존 결과에 더한 새 집계를 만듭니다 (기존 집계는 바뀌지 않음).
+    """
+
+    def __init__(self, table, row_count):
+        self.table = table
+        self.row_count = row_count
+        self._views = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, projects_df):
+        """원본 데이터로 집계를 만드는 함수"""
+        return cls(_rollup(projects_df), len(projects_df))
+
+    def append(self, new_rows):
+        """추가된 프로젝트 행을 반영한 새 집계를 반환하는 함수"""
+        if new_rows.empty:
+            return self
+        return ConstructionRollup(_merge_rollups(self.table, _rollup(new_rows)), self.row_count + len(new_rows))
+
+    def _view(self, by, filters):
+        """필터 컬럼 + by 컬럼 기준 합계 테이블을 반환하는 함수 (조합별로 한 번만 계산)"""
+        key = (tuple(by), tuple(filters))
+        with self._lock:
+            view = self._views.get(key)
+        if view is None:
+            levels = list(by) + [col for col in filters if col not in by]
+            view = self.table.groupby(level=levels, observed=True, dropna=False)[ROLLUP_VALUES].sum()
+            # by 컬럼 값이 없는 그룹은 원본 데이터 groupby(by)와 같이 제외
+            keep = pd.DataFrame({col: view.index.get_level_values(col) for col in by}).notna().all(axis=1)
+            view = view[keep.to_numpy()]
+            with self._lock:
+                self._views[key] = view
+        return view
+
+    def query(self, by, country=None, status=None, company=None, year=None):
+        """필터를 적용한 뒤 by 컬럼 기준으로 합계를 반환하는 함수 ('전체' 또는 None은 필터 없음)"""
+        values = dict(zip(FILTER_KEYS, (country, status, company, year)))
+        filters = [col for col in FILTER_KEYS if values[col] is not None and values[col] != '전체']
+        view = self._view(by, filters)
+        if filters:
+            try:
+                view = view.xs(tuple(values[col] for col in filters), level=filters, drop_level=False)
+            except KeyError:
+                return pd.DataFrame(columns=list(by) + ROLLUP_VALUES)
+        return view.reset_index()[list(by) + ROLLUP_VALUES]
+
+
+_rollup_lock = threading.Lock()
+# 현재 집계와 만든 시점의 원본 파일 정보 (크기, 내용 해시)
+_rollup_state = {'version': None, 'rollup': None, 'size': None, 'digest': None}
+
+
+def get_construction_rollup():
+    """데이터 버전별 건설 프로젝트 집계를 반환하는 함수 (행 추가 시 증분 갱신)"""
+    version = dataset_version(PROJECTS_FILE)
+    with _rollup_lock:
+        if _rollup_state['version'] == version:
+            return _rollup_state['rollup']
+
+        path, _, size = version
+        rollup = _rollup_state['rollup']
+        prefix, digest = None, None
+        if path.endswith('.csv'):
+            # 이전 파일 내용이 새 파일의 앞부분과 같으면 행이 추가된 것
+            old_size = _rollup_state['size'] if rollup is not None and _rollup_state['size'] <= size else None
+            prefix, digest, ends_with_newline = _file_digests(path, old_size)
+            if not ends_with_newline:
+                digest = None
+
+        projects_df = load_dataset(PROJECTS_FILE)
+        appended = (prefix is not None and prefix == _rollup_state['digest']
+                    and len(projects_df) >= rollup.row_count)
+        if appended:
+            rollup = rollup.append(projects_df.iloc[rollup.row_count:])
+        else:
+            rollup = ConstructionRollup.from_frame(projects_df)
+
+        _rollup_state.update(version=version, rollup=rollup, size=size, digest=digest)
+        return rollup
@@ -0,0 +1,108 @@
+import threading
+
+import numpy as np
+
+from data_store import dataset_version
+from material_store import (
+    MATERIALS_FILE,
+    INDICATORS_FILE,
+    get_material_store,
+    get_indicator_store,
+    pct_change
+)
+
+# 상관계수 계산 기준 (가격 수준 / 전분기 대비 변화율)
+TRANSFORMS = {'level': '가격 수준', 'change': '전분기 대비 변화율'}
+
+
+def _standardize(values):
+    """시계열별로 평균 0, 표준편차 1이 되도록 정규화하는 함수 (변동이 없는 시계열은 NaN)"""
+    centered = values - values.mean(axis=-1, keepdims=True)
+    scale = np.sqrt((centered ** 2).mean(axis=-1, keepdims=True))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(scale > 0, centered / scale, np.nan)
+
+
+def lagged_correlation(materials, indicators, max_lag):
+    """
+    원자재 x 시장 지표 x 시차 상관계수 행렬을 한 번에 계산하는 함수
+
+    materials: (원자재 수, 기간) 배열, indicators: (지표 수, 기간) 배열
+    시차 k는 k 기간 전의 지표 값과 현재 원자재 값의 상관계수입니다 (지표가 선행).
+    모든 시차가 같은 길이(기간 - max_lag)의 구간을 사용하며, 결과 형태는 (원자재 수, 지표 수, max_lag + 1)입니다.
+    """
+    n_periods = materials.shape[1]
+    window = n_periods - max_lag
+    if window < 2:
+        raise ValueError(f'시차 {max_lag}를 계산하기에 기간이 부족합니다 ({n_periods}개 기간)')
+
+    # (시차, 지표, 구간) 형태로 지연된 지표 구간을 한 번에 생성
+    starts = max_lag - np.arange(max_lag + 1)
+    lagged = indicators[:, starts[:, None] + np.arange(window)].transpose(1, 0, 2)
+
+    z_materials = _standardize(materials[:, max_lag:])
+    z_indicators = _standardize(lagged)
+    return np.einsum('mt,lit->mil', z_materials, z_indicators) / window
+
+
+class CorrelationResult:
+    """상관계수 행렬과 축 이름(원자재, 지표, 시차)을 함께 보관하는 클래스"""
+
+    def __init__(self, materials, indicators, lags, matrix):
+        self.materials = materials
+        self.indicators = indicators
+        self.lags = lags
+        self.matrix = matrix
+
+    def at_lag(self, lag):
+        """특정 시차의 (원자재 x 지표) 상관계수 행렬을 반환하는 함수"""
+        return self.matrix[:, :, list(self.lags).index(lag)]
+
+    def strongest(self):
+        """원자재-지표 쌍별로 절대값이 가장 큰 상관계수와 그 시차를 반환하는 함수"""
+        filled = np.nan_to_num(np.abs(self.matrix), nan=-1.0)
+        best = filled.argmax(axis=2)
+        values = np.take_along_axis(self.matrix, best[:, :, None], axis=2)[:, :, 0]
+        return np.asarray(self.lags)[best], values
+
+
+_result_lock = threading.Lock()
+_results = {}
+
+
+def get_correlations(transform='change', max_lag=2):
+    """원자재 x 시장 지표 x 시차 상관계수를 반환하는 함수 (데이터 버전별로 캐시)"""
+    if transform not in TRANSFORMS:
+        raise ValueError(f'지원하지 않는 기준입니다: {transform}')
+
+    version = (dataset_version(MATERIALS_FILE), dataset_version(INDICATORS_FILE))
+    key = (version, transform, max_lag)
+    with _result_lock:
+        cached = _results.get(key)
+    if cached is not None:
+        return cached
+
+    material_store = get_material_store()
+    indicator_store = get_indicator_store()
+    # 두 데이터셋에 모두 있는 분기만 사용
+    periods = material_store.periods.intersection(indicator_store.periods).sort_values()
+    materials = material_store.values[:, material_store.periods.get_indexer(periods)]
+    indicators = indicator_store.values[:, indicator_store.periods.get_indexer(periods)]
+    if transform == 'change':
+        # 첫 분기는 변화율이 없으므로 제외
+        materials = pct_change(materials, 1)[:, 1:]
+        indicators = pct_change(indicators, 1)[:, 1:]
+
+    result = CorrelationResult(
+        material_store.names,
+        indicator_store.names,
+        list(range(max_lag + 1)),
+        lagged_correlation(materials, indicators, max_lag)
+    )
+
+    with _result_lock:
+        # 이전 데이터 버전의 결과는 버림
+        for stale in [k for k in _results if k[0] != version]:
+            del _results[stale]
+        _results[key] = result
+    return result
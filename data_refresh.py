@@ -0,0 +1,225 @@
+import os
+import json
+import glob
+import time
+import uuid
+import shutil
+import logging
+import threading
+
+import pandas as pd
+
+from data_store import (
+    DATA_DIR,
+    CURRENT_POINTER_NAME,
+    DATASET_SCHEMAS,
+    current_snapshot,
+    snapshots_dir,
+    ingest_all
+)
+from dataset_cache import dataset_cache
+from static_build import build_static
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷에 포함할 데이터 파일 형식
+SNAPSHOT_PATTERNS = ('*.csv', '*.json', '*.jsonl')
+
+# 보관할 스냅샷 수 (이전 스냅샷에 고정된 리런이 끝날 때까지 남겨 둠, 환경변수로 변경 가능)
+KEEP_SNAPSHOTS = int(os.environ.get('SNAPSHOT_KEEP', '3'))
+
+# 첫 스냅샷 생성에 실패했을 때 다시 시도하기까지 기다릴 시간 (초, 환경변수로 변경 가능)
+FIRST_SNAPSHOT_RETRY = int(os.environ.get('FIRST_SNAPSHOT_RETRY', '30'))
+
+
+def copy_data_files(source_dir, target_dir):
+    """데이터 파일(CSV/JSON)을 대상 디렉토리로 복사하고 파일 이름 목록을 반환하는 함수"""
+    copied = []
+    for pattern in SNAPSHOT_PATTERNS:
+        for path in glob.glob(os.path.join(source_dir, pattern)):
+            shutil.copy2(path, target_dir)
+            copied.append(os.path.basename(path))
+    return sorted(copied)
+
+
+def validate_snapshot(directory, required_files=()):
+    """
+    스냅샷 디렉토리의 데이터 파일을 검사하는 함수
+
+    필수 파일 존재 여부, CSV의 스키마 컬럼과 행 수, JSON 파싱을 확인하고
+    문제 목록을 반환합니다 (비어 있으면 정상).
+    """
+    problems = [f"{name}: 파일이 없습니다" for name in required_files
+                if not os.path.exists(os.path.join(directory, name))]
+
+    csv_paths = sorted(glob.glob(os.path.join(directory, '*.csv')))
+    if not csv_paths:
+        problems.append("CSV 데이터 파일이 없습니다")
+
+    for path in csv_paths:
+        name = os.path.basename(path)
+        try:
+            df = pd.read_csv(path)
+        except Exception as e:
+            problems.append(f"{name}: 읽을 수 없습니다 ({str(e)})")
+            continue
+        if df.empty:
+            problems.append(f"{name}: 데이터가 없습니다")
+        missing = [col for col in DATASET_SCHEMAS.get(name, {}) if col not in df.columns]
+        if missing:
+            problems.append(f"{name}: 컬럼이 없습니다 ({', '.join(missing)})")
+
+    for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                json.load(f)
+        except Exception as e:
+            problems.append(f"{os.path.basename(path)}: JSON 형식 오류 ({str(e)})")
+    return problems
+
+
+def publish_snapshot(staging_dir, root=None):
+    """
+    검증된 스테이징 디렉토리를 새 스냅샷으로 등록하고 현재 포인터를 교체하는 함수
+
+    디렉토리 이동과 포인터 교체 모두 os.replace/os.rename이므로 다른 세션은
+    이전 스냅샷 또는 새 스냅샷 중 하나만 보게 됩니다.
+    """
+    root = root or DATA_DIR
+    name = time.strftime('%Y%m%d-%H%M%S') + '-' + uuid.uuid4().hex[:6]
+    os.rename(staging_dir, os.path.join(snapshots_dir(root), name))
+
+    pointer = os.path.join(root, CURRENT_POINTER_NAME)
+    tmp_pointer = pointer + '.tmp'
+    with open(tmp_pointer, 'w', encoding='utf-8') as f:
+        f.write(name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_pointer, pointer)
+    return name
+
+
+def prune_snapshots(root=None, keep=KEEP_SNAPSHOTS):
+    """최근 keep개와 현재 스냅샷을 제외한 오래된 스냅샷을 삭제하는 함수"""
+    current, _ = current_snapshot(root)
+    directory = snapshots_dir(root)
+    names = sorted(name for name in os.listdir(directory)
+                   if not name.startswith('.') and os.path.isdir(os.path.join(directory, name)))
+    removed = []
+    for name in names[:-keep] if keep > 0 else names:
+        if name != current:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+            removed.append(name)
+    return removed
+
+
+def build_snapshot(builder=None, root=None):
+    """
+    새 데이터 스냅샷을 만들어 교체하고 스냅샷 이름을 반환하는 함수
+
+    1. builder()로 작업 디렉토리(DATA_DIR)의 데이터를 갱신
+    2. 현재 스냅샷 -> 작업 디렉토리 순서로 데이터 파일을 스테이징 디렉토리에 복사
+    3. Arrow 사본 생성 후 검증, 통과하면 정적 HTML 조각을 빌드하고 현재 포인터를 교체
+    검증에 실패하면 스테이징 디렉토리를 지우고 ValueError를 발생시킵니다.
+    """
+    root = root or DATA_DIR
+    if builder is not None:
+        builder()
+
+    os.makedirs(snapshots_dir(root), exist_ok=True)
+    staging_dir = os.path.join(snapshots_dir(root), '.staging-' + uuid.uuid4().hex)
+    os.makedirs(staging_dir)
+    try:
+        current, current_dir = current_snapshot(root)
+        required = []
+        if current is not None:
+            # 작업 디렉토리에 없는 파일은 이전 스냅샷 것을 그대로 사용
+            required = copy_data_files(current_dir, staging_dir)
+        copy_data_files(root, staging_dir)
+        ingest_all(staging_dir)
+
+        problems = validate_snapshot(staging_dir, required)
+        if problems:
+            raise ValueError('; '.join(problems))
+        build_static(staging_dir)
+        name = publish_snapshot(staging_dir, root)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    prune_snapshots(root)
+    return name
+
+
+class RefreshWorker:
+    """
+    데이터 갱신을 백그라운드 스레드에서 수행하는 작업기
+
+    한 번에 하나의 갱신만 실행하며, 진행 중에 요청하면 새 갱신을 시작하지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self.state = 'idle'
+        self.last_snapshot = None
+        self.last_error = None
+        self.finished_at = None
+
+    def request(self, builder=None):
+        """갱신을 시작하고 시작 여부를 반환하는 함수 (이미 진행 중이면 False)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self.state = 'running'
+            self._thread = threading.Thread(target=self._run, args=(builder,), name='data-refresh', daemon=True)
+            self._thread.start()
+            return True
+
+    def request_first_snapshot(self, builder=None, retry_after=FIRST_SNAPSHOT_RETRY):
+        """
+        스냅샷이 아직 없으면 첫 스냅샷 생성을 시작하고 시작 여부를 반환하는 함수
+
+        첫 생성이 실패한 경우 스냅샷이 생길 때까지 retry_after초마다 다시 시도합니다.
+        """
+        if current_snapshot()[0] is not None:
+            return False
+        with self._lock:
+            state, finished_at = self.state, self.finished_at
+        if state == 'running':
+            return False
+        if state == 'failed' and finished_at is not None and time.time() - finished_at < retry_after:
+            return False
+        return self.request(builder)
+
+    def _run(self, builder):
+        try:
+            name = build_snapshot(builder)
+            # 새 스냅샷은 경로가 다르므로 이전 스냅샷의 캐시 항목은 더 이상 사용되지 않음
+            dataset_cache.clear()
+            with self._lock:
+                self.state = 'idle'
+                self.last_snapshot = name
+                self.last_error = None
+        except Exception as e:
+            logger.exception("데이터 갱신 중 오류가 발생했습니다")
+            with self._lock:
+                self.state = 'failed'
+                self.last_error = str(e)
+        finally:
+            with self._lock:
+                self.finished_at = time.time()
+
+    def status(self):
+        """현재 상태를 딕셔너리로 반환하는 함수"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'last_snapshot': self.last_snapshot,
+                'last_error': self.last_error,
+                'finished_at': self.finished_at,
+            }
+
+
+# 프로세스 전체에서 공유하는 갱신 작업기
+refresh_worker = RefreshWorker()
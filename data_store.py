@@ -0,0 +1,274 @@
+import os
+import glob
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dataset_cache import dataset_cache, file_signature, frame_nbytes
+from perf import stage
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow가 없으면 CSV만 사용
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# 데이터 디렉토리 (app.py와 동일한 위치, 환경변수로 변경 가능)
+DATA_DIR = os.environ.get(
+    'DASHBOARD_DATA_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+)
+
+# 컬럼형(Arrow IPC) 사본 저장 디렉토리
+COLUMNAR_DIR_NAME = '.columnar'
+
+# 스냅샷 디렉토리와 현재 스냅샷 포인터 파일 (데이터 디렉토리 아래)
+SNAPSHOTS_DIR_NAME = 'snapshots'
+CURRENT_POINTER_NAME = 'CURRENT'
+
+# 데이터셋별 컬럼 타입 (반복되는 문자열은 category, 숫자는 값 범위에 맞는 작은 타입)
+DATASET_SCHEMAS = {
+    'semiconductor_sales.csv': {
+        'Year': 'int16', 'Company': 'category', 'Model': 'category',
+        'Sales_Volume': 'int32', 'Market_Share': 'float32',
+    },
+    'semiconductor_production.csv': {
+        'Year': 'int16', 'Month': 'int8', 'Company': 'category', 'Model': 'category',
+        'Production_Volume': 'int32', 'Efficiency': 'float32',
+    },
+    'construction_projects.csv': {
+        'Year': 'int16', 'Country': 'category', 'Company': 'category', 'City': 'category',
+        'Investment_Amount': 'int32', 'Status': 'category', 'Source': 'category',
+    },
+    'construction_revenue.csv': {
+        'Year': 'int16', 'Country': 'category', 'Company': 'category',
+        'Revenue': 'int32', 'Source': 'category',
+    },
+    'construction_orders.csv': {
+        'Year': 'int16', 'Quarter': 'int8', 'Company': 'category', 'Order_Amount': 'int32',
+    },
+    'construction_sites.csv': {
+        'Year': 'int16', 'Company': 'category', 'Region': 'category',
+        'Site_Count': 'int16', 'Worker_Count': 'int32',
+    },
+    'construction_locations.csv': {
+        'company': 'category', 'clean_room_area': 'int32', 'equipment_cost': 'float32',
+        'total_cost': 'float32', 'construction_company': 'category', 'status': 'category',
+    },
+    'market_data.csv': {'Year': 'int16', 'Company': 'category', 'Market_Share': 'float32'},
+    'supply_chain_nodes.csv': {'type': 'category'},
+    'supply_chain_edges.csv': {'source': 'category', 'target': 'category'},
+}
+
+# 데이터셋별 타입 적용 전후 메모리 사용량 {파일 이름: (적용 전 바이트, 적용 후 바이트)}
+MEMORY_REPORT = {}
+_report_lock = threading.Lock()
+
+# 리런은 세션별 스크립트 스레드에서 실행되므로 고정한 스냅샷을 스레드별로 보관
+_pinned = threading.local()
+
+
+def snapshots_dir(root=None):
+    """스냅샷들이 저장되는 디렉토리 경로를 반환하는 함수"""
+    return os.path.join(root or DATA_DIR, SNAPSHOTS_DIR_NAME)
+
+
+def current_snapshot(root=None):
+    """
+    현재 스냅샷의 (이름, 디렉토리)를 반환하는 함수
+
+    스냅샷이 아직 없으면 (None, 데이터 디렉토리)를 반환합니다.
+    """
+    root = root or DATA_DIR
+    try:
+        with open(os.path.join(root, CURRENT_POINTER_NAME), 'r', encoding='utf-8') as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None, root
+
+    directory = os.path.join(snapshots_dir(root), name)
+    if not name or not os.path.isdir(directory):
+        return None, root
+    return name, directory
+
+
+def pin_snapshot():
+    """
+    현재 스냅샷을 이 스레드(리런)에 고정하고 스냅샷 이름을 반환하는 함수
+
+    리런 도중 새 스냅샷으로 교체되어도 고정된 스냅샷에서 계속 읽습니다.
+    """
+    _pinned.snapshot = current_snapshot()
+    return _pinned.snapshot[0]
+
+
+def unpin_snapshot():
+    """이 스레드에 고정된 스냅샷을 해제하는 함수"""
+    _pinned.snapshot = None
+
+
+def active_data_dir():
+    """고정된 스냅샷이 있으면 그 디렉토리를, 없으면 현재 스냅샷 디렉토리를 반환하는 함수"""
+    pinned = getattr(_pinned, 'snapshot', None)
+    return pinned[1] if pinned else current_snapshot()[1]
+
+
+def data_path(filename):
+    """데이터 디렉토리(현재 스냅샷) 안의 파일 경로를 반환하는 함수"""
+    return os.path.join(active_data_dir(), filename)
+
+
+def columnar_path(csv_path):
+    """CSV 파일에 대응하는 Arrow 사본 경로를 반환하는 함수"""
+    directory, filename = os.path.split(csv_path)
+    name, _ = os.path.splitext(filename)
+    return os.path.join(directory, COLUMNAR_DIR_NAME, name + '.arrow')
+
+
+def is_columnar_fresh(csv_path):
+    """Arrow 사본이 원본 CSV보다 최신인지 확인하는 함수"""
+    arrow_path = columnar_path(csv_path)
+    if pa is None or not os.path.exists(arrow_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.stat(arrow_path).st_mtime_ns >= os.stat(csv_path).st_mtime_ns
+
+
+def convert_to_columnar(csv_path):
+    """
+    CSV 파일을 메모리 맵 가능한 Arrow IPC 파일로 변환하는 함수
+
+    압축하지 않고 저장해야 로드 시 복사 없이 메모리 맵으로 읽을 수 있습니다.
+    임시 파일에 먼저 쓴 뒤 교체하므로 다른 세션이 쓰다 만 파일을 읽지 않습니다.
+    """
+    if pa is None:
+        return None
+
+    arrow_path = columnar_path(csv_path)
+    os.makedirs(os.path.dirname(arrow_path), exist_ok=True)
+
+    table = pa_csv.read_csv(csv_path)
+    tmp_path = arrow_path + '.tmp'
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, arrow_path)
+    return arrow_path
+
+
+def ingest_all(data_dir=None):
+    """데이터 디렉토리의 모든 CSV를 Arrow 사본으로 변환하는 함수"""
+    data_dir = data_dir or DATA_DIR
+    converted = []
+    if pa is None:
+        return converted
+
+    for csv_path in sorted(glob.glob(os.path.join(data_dir, '*.csv'))):
+        if is_columnar_fresh(csv_path):
+            continue
+        try:
+            converted.append(convert_to_columnar(csv_path))
+        except Exception:
+            logger.exception("Arrow 변환 중 오류가 발생했습니다 (%s)", csv_path)
+    return converted
+
+
+def read_columnar(arrow_path):
+    """Arrow 사본을 메모리 맵으로 읽어 데이터프레임으로 반환하는 함수"""
+    table = feather.read_table(arrow_path, memory_map=True)
+    return table.to_pandas()
+
+
+def read_dataset(csv_path):
+    """최신 Arrow 사본이 있으면 메모리 맵으로 읽고, 없거나 오래된 경우 CSV를 읽는 함수"""
+    if is_columnar_fresh(csv_path):
+        try:
+            return read_columnar(columnar_path(csv_path))
+        except Exception:
+            # 손상된 사본은 무시하고 CSV로 대체
+            pass
+
+    return pd.read_csv(csv_path)
+
+
+def _fits(series, dtype):
+    """정수 컬럼의 값이 모두 dtype 범위 안에 있는지 확인하는 함수"""
+    info = np.iinfo(dtype)
+    return series.empty or (series.min() >= info.min and series.max() <= info.max)
+
+
+def compact_frame(df, schema):
+    """
+    스키마에 맞춰 컬럼 타입을 축소하는 함수
+
+    값이 손실되는 변환(실수 -> 정수, 범위 초과, 결측값이 있는 정수 컬럼)은 건너뜁니다.
+    """
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        series = df[col]
+        if dtype == 'category':
+            if pd.api.types.is_string_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+                df[col] = series.astype('category')
+        elif np.dtype(dtype).kind == 'i':
+            if series.dtype.kind in 'iu' and _fits(series, dtype):
+                df[col] = series.astype(dtype)
+        elif series.dtype.kind == 'f':
+            df[col] = series.astype(dtype)
+    return df
+
+
+def load_compact(csv_path, filename):
+    """데이터셋을 읽어 스키마를 적용하고 적용 전후 메모리 사용량을 기록하는 함수"""
+    df = read_dataset(csv_path)
+    before = frame_nbytes(df)
+    df = compact_frame(df, DATASET_SCHEMAS.get(filename, {}))
+    with _report_lock:
+        MEMORY_REPORT[filename] = (before, frame_nbytes(df))
+    return df
+
+
+def memory_report():
+    """데이터셋별 타입 적용 전후 메모리 사용량을 반환하는 함수"""
+    with _report_lock:
+        items = sorted(MEMORY_REPORT.items())
+    return [
+        {
+            '데이터셋': filename,
+            '적용 전(KB)': round(before / 1024, 1),
+            '적용 후(KB)': round(after / 1024, 1),
+            '절감률(%)': round((1 - after / before) * 100, 1) if before else 0.0,
+        }
+        for filename, (before, after) in items
+    ]
+
+
+def load_dataset(filename, data_dir=None):
+    """
+    데이터셋을 로드하는 함수
+
+    DATASET_SCHEMAS의 컬럼 타입을 적용한 결과를 프로세스 공유 캐시에 보관하며,
+    파일이 바뀌기 전까지 모든 세션이 같은 읽기 전용 데이터프레임을 사용합니다.
+    """
+    csv_path = os.path.join(data_dir or active_data_dir(), filename)
+    with stage(f'load:{filename}'):
+        return dataset_cache.get(source_path(csv_path), lambda: load_compact(csv_path, filename))
+
+
+def source_path(csv_path):
+    """캐시 키로 사용할 원본 파일 경로를 반환하는 함수 (CSV가 없으면 Arrow 사본)"""
+    return csv_path if os.path.exists(csv_path) else columnar_path(csv_path)
+
+
+def dataset_version(filename, data_dir=None):
+    """데이터셋의 버전 (경로, 수정 시각, 크기)을 반환하는 함수"""
+    return file_signature(source_path(os.path.join(data_dir or active_data_dir(), filename)))
+
+
+if __name__ == "__main__":
+    for path in ingest_all():
+        print(f"변환 완료: {path}")
@@ -0,0 +1,136 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# 캐시 메모리 한도 (MB, 환경변수로 변경 가능)
+DEFAULT_BUDGET_MB = int(os.environ.get('DATASET_CACHE_MB', '512'))
+
+
+def file_signature(path):
+    """파일 경로, 수정 시각, 크기로 캐시 키를 만드는 함수"""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def frame_nbytes(df):
+    """데이터프레임의 실제 메모리 사용량(바이트)을 계산하는 함수"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def shallow_copy_isolates():
+    """얕은 복사본에 값을 쓰거나 컬럼을 바꿔도 원본이 바뀌지 않는지 확인하는 함수"""
+    original = pd.DataFrame({'value': [1.0, 2.0], 'name': ['a', 'b']})
+    handed_out = original.copy(deep=False)
+    handed_out.loc[0, 'value'] = 99.0
+    handed_out.iloc[1, 1] = 'z'
+    handed_out['value'] *= 2
+    return original['value'].tolist() == [1.0, 2.0] and original['name'].tolist() == ['a', 'b']
+
+
+_shallow_handout = None
+_shallow_handout_lock = threading.Lock()
+
+
+def shallow_handout():
+    """
+    얕은 복사본을 나눠 줘도 되는지 반환하는 함수 (첫 호출 때 한 번 확인)
+
+    이 모듈은 pandas 옵션을 바꾸지 않습니다. copy-on-write는 app.py 시작 시 켜며,
+    켜져 있지 않은 환경에서는 깊은 복사본을 나눠 줍니다.
+    """
+    global _shallow_handout
+    with _shallow_handout_lock:
+        if _shallow_handout is None:
+            _shallow_handout = shallow_copy_isolates()
+            if not _shallow_handout:
+                logger.warning("copy-on-write가 꺼져 있어 캐시된 데이터프레임을 깊은 복사본으로 제공합니다")
+    return _shallow_handout
+
+
+def hand_out(df):
+    """
+    캐시에 보관 중인 데이터프레임을 세션에 나눠 줄 복사본을 만드는 함수
+
+    copy-on-write가 동작하면 데이터를 공유하는 얕은 복사본을, 아니면 깊은 복사본을 반환합니다.
+    어느 쪽이든 반환된 데이터프레임에 쓴 값은 캐시(다른 세션)에 반영되지 않습니다.
+    """
+    return df.copy(deep=not shallow_handout())
+
+
+class DatasetCache:
+    """
+    프로세스 전체에서 공유하는 데이터셋 캐시
+
+    키는 (경로, 수정 시각, 크기)이므로 파일이 바뀌면 자동으로 새로 로드됩니다.
+    메모리 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, budget_mb=DEFAULT_BUDGET_MB):
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, loader):
+        """캐시된 데이터프레임을 반환하고, 없으면 loader()로 로드하는 함수"""
+        key = file_signature(path)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return hand_out(self._entries[key])
+
+        # 파싱은 잠금 밖에서 수행 (다른 데이터셋 조회를 막지 않도록)
+        df = loader()
+
+        with self._lock:
+            self.misses += 1
+            self._discard_stale(key[0])
+            self._entries[key] = df
+            self._sizes[key] = frame_nbytes(df)
+            self.total_bytes += self._sizes[key]
+            self._evict()
+        return hand_out(df)
+
+    def _discard_stale(self, abs_path):
+        """같은 경로의 이전 버전 항목을 제거하는 함수"""
+        for key in [k for k in self._entries if k[0] == abs_path]:
+            self._remove(key)
+
+    def _remove(self, key):
+        del self._entries[key]
+        self.total_bytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        # 방금 추가한 항목 하나는 한도를 넘어도 유지
+        while self.total_bytes > self.budget_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        """캐시를 모두 비우는 함수"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+
+# 모든 세션이 공유하는 캐시 인스턴스
+dataset_cache = DatasetCache()
+
+registry.callback('dashboard_dataset_loads_total', '디스크에서 데이터셋을 읽은 횟수', 'counter',
+                  lambda: dataset_cache.misses)
+registry.callback('dashboard_dataset_cache_hits_total', '데이터셋 캐시 적중 횟수', 'counter',
+                  lambda: dataset_cache.hits)
+registry.callback('dashboard_dataframe_resident_bytes', '캐시에 보관 중인 데이터프레임 메모리(바이트)', 'gauge',
+                  lambda: dataset_cache.total_bytes)
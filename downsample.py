@@ -0,0 +1,136 @@
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+# 트레이스당 포인트 수가 이 값을 넘으면 WebGL(Scattergl) + 다운샘플링 사용
+DENSE_TRACE_THRESHOLD = int(os.environ.get('DENSE_TRACE_THRESHOLD', '5000'))
+# 다운샘플링 후 트레이스당 최대 포인트 수
+DOWNSAMPLE_POINTS = int(os.environ.get('DOWNSAMPLE_POINTS', '2000'))
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링
+
+    x는 정렬된 숫자 배열이어야 하며, 선택된 포인트의 인덱스 배열을 반환합니다.
+    첫 번째와 마지막 포인트는 항상 포함됩니다.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # 첫/마지막 포인트를 제외한 구간을 n_out - 2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷의 평균점 (마지막 버킷은 마지막 포인트)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # 이전 선택점, 후보점, 다음 버킷 평균점이 이루는 삼각형 넓이가 최대인 후보 선택
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def _numeric_x(x):
+    """날짜형 x축을 다운샘플링 계산용 숫자 배열로 변환하는 함수"""
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64)
+    return x
+
+
+def dense_trace(x, y, name, x_range=None, threshold=None, max_points=None, **scatter_kwargs):
+    """
+    포인트 수에 따라 Scatter 또는 다운샘플링된 Scattergl 트레이스를 반환하는 함수
+
+    x_range가 주어지면 해당 구간만 잘라 다시 샘플링합니다 (확대 시 세부 모양 복원).
+    """
+    threshold = threshold or DENSE_TRACE_THRESHOLD
+    max_points = max_points or DOWNSAMPLE_POINTS
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    order = np.argsort(x, kind='stable')
+    x, y = x[order], y[order]
+
+    if x_range is not None:
+        bounds = np.asarray(x_range, dtype=x.dtype)
+        lo, hi = np.searchsorted(x, bounds[0], 'left'), np.searchsorted(x, bounds[1], 'right')
+        x, y = x[lo:hi], y[lo:hi]
+
+    if len(x) <= threshold:
+        return go.Scatter(x=x, y=y, name=name, **scatter_kwargs)
+
+    keep = lttb(_numeric_x(x), y, max_points)
+    return go.Scattergl(x=x[keep], y=y[keep], name=name, **scatter_kwargs)
+
+
+def line_figure(df, x, y, color, x_range=None, threshold=None, **px_kwargs):
+    """
+    px.line과 같은 형태의 라인 차트를 생성하는 함수
+
+    그룹별 포인트 수가 임계값 이하이면 px.line을 그대로 사용하고,
+    넘으면 그룹별로 다운샘플링된 Scattergl 트레이스를 사용합니다.
+    """
+    threshold = threshold or DENSE_TRACE_THRESHOLD
+    if df.groupby(color, observed=True).size().max() <= threshold and x_range is None:
+        return px.line(df, x=x, y=y, color=color, **px_kwargs)
+
+    fig = go.Figure()
+    for name, group in df.groupby(color, observed=True, sort=False):
+        fig.add_trace(dense_trace(group[x].to_numpy(), group[y].to_numpy(), str(name),
+                                  x_range=x_range, threshold=threshold, mode='lines'))
+
+    labels = px_kwargs.get('labels', {})
+    fig.update_layout(
+        title=px_kwargs.get('title'),
+        template=px_kwargs.get('template'),
+        xaxis_title=labels.get(x, x),
+        yaxis_title=labels.get(y, y),
+        legend_title_text=labels.get(color, color),
+    )
+    return fig
+
+
+def is_dense(df, color, threshold=None):
+    """그룹별 포인트 수가 다운샘플링 임계값을 넘는지 확인하는 함수"""
+    threshold = threshold or DENSE_TRACE_THRESHOLD
+    return len(df) > 0 and df.groupby(color, observed=True).size().max() > threshold
+
+
+def zoom_range_slider(df, x, key, label="확대 구간"):
+    """밀집 차트의 x축 구간 선택 슬라이더를 표시하고 (시작, 끝)을 반환하는 함수"""
+    values = df[x]
+    x_min, x_max = values.min(), values.max()
+    if pd.api.types.is_datetime64_any_dtype(values):
+        x_min, x_max = x_min.to_pydatetime(), x_max.to_pydatetime()
+    elif pd.api.types.is_integer_dtype(values):
+        x_min, x_max = int(x_min), int(x_max)
+    else:
+        x_min, x_max = float(x_min), float(x_max)
+    if x_min == x_max:
+        return None
+    selected = st.slider(label, min_value=x_min, max_value=x_max, value=(x_min, x_max), key=key)
+    return None if selected == (x_min, x_max) else selected
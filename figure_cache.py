@@ -0,0 +1,80 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+from metrics import registry
+from perf import stage
+
+# 캐시할 최대 차트 수 (환경변수로 변경 가능)
+DEFAULT_MAX_FIGURES = int(os.environ.get('FIGURE_CACHE_SIZE', '256'))
+
+
+def theme_key(theme):
+    """Plotly 템플릿(이름 또는 템플릿 객체)을 캐시 키로 변환하는 함수"""
+    if theme is None or isinstance(theme, str):
+        return theme
+    spec = theme.to_plotly_json() if hasattr(theme, 'to_plotly_json') else theme
+    return hashlib.sha1(json.dumps(spec, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class FigureCache:
+    """
+    (데이터 버전, 페이지, 필터 값, 테마) 별로 생성된 차트 스펙을 보관하는 캐시
+
+    모든 세션이 공유하며, 최대 개수를 넘으면 가장 오래 사용하지 않은 차트부터 제거합니다.
+    """
+
+    def __init__(self, max_figures=DEFAULT_MAX_FIGURES):
+        self.max_figures = max_figures
+        self._specs = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, builder):
+        """캐시된 차트를 반환하고, 없으면 builder()로 생성해 저장하는 함수"""
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is not None:
+                self._specs.move_to_end(key)
+                self.hits += 1
+
+        if spec is None:
+            spec = builder().to_plotly_json()
+            with self._lock:
+                self.misses += 1
+                self._specs[key] = spec
+                while len(self._specs) > self.max_figures:
+                    self._specs.popitem(last=False)
+
+        # 세션마다 별도의 Figure 객체를 만들어 공유 스펙이 수정되지 않도록 함
+        return go.Figure(spec)
+
+    def clear(self):
+        """캐시를 모두 비우는 함수"""
+        with self._lock:
+            self._specs.clear()
+
+
+# 모든 세션이 공유하는 차트 캐시
+figure_cache = FigureCache()
+
+registry.callback('dashboard_figure_builds_total', '차트를 새로 생성한 횟수', 'counter',
+                  lambda: figure_cache.misses)
+registry.callback('dashboard_figure_cache_hits_total', '차트 캐시 적중 횟수', 'counter',
+                  lambda: figure_cache.hits)
+
+
+def cached_figure(page, data_version, filters, theme, builder):
+    """
+    차트를 캐시에서 가져오거나 생성하는 함수
+
+    page: 차트 이름, data_version: 데이터셋 버전, filters: 선택된 필터 값 튜플
+    """
+    key = (page, data_version, tuple(filters), theme_key(theme))
+    with stage(f'figure:{page}'):
+        return figure_cache.get_or_build(key, builder)
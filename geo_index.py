@@ -0,0 +1,128 @@
+import math
+import threading
+
+import numpy as np
+
+from map_aggregation import load_sites, sites_version
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.195
+
+# 격자 한 칸의 크기 (도, 약 55km)
+DEFAULT_CELL_DEG = 0.5
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """두 지점(배열 가능) 사이의 대원 거리(km)를 계산하는 함수"""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class GeoIndex:
+    """
+    위경도 격자 버킷 기반 공간 인덱스
+
+    사업장을 격자 칸 번호로 정렬해 두고, 질의 영역에 걸친 칸만 골라
+    후보를 모은 뒤 정확한 거리/범위로 걸러냅니다.
+    """
+
+    def __init__(self, sites, cell_deg=DEFAULT_CELL_DEG):
+        self.sites = sites.reset_index(drop=True)
+        self.cell_deg = cell_deg
+        self.n_lat_cells = int(math.ceil(180 / cell_deg)) + 1
+        self.n_lon_cells = int(math.ceil(360 / cell_deg))
+
+        self.lat = self.sites['lat'].to_numpy(dtype=float)
+        self.lon = self.sites['lon'].to_numpy(dtype=float)
+
+        keys = self._cell_key(self._lat_cell(self.lat), self._lon_cell(self.lon))
+        self._order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[self._order]
+        self._cell_keys, self._cell_start, counts = np.unique(sorted_keys, return_index=True, return_counts=True)
+        self._cell_end = self._cell_start + counts
+
+    def _lat_cell(self, lat):
+        return np.floor((np.asarray(lat) + 90.0) / self.cell_deg).astype(np.int64)
+
+    def _lon_cell(self, lon):
+        return np.floor((np.asarray(lon) + 180.0) / self.cell_deg).astype(np.int64) % self.n_lon_cells
+
+    def _cell_key(self, lat_cell, lon_cell):
+        return lat_cell * self.n_lon_cells + lon_cell
+
+    def _candidates(self, min_lat, max_lat, min_lon, max_lon):
+        """범위에 걸친 격자 칸에 속한 사업장 인덱스를 반환하는 함수 (경도 180도 경계 처리 포함)"""
+        lat_cells = np.arange(self._lat_cell(max(min_lat, -90.0)), self._lat_cell(min(max_lat, 90.0)) + 1)
+        if max_lon - min_lon >= 360:
+            lon_cells = np.arange(self.n_lon_cells)
+        else:
+            start = self._lon_cell(min_lon)
+            span = int(math.floor((max_lon - min_lon) / self.cell_deg)) + 2
+            lon_cells = (start + np.arange(min(span, self.n_lon_cells))) % self.n_lon_cells
+
+        keys = self._cell_key(lat_cells[:, None], lon_cells[None, :]).ravel()
+        pos = np.searchsorted(self._cell_keys, keys)
+        found = pos < len(self._cell_keys)
+        pos, keys = pos[found], keys[found]
+        # 없는 칸의 삽입 위치가 다른 칸을 가리킬 수 있으므로 같은 칸인지 확인 (중복 후보 방지)
+        pos = pos[self._cell_keys[pos] == keys]
+        if len(pos) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([self._order[s:e] for s, e in zip(self._cell_start[pos], self._cell_end[pos])])
+
+    def query_radius(self, lat, lon, radius_km):
+        """기준점에서 radius_km 이내 사업장을 거리순으로 반환하는 함수 (distance_km 컬럼 추가)"""
+        dlat = radius_km / KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(abs(lat) + dlat, 90.0)))
+        dlon = 360.0 if cos_lat < 1e-6 else radius_km / (KM_PER_DEGREE * cos_lat)
+
+        idx = self._candidates(lat - dlat, lat + dlat, lon - dlon, lon + dlon)
+        distance = haversine_km(lat, lon, self.lat[idx], self.lon[idx])
+        within = distance <= radius_km
+        idx, distance = idx[within], distance[within]
+        order = np.argsort(distance, kind='stable')
+
+        result = self.sites.iloc[idx[order]].copy()
+        result['distance_km'] = distance[order]
+        return result
+
+    def query_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        """위경도 범위 안의 사업장을 반환하는 함수 (min_lon > max_lon이면 180도 경계를 넘는 범위)"""
+        span = max_lon - min_lon if max_lon >= min_lon else max_lon + 360 - min_lon
+        idx = self._candidates(min_lat, max_lat, min_lon, min_lon + span)
+
+        lat, lon = self.lat[idx], self.lon[idx]
+        in_lat = (lat >= min_lat) & (lat <= max_lat)
+        if max_lon >= min_lon:
+            in_lon = (lon >= min_lon) & (lon <= max_lon)
+        else:
+            in_lon = (lon >= min_lon) | (lon <= max_lon)
+        return self.sites.iloc[np.sort(idx[in_lat & in_lon])]
+
+
+_index_lock = threading.Lock()
+_index_cache = {}
+
+
+def get_geo_index():
+    """데이터 버전별로 한 번만 생성한 공간 인덱스를 반환하는 함수"""
+    version = sites_version()
+    with _index_lock:
+        index = _index_cache.get(version)
+    if index is None:
+        index = GeoIndex(load_sites())
+        with _index_lock:
+            _index_cache.clear()
+            _index_cache[version] = index
+    return index
+
+
+def sites_within_radius(lat, lon, radius_km):
+    """기준점에서 radius_km 이내의 건설 사업장을 거리순으로 반환하는 함수"""
+    return get_geo_index().query_radius(lat, lon, radius_km)
+
+
+def sites_in_bbox(min_lat, min_lon, max_lat, max_lon):
+    """위경도 범위 안의 건설 사업장을 반환하는 함수"""
+    return get_geo_index().query_bbox(min_lat, min_lon, max_lat, max_lon)
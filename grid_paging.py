@@ -0,0 +1,63 @@
+import math
+
+import streamlit as st
+
+
+def query_page(df, page=1, page_size=10, sort_by=None, ascending=True,
+               filter_column=None, filter_text=''):
+    """
+    서버(pandas)에서 필터링/정렬 후 요청한 페이지만 잘라 반환하는 함수
+
+    반환값: (페이지 데이터프레임, 필터링 후 전체 행 수)
+    """
+    if filter_column and filter_text:
+        mask = df[filter_column].astype(str).str.contains(filter_text, case=False, regex=False, na=False)
+        df = df[mask]
+
+    if sort_by:
+        df = df.sort_values(sort_by, ascending=ascending, kind='stable')
+
+    total_rows = len(df)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size], total_rows
+
+
+def server_side_controls(df, key, page_size=10):
+    """
+    정렬/필터/페이지 선택 위젯을 표시하고 현재 페이지 데이터만 반환하는 함수
+
+    브라우저로는 현재 페이지 행만 전송됩니다.
+    """
+    columns = list(df.columns)
+
+    col1, col2, col3, col4 = st.columns([2, 3, 2, 1])
+    with col1:
+        filter_column = st.selectbox("필터 컬럼", columns, key=f"{key}_filter_col")
+    with col2:
+        filter_text = st.text_input("필터 값", key=f"{key}_filter_text")
+    with col3:
+        sort_by = st.selectbox("정렬 기준", ['(없음)'] + columns, key=f"{key}_sort_by")
+    with col4:
+        ascending = st.radio("정렬", ["오름차순", "내림차순"], key=f"{key}_sort_dir") == "오름차순"
+
+    if sort_by == '(없음)':
+        sort_by = None
+
+    # 현재 페이지를 조회하고, 필터로 행 수가 줄어 범위를 벗어나면 마지막 페이지로 조정
+    page_state_key = f"{key}_page"
+    page = st.session_state.get(page_state_key, 1)
+    page_df, total_rows = query_page(df, page, page_size, sort_by, ascending, filter_column, filter_text)
+
+    page_count = max(1, math.ceil(total_rows / page_size))
+    if page > page_count:
+        page = page_count
+        st.session_state[page_state_key] = page
+        page_df, total_rows = query_page(df, page, page_size, sort_by, ascending, filter_column, filter_text)
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.number_input("페이지", min_value=1, max_value=page_count, step=1, key=page_state_key)
+    with col2:
+        st.caption(f"전체 {total_rows:,}건 중 {page}/{page_count} 페이지")
+
+    return page_df
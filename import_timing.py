@@ -0,0 +1,63 @@
+import sys
+import time
+import importlib
+import threading
+
+# 모듈별 최초 임포트 기록
+# {모듈 이름: {'seconds': 소요 시간, 'loaded': 새로 로드된 최상위 패키지 목록, 'stage': '시작' 또는 '페이지'}}
+IMPORT_TIMES = {}
+_lock = threading.Lock()
+
+
+def _top_level_packages(module_names):
+    return {name.split('.')[0] for name in module_names}
+
+
+def timed_import(module_name, stage='페이지'):
+    """
+    모듈을 처음 사용할 때 임포트하고 소요 시간을 기록하는 함수
+
+    이미 로드된 모듈은 sys.modules에서 바로 반환합니다 (기록하지 않음).
+    stage는 리포트에 표시할 임포트 시점입니다 ('시작': 앱 시작 시, '페이지': 페이지를 처음 열 때).
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    with _lock:
+        before = set(sys.modules)
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        elapsed = time.perf_counter() - start
+        loaded = _top_level_packages(set(sys.modules) - before) - {module_name.split('.')[0]}
+        IMPORT_TIMES[module_name] = {
+            'seconds': elapsed,
+            'loaded': sorted(loaded),
+            'stage': stage,
+        }
+    return module
+
+
+def timed_imports(module_names, stage='시작'):
+    """여러 모듈을 순서대로 임포트하며 각각의 소요 시간을 기록하는 함수"""
+    for module_name in module_names:
+        timed_import(module_name, stage)
+
+
+def load_page(module_name, function_name):
+    """페이지 모듈을 지연 임포트하고 페이지 함수를 반환하는 함수"""
+    return getattr(timed_import(module_name), function_name)
+
+
+def import_report():
+    """모듈별 임포트 소요 시간을 느린 순서로 반환하는 함수"""
+    rows = [
+        {
+            '시점': info['stage'],
+            '모듈': name,
+            '소요 시간(초)': round(info['seconds'], 3),
+            '함께 로드된 패키지': ', '.join(info['loaded']),
+        }
+        for name, info in IMPORT_TIMES.items()
+    ]
+    return sorted(rows, key=lambda row: row['소요 시간(초)'], reverse=True)
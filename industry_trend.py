@@ -1,4 +1,27 @@
+import json
+import streamlit as st
+import plotly.express as px
+from data_store import load_dataset, dataset_version, data_path
+from downsample import line_figure, is_dense, zoom_range_slider
+from figure_cache import cached_figure
+from perf import stage, timed
+from utils.visualization_utils import set_plotly_theme
+
+def load_semiconductor_data(filename):
+    """반도체 산업 데이터(CSV는 공유 데이터셋 캐시, JSON은 파일)를 로드하는 함수"""
+    try:
+        if filename.endswith('.json'):
+            with stage(f'load:{filename}'):
+                with open(data_path(filename), 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        return load_dataset(filename)
+    except Exception as e:
+        st.error(f"데이터 로드 중 오류가 발생했습니다: {str(e)}")
+        return None
+
+@timed()
 def show_industry_trend():
+    """반도체 산업 동향 페이지를 표시하는 함수"""
     st.title("반도체 산업 동향")
     
     try:
@@ -8,6 +31,8 @@ def show_industry_trend():
         
         if market_data is None or supply_chain_data is None:
             return
+        market_version = dataset_version('market_data.csv')
+        theme = set_plotly_theme()
         
         # 시장 점유율 섹션
         st.header("시장 점유율")
@@ -17,22 +42,29 @@ def show_industry_trend():
         selected_year = st.selectbox('연도 선택', years, index=len(years)-1)
         
         # 선택된 연도의 데이터
-        year_data = market_data[market_data['Year'] == selected_year]
+        with stage('filter'):
+            year_data = market_data[market_data['Year'] == selected_year]
         
         # 시장 점유율 파이 차트
-        fig_market_share = px.pie(
-            year_data,
-            values='Market_Share',
-            names='Company',
-            title=f'{selected_year}년 기업별 시장 점유율',
-            template=set_plotly_theme()
-        )
+        def build_market_share_figure():
+            fig = px.pie(
+                year_data,
+                values='Market_Share',
+                names='Company',
+                title=f'{selected_year}년 기업별 시장 점유율',
+                template=theme
+            )
+            
+            # 소수점 첫째 자리까지만 표시하도록 수정
+            fig.update_traces(
+                textinfo='percent+label',
+                texttemplate='%{label}<br>%{percent:.1f}%',
+                hovertemplate='%{label}<br>점유율: %{percent:.1f}%'
+            )
+            return fig
         
-        # 소수점 첫째 자리까지만 표시하도록 수정
-        fig_market_share.update_traces(
-            textinfo='percent+label',
-            texttemplate='%{label}<br>%{percent:.1f}%',
-            hovertemplate='%{label}<br>점유율: %{percent:.1f}%'
+        fig_market_share = cached_figure(
+            'market_share', market_version, (selected_year,), theme, build_market_share_figure
         )
         
         st.plotly_chart(fig_market_share, use_container_width=True)
@@ -63,26 +95,39 @@ def show_industry_trend():
         
         # 연도별 추이 차트
         st.header("연도별 시장 점유율 추이")
-        fig_trend = px.line(
-            market_data,
-            x='Year',
-            y='Market_Share',
-            color='Company',
-            title='기업별 시장 점유율 추이',
-            template=set_plotly_theme()
-        )
         
-        # y축을 퍼센트로 표시하고 소수점 첫째 자리까지 표시
-        fig_trend.update_layout(
-            yaxis=dict(
-                tickformat='.1f',
-                ticksuffix='%'
+        # 데이터가 많으면 구간을 선택해 다시 샘플링 (WebGL + 다운샘플링)
+        trend_range = None
+        if is_dense(market_data, 'Company'):
+            trend_range = zoom_range_slider(market_data, 'Year', key='trend_range')
+        
+        def build_trend_figure():
+            fig = line_figure(
+                market_data,
+                x='Year',
+                y='Market_Share',
+                color='Company',
+                x_range=trend_range,
+                title='기업별 시장 점유율 추이',
+                template=theme
             )
-        )
+            
+            # y축을 퍼센트로 표시하고 소수점 첫째 자리까지 표시
+            fig.update_layout(
+                yaxis=dict(
+                    tickformat='.1f',
+                    ticksuffix='%'
+                )
+            )
+            
+            # 호버 템플릿 수정
+            fig.update_traces(
+                hovertemplate='%{x}년<br>%{y:.1f}%<extra>%{fullData.name}</extra>'
+            )
+            return fig
         
-        # 호버 템플릿 수정
-        fig_trend.update_traces(
-            hovertemplate='%{x}년<br>%{y:.1f}%<extra>%{fullData.name}</extra>'
+        fig_trend = cached_figure(
+            'market_trend', market_version, (trend_range,), theme, build_trend_figure
         )
         
         st.plotly_chart(fig_trend, use_container_width=True)
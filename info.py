@@ -1,18 +1,17 @@
 import streamlit as st
 
-def show_info():
-    # 소개
-    st.markdown("""
+# 소개
+INTRO_HTML = """
     <div class='stBlock'>
         <h2 style='font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem;'>소개</h2>
         <p style='color: #475569; line-height: 1.6;'>
             이 대시보드는 반도체 산업과 반도체 건설 산업에 대한 데이터를 시각화하여 제공합니다.
         </p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # 주요 기능
-    st.markdown("""
+    """
+
+# 주요 기능
+FEATURES_HTML = """
     <div class='stBlock'>
         <h2 style='font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem;'>주요 기능</h2>
 
@@ -34,10 +33,10 @@ def show_info():
             <li>"미국 트럼프 2기" 시나리오 하에 반도체 건설사에 미치는 영향(SWOT 분석)</li>
         </ul>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # 데이터 소스
-    st.markdown("""
+    """
+
+# 데이터 소스
+SOURCES_HTML = """
     <div class='stBlock'>
         <h2 style='font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem;'>데이터 소스</h2>
         <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;'>
@@ -76,10 +75,10 @@ def show_info():
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # 연락처
-    st.markdown("""
+    """
+
+# 연락처
+CONTACT_HTML = """
     <div class='stBlock'>
         <h2 style='font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem;'>연락처</h2>
         <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1rem;'>
@@ -112,7 +111,14 @@ def show_info():
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+# 정적 섹션을 한 번만 이어 붙여 st.markdown 한 번으로 표시
+INFO_HTML = "\n".join([INTRO_HTML, FEATURES_HTML, SOURCES_HTML, CONTACT_HTML])
+
+def show_info():
+    """정보 페이지의 정적 섹션을 하나의 요소로 표시하는 함수"""
+    st.markdown(INFO_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     show_info() 
\ No newline at end of file
@@ -1,10 +1,22 @@
 import streamlit as st
 import os
 import sys
+from perf import timed
 
 # 상위 디렉토리 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 주요 기능 탭의 기능 카드 (리런마다 열 8개 요소를 만들지 않도록 미리 조립)
+FEATURE_CARDS_HTML = (
+    "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(160px, 1fr)); gap: 1rem;'>"
+    "<div><h4>📊 데이터 시각화</h4><p>다양한 차트와 그래프를 통한 직관적인 데이터 시각화</p></div>"
+    "<div><h4>🔍 데이터 필터링</h4><p>연도, 제조사, 모델 등 다양한 기준으로 데이터 필터링</p></div>"
+    "<div><h4>📰 뉴스 분석</h4><p>최신 반도체 관련 뉴스 제공 및 AI 기반 요약</p></div>"
+    "<div><h4>🔄 실시간 업데이트</h4><p>데이터 새로고침을 통한 최신 정보 업데이트</p></div>"
+    "</div>"
+)
+
+@timed()
 def show_information():
     """
     정보 페이지를 표시하는 함수
@@ -61,23 +73,8 @@ def show_information():
         - **SWOT 분석**: 반도체 산업 및 주요 시나리오에 대한 SWOT 분석
         """)
         
-        # 기능 아이콘 표시
-        cols = st.columns(4)
-        with cols[0]:
-            st.markdown("#### 📊 데이터 시각화")
-            st.markdown("다양한 차트와 그래프를 통한 직관적인 데이터 시각화")
-        
-        with cols[1]:
-            st.markdown("#### 🔍 데이터 필터링")
-            st.markdown("연도, 제조사, 모델 등 다양한 기준으로 데이터 필터링")
-        
-        with cols[2]:
-            st.markdown("#### 📰 뉴스 분석")
-            st.markdown("최신 반도체 관련 뉴스 제공 및 AI 기반 요약")
-        
-        with cols[3]:
-            st.markdown("#### 🔄 실시간 업데이트")
-            st.markdown("데이터 새로고침을 통한 최신 정보 업데이트")
+        # 기능 아이콘 표시 (4열 격자를 하나의 요소로 표시)
+        st.markdown(FEATURE_CARDS_HTML, unsafe_allow_html=True)
     
     # 데이터 출처 탭
     with tabs[2]:
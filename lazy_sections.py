@@ -0,0 +1,27 @@
+import streamlit as st
+
+
+def render_sections(sections, key, lazy=True):
+    """
+    여러 섹션을 탭 형태로 표시하는 함수
+
+    sections: {탭 이름: 렌더링 함수} 형태의 딕셔너리
+    lazy=True이면 선택된 섹션의 함수만 실행하고, False이면 st.tabs로 모든 섹션을 실행합니다.
+    """
+    labels = list(sections.keys())
+
+    if not lazy:
+        tabs = st.tabs(labels)
+        for tab, label in zip(tabs, labels):
+            with tab:
+                sections[label]()
+        return
+
+    selected = st.radio(
+        "섹션 선택",
+        labels,
+        horizontal=True,
+        key=key,
+        label_visibility="collapsed"
+    )
+    sections[selected]()
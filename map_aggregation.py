@@ -0,0 +1,155 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_store import load_dataset, dataset_version
+
+# 집계 대상 지표 컬럼
+SITE_METRICS = ['Investment_Amount', 'Clean_Room_Area', 'Equipment_Cost', 'Total_Cost']
+
+# 이 확대 수준 이상에서는 개별 사업장을 그대로 표시
+DETAIL_ZOOM = 9
+
+# 위치 데이터와 프로젝트 데이터를 같은 사업장으로 볼 위경도 차이 (도, 약 15km)
+SITE_MATCH_DEG = 0.15
+
+
+def match_locations(projects, locations, tolerance=SITE_MATCH_DEG):
+    """
+    각 위치 행을 위경도 차이가 tolerance 이내인 가장 가까운 프로젝트 행에 연결하는 함수
+
+    연결된 프로젝트 행 번호 배열을 반환합니다 (가까운 프로젝트가 없으면 -1).
+    """
+    project_lat = projects['lat'].to_numpy(dtype=float)
+    project_lon = projects['lon'].to_numpy(dtype=float)
+    matches = np.full(len(locations), -1, dtype=np.int64)
+    if len(projects) == 0:
+        return matches
+
+    for i, (lat, lon) in enumerate(zip(locations['lat'].to_numpy(dtype=float), locations['lon'].to_numpy(dtype=float))):
+        distance = np.fmax(np.abs(project_lat - lat), np.abs(project_lon - lon))
+        nearest = int(np.nanargmin(distance)) if not np.isnan(distance).all() else -1
+        if nearest >= 0 and distance[nearest] <= tolerance:
+            matches[i] = nearest
+    return matches
+
+
+def load_sites():
+    """
+    프로젝트/사업장 위치 데이터를 하나의 사업장 테이블로 합치는 함수
+
+    같은 팹이 두 파일에 모두 있으면 두 번 세지 않도록, 프로젝트와 가까운(SITE_MATCH_DEG 이내)
+    위치 행의 지표는 해당 프로젝트 행에 합치고 나머지 위치 행만 새 사업장으로 추가합니다.
+    """
+    projects_df = load_dataset('construction_projects.csv')
+    sites = pd.DataFrame({
+        'lat': projects_df['Latitude'].to_numpy(dtype=float),
+        'lon': projects_df['Longitude'].to_numpy(dtype=float),
+        'Name': projects_df['Project_Name'].astype(object).to_numpy(),
+        'Company': projects_df['Company'].astype(object).to_numpy(),
+        'Investment_Amount': projects_df['Investment_Amount'].to_numpy(dtype=float),
+    })
+    sites = sites.dropna(subset=['lat', 'lon']).drop_duplicates().reset_index(drop=True)
+    for col in SITE_METRICS[1:]:
+        sites[col] = np.nan
+    sites['Contractor'] = None
+
+    try:
+        locations_df = load_dataset('construction_locations.csv')
+    except FileNotFoundError:
+        locations_df = None
+
+    if locations_df is not None:
+        locations = pd.DataFrame({
+            'lat': locations_df['latitude'].to_numpy(dtype=float),
+            'lon': locations_df['longitude'].to_numpy(dtype=float),
+            'Name': locations_df['project_name'].astype(object).to_numpy(),
+            'Company': locations_df['company'].astype(object).to_numpy(),
+            'Clean_Room_Area': locations_df['clean_room_area'].to_numpy(dtype=float),
+            'Equipment_Cost': locations_df['equipment_cost'].to_numpy(dtype=float),
+            'Total_Cost': locations_df['total_cost'].to_numpy(dtype=float),
+            'Contractor': locations_df['construction_company'].astype(object).to_numpy(),
+        })
+        locations = locations.dropna(subset=['lat', 'lon']).drop_duplicates().reset_index(drop=True)
+
+        matches = match_locations(sites, locations)
+        matched = matches >= 0
+        location_metrics = SITE_METRICS[1:]
+        if matched.any():
+            merged = locations.loc[matched, location_metrics].groupby(matches[matched]).sum(min_count=1)
+            sites.loc[merged.index, location_metrics] = merged.to_numpy()
+            # 시공사는 연결된 위치 행의 시공사 이름을 모두 표시
+            contractors = locations.loc[matched, 'Contractor'].groupby(matches[matched]).agg(
+                lambda names: ', '.join(pd.unique(names.dropna().astype(str))) or None
+            )
+            sites.loc[contractors.index, 'Contractor'] = contractors.to_numpy()
+
+        unmatched = locations.loc[~matched].assign(Investment_Amount=np.nan)
+        sites = pd.concat([sites, unmatched[sites.columns]], ignore_index=True)
+
+    return sites
+
+
+def cell_size_for_zoom(zoom):
+    """확대 수준에 맞는 격자 크기(도)를 반환하는 함수"""
+    return 180.0 / (2 ** zoom)
+
+
+def grid_bins(sites, cell_deg):
+    """
+    사업장을 위경도 격자로 묶어 지표 합계와 사업장 수를 계산하는 함수
+
+    격자 중심 대신 소속 사업장의 평균 위치를 좌표로 사용합니다.
+    """
+    cell_lat = np.floor(sites['lat'].to_numpy() / cell_deg).astype(np.int64)
+    cell_lon = np.floor(sites['lon'].to_numpy() / cell_deg).astype(np.int64)
+
+    grouped = sites.assign(cell_lat=cell_lat, cell_lon=cell_lon).groupby(['cell_lat', 'cell_lon'], sort=False)
+    bins = grouped[SITE_METRICS].sum(min_count=1).fillna(0)
+    bins['lat'] = grouped['lat'].mean()
+    bins['lon'] = grouped['lon'].mean()
+    bins['Site_Count'] = grouped.size()
+    return bins.reset_index(drop=True)
+
+
+_bins_lock = threading.Lock()
+_bins_cache = {}
+
+
+def get_site_bins(zoom):
+    """
+    확대 수준에 맞는 집계 결과를 반환하는 함수 (데이터 버전별로 캐시)
+
+    DETAIL_ZOOM 이상이면 개별 사업장을 반환합니다.
+    """
+    version = sites_version()
+    key = (version, zoom if zoom < DETAIL_ZOOM else DETAIL_ZOOM)
+
+    with _bins_lock:
+        cached = _bins_cache.get(key)
+    if cached is not None:
+        return cached
+
+    sites = load_sites()
+    if zoom >= DETAIL_ZOOM:
+        # 한쪽 파일에만 있는 지표(NaN)는 레이어 높이/반지름과 JSON 직렬화를 위해 0으로 채움
+        result = sites.fillna({**{col: 0 for col in SITE_METRICS}, 'Contractor': ''}).assign(Site_Count=1)
+    else:
+        result = grid_bins(sites, cell_size_for_zoom(zoom))
+
+    with _bins_lock:
+        # 이전 데이터 버전의 결과는 버림
+        for stale in [k for k in _bins_cache if k[0] != version]:
+            del _bins_cache[stale]
+        _bins_cache[key] = result
+    return result
+
+
+def sites_version():
+    """사업장 테이블을 구성하는 데이터셋들의 버전을 반환하는 함수"""
+    try:
+        locations_version = dataset_version('construction_locations.csv')
+    except FileNotFoundError:
+        locations_version = None
+    return (dataset_version('construction_projects.csv'), locations_version)
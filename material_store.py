@@ -0,0 +1,159 @@
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_store import load_dataset, dataset_version
+
+MATERIALS_FILE = 'raw_materials_prices.csv'
+INDICATORS_FILE = 'market_indicators.csv'
+
+# 분기 컬럼 형식 (예: 2023_Q1)
+QUARTER_COLUMN = re.compile(r'^(\d{4})_Q([1-4])$')
+
+# 재료비 비중(중요도)별 가중치
+IMPORTANCE_WEIGHTS = {'높음': 3.0, '중간': 2.0, '낮음': 1.0}
+
+
+def quarter_columns(df):
+    """데이터프레임에서 분기 컬럼을 기간 순서대로 반환하는 함수"""
+    columns = [col for col in df.columns if QUARTER_COLUMN.match(str(col))]
+    return sorted(columns, key=lambda col: tuple(int(v) for v in QUARTER_COLUMN.match(col).groups()))
+
+
+def to_period(column):
+    """'2023_Q1' 형식의 컬럼 이름을 분기 Period로 변환하는 함수"""
+    year, quarter = QUARTER_COLUMN.match(column).groups()
+    return pd.Period(year=int(year), quarter=int(quarter), freq='Q')
+
+
+class QuarterlySeriesStore:
+    """
+    분기 컬럼(2023_Q1..)으로 된 wide 형식 데이터를 (시계열 x 기간) 배열로 보관하는 저장소
+
+    여러 세션이 공유하므로 만든 뒤에는 수정하지 않습니다. 새 분기 컬럼이 추가되면
+    extend()가 기존 배열 뒤에 해당 열만 붙인 새 저장소를 반환합니다.
+    """
+
+    def __init__(self, id_column, names, periods, values, attributes):
+        values.flags.writeable = False
+        self.id_column = id_column
+        self.names = names
+        self.periods = periods
+        self.values = values
+        self.attributes = attributes
+        self._long = None
+
+    @classmethod
+    def from_wide(cls, wide_df, id_column):
+        """wide 형식 데이터프레임으로 저장소를 만드는 함수"""
+        columns = quarter_columns(wide_df)
+        indexed = wide_df.set_index(id_column)
+        return cls(
+            id_column,
+            indexed.index.to_numpy(),
+            pd.PeriodIndex([to_period(col) for col in columns], freq='Q'),
+            indexed[columns].to_numpy(dtype=float),
+            indexed.drop(columns=columns)
+        )
+
+    def extend(self, wide_df):
+        """
+        새 데이터를 반영한 저장소를 반환하는 함수
+
+        시계열 구성과 기존 분기 값이 그대로면 새 분기 열만 추가한 새 저장소를 반환합니다.
+        그렇지 않으면 None을 반환합니다 (호출 측에서 새로 생성). 기존 저장소는 바뀌지 않습니다.
+        """
+        indexed = wide_df.set_index(self.id_column)
+        if not np.array_equal(indexed.index.to_numpy(), self.names):
+            return None
+
+        known = {str(period): i for i, period in enumerate(self.periods)}
+        columns = quarter_columns(wide_df)
+        new_columns = [col for col in columns if str(to_period(col)) not in known]
+        known_columns = sorted(
+            (col for col in columns if str(to_period(col)) in known),
+            key=lambda col: known[str(to_period(col))]
+        )
+        if len(known_columns) != len(self.periods):
+            return None
+
+        # 기존 분기 값이 수정되었으면 새로 생성
+        if not np.array_equal(indexed[known_columns].to_numpy(dtype=float), self.values, equal_nan=True):
+            return None
+
+        new_periods = pd.PeriodIndex([to_period(col) for col in new_columns], freq='Q')
+        if len(new_columns) and len(self.periods) and new_periods.min() <= self.periods.max():
+            return None
+
+        values, periods = self.values, self.periods
+        if new_columns:
+            values = np.hstack([values, indexed[new_columns].to_numpy(dtype=float)])
+            periods = periods.append(new_periods)
+        return QuarterlySeriesStore(self.id_column, self.names, periods, values, indexed.drop(columns=columns))
+
+    def long(self):
+        """(이름, 기간, 값) long 형식 데이터프레임을 반환하는 함수 (기간 인덱스)"""
+        if self._long is None:
+            n_series, n_periods = self.values.shape
+            self._long = pd.DataFrame({
+                self.id_column: np.repeat(self.names, n_periods),
+                'period': np.tile(self.periods, n_series),
+                'value': self.values.ravel(),
+            }).set_index('period')
+        return self._long
+
+
+def pct_change(values, lag):
+    """모든 시계열의 lag 기간 대비 변화율(%)을 한 번에 계산하는 함수 (앞 lag개 기간은 NaN)"""
+    result = np.full_like(values, np.nan, dtype=float)
+    if values.shape[1] > lag:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[:, lag:] = (values[:, lag:] / values[:, :-lag] - 1) * 100
+    return result
+
+
+def moving_average(values, window):
+    """모든 시계열의 이동평균을 누적합으로 계산하는 함수 (앞 window-1개 기간은 NaN)"""
+    result = np.full_like(values, np.nan, dtype=float)
+    if values.shape[1] >= window:
+        cumsum = np.cumsum(np.pad(values, ((0, 0), (1, 0))), axis=1)
+        result[:, window - 1:] = (cumsum[:, window:] - cumsum[:, :-window]) / window
+    return result
+
+
+def weighted_cost_index(values, weights, base=0):
+    """중요도 가중 원자재 비용 지수를 계산하는 함수 (base 기간 = 100)"""
+    weights = np.asarray(weights, dtype=float)
+    relative = values / values[:, [base]] * 100
+    return weights @ relative / weights.sum()
+
+
+_store_lock = threading.Lock()
+_stores = {}
+
+
+def _get_store(filename, id_column):
+    version = dataset_version(filename)
+    with _store_lock:
+        cached = _stores.get(filename)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        wide_df = load_dataset(filename)
+        store = cached[1].extend(wide_df) if cached is not None else None
+        if store is None:
+            store = QuarterlySeriesStore.from_wide(wide_df, id_column)
+        _stores[filename] = (version, store)
+        return store
+
+
+def get_material_store():
+    """원자재 가격 저장소를 반환하는 함수 (데이터 버전별로 캐시)"""
+    return _get_store(MATERIALS_FILE, 'material')
+
+
+def get_indicator_store():
+    """시장 지표 저장소를 반환하는 함수 (데이터 버전별로 캐시)"""
+    return _get_store(INDICATORS_FILE, 'indicator')
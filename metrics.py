@@ -0,0 +1,261 @@
+"""
+Prometheus 텍스트 형식 메트릭 엔드포인트
+
+Streamlit과 같은 프로세스에서 작은 HTTP 스레드로 /metrics를 제공합니다.
+외부 라이브러리 없이 동작하므로 오프라인 환경의 로컬 수집기로 수집할 수 있습니다.
+
+    METRICS_PORT=9464 streamlit run app.py
+    curl http://127.0.0.1:9464/metrics
+"""
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# 엔드포인트 주소 (METRICS_PORT를 빈 값 또는 0으로 설정하면 비활성화)
+METRICS_HOST = os.environ.get('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.environ.get('METRICS_PORT', '9464') or 0)
+
+# 이 시간(초) 안에 리런이 있었던 세션을 활성 세션으로 집계
+ACTIVE_SESSION_WINDOW = int(os.environ.get('ACTIVE_SESSION_WINDOW', '300'))
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """레이블 조합별 값을 보관하는 메트릭의 기본 클래스"""
+
+    kind = 'untyped'
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple((name, labels.get(name, '')) for name in self.labelnames)
+
+    def samples(self):
+        """(샘플 이름, 레이블, 값) 목록을 반환하는 함수"""
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels):
+        """블록 실행 시간(초)을 기록하는 컨텍스트 매니저 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+        result = []
+        for key, counts, total in items:
+            for bound, count in zip(self.buckets, counts):
+                result.append((self.name + '_bucket', key + (('le', _format_value(bound)),), count))
+            result.append((self.name + '_sum', key, total))
+            result.append((self.name + '_count', key, counts[-1]))
+        return result
+
+
+class CallbackMetric(Metric):
+    """수집 시점에 callback()으로 값을 읽는 메트릭 (다른 모듈이 이미 세고 있는 값을 노출할 때 사용)"""
+
+    def __init__(self, name, help_text, kind, callback):
+        super().__init__(name, help_text)
+        self.kind = kind
+        self.callback = callback
+
+    def samples(self):
+        return [(self.name, (), self.callback())]
+
+
+class Registry:
+    """메트릭 목록을 보관하고 Prometheus 텍스트 형식으로 변환하는 클래스"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        """메트릭을 등록하는 함수 (같은 이름이 이미 있으면 기존 메트릭을 반환)"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help_text, labelnames=()):
+        return self.register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self.register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, help_text, labelnames, buckets))
+
+    def callback(self, name, help_text, kind, callback):
+        return self.register(CallbackMetric(name, help_text, kind, callback))
+
+    def render(self):
+        """등록된 모든 메트릭을 Prometheus 텍스트 형식 문자열로 반환하는 함수"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception:
+                # 값을 읽지 못한 메트릭은 건너뛰고 나머지는 그대로 노출
+                continue
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for sample_name, labels, value in samples:
+                lines.append(f'{sample_name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+# 프로세스 전체에서 공유하는 레지스트리
+registry = Registry()
+
+page_render_seconds = registry.histogram(
+    'dashboard_page_render_seconds', '페이지 함수 실행 시간(초)', ['page']
+)
+rerun_seconds = registry.histogram(
+    'dashboard_rerun_seconds', '스크립트 리런 전체 시간(초)', ['menu']
+)
+news_api_seconds = registry.histogram(
+    'dashboard_news_api_request_seconds', 'NewsAPI 요청 시간(초)', ['status']
+)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def mark_session_active(session_id):
+    """세션의 마지막 리런 시각을 기록하는 함수"""
+    with _sessions_lock:
+        _sessions[session_id] = time.monotonic()
+
+
+def active_session_count():
+    """ACTIVE_SESSION_WINDOW 안에 리런이 있었던 세션 수를 반환하는 함수"""
+    expired = time.monotonic() - ACTIVE_SESSION_WINDOW
+    with _sessions_lock:
+        for session_id in [s for s, seen_at in _sessions.items() if seen_at < expired]:
+            del _sessions[session_id]
+        return len(_sessions)
+
+
+registry.callback('dashboard_active_sessions', '최근 리런이 있었던 세션 수', 'gauge', active_session_count)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 수집기 요청마다 Streamlit 로그에 출력하지 않음
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(host=None, port=None):
+    """
+    메트릭 HTTP 서버를 백그라운드 스레드로 시작하는 함수
+
+    프로세스당 한 번만 시작되며, 리런마다 호출해도 됩니다.
+    포트가 이미 사용 중이면 서버 없이 None을 반환합니다.
+    """
+    global _server
+    host = host or METRICS_HOST
+    port = METRICS_PORT if port is None else port
+    if not port:
+        return None
+
+    with _server_lock:
+        if _server is not None:
+            # 시작에 실패한 경우(False)에는 리런마다 다시 시도하지 않음
+            return _server or None
+        try:
+            server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as e:
+            logger.warning("메트릭 서버를 시작하지 못했습니다 (%s:%s): %s", host, port, e)
+            _server = False
+            return None
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+        _server = server
+        return server
+
+
+if __name__ == "__main__":
+    print(registry.render(), end='')
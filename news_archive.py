@@ -0,0 +1,263 @@
+import os
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from data_store import DATA_DIR
+
+# 뉴스 아카이브 DB 경로 (환경변수로 변경 가능)
+NEWS_ARCHIVE_PATH = os.environ.get('NEWS_ARCHIVE_PATH', os.path.join(DATA_DIR, 'news_archive.sqlite'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    query_category TEXT NOT NULL,
+    article_hash TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    url TEXT,
+    author TEXT,
+    source_name TEXT,
+    published_at TEXT NOT NULL,
+    category TEXT,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (query_category, article_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles (query_category, published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category);
+CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles (article_hash);
+CREATE TABLE IF NOT EXISTS coverage (
+    query_category TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,
+    covered_to TEXT
+);
+"""
+
+# NewsAPI from/to 파라미터와 저장 시각 비교에 사용하는 형식 (모든 시각은 UTC)
+API_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# 기사 발행 시각 저장 형식 (NewsAPI publishedAt과 같은 UTC 'Z' 형식)
+PUBLISHED_TIME_FORMAT = API_TIME_FORMAT + 'Z'
+
+# 한 번에 존재 여부를 확인할 기사 해시 수 (SQLite 파라미터 수 제한)
+HASH_BATCH = 500
+
+
+def article_hash(url, title):
+    """기사 URL(없으면 제목)로 중복 판별용 해시를 만드는 함수"""
+    key = url or title or ''
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def to_api_datetime(published_at):
+    """
+    저장된 발행 시각을 NewsAPI from 파라미터 형식으로 변환하는 함수
+
+    시 단위로 내림하여 새 기사가 저장될 때마다 요청 캐시 키가 바뀌지 않도록 합니다.
+    """
+    return published_at[:13] + ':00:00'
+
+
+def to_utc(value):
+    """시각을 UTC datetime으로 변환하는 함수 (시간대 정보가 없으면 UTC로 간주)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def normalize_published_at(published_at):
+    """NewsAPI publishedAt(ISO 8601, 시간대 포함 가능)을 UTC 저장 형식으로 변환하는 함수"""
+    return to_utc(pd.Timestamp(published_at).to_pydatetime()).strftime(PUBLISHED_TIME_FORMAT)
+
+
+def floor_hour(value):
+    """시각을 UTC 시 단위로 내림한 API 형식 문자열을 반환하는 함수"""
+    return to_utc(value).replace(minute=0, second=0, microsecond=0).strftime(API_TIME_FORMAT)
+
+
+def ceil_hour(value):
+    """시각을 UTC 시 단위로 올림한 API 형식 문자열을 반환하는 함수"""
+    value = to_utc(value)
+    floored = value.replace(minute=0, second=0, microsecond=0)
+    if floored != value:
+        floored += timedelta(hours=1)
+    return floored.strftime(API_TIME_FORMAT)
+
+
+class NewsArchive:
+    """
+    NewsAPI 기사를 로컬 SQLite에 누적 저장하는 아카이브
+
+    새로고침 시에는 아직 가져오지 않은 기간(마지막 저장 기사 이후, 기간을 늘린 경우 앞쪽)만
+    요청하고, 화면은 API 대신 이 저장소를 조회합니다.
+    """
+
+    def __init__(self, path=NEWS_ARCHIVE_PATH):
+        self.path = path
+        self._write_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            # 이전 버전 DB에는 covered_to 컬럼이 없음 (NULL이면 마지막 저장 기사까지로 간주)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(coverage)")}
+            if 'covered_to' not in columns:
+                conn.execute("ALTER TABLE coverage ADD COLUMN covered_to TEXT")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def latest_published_at(self, query_category):
+        """카테고리별로 가장 최근에 저장된 기사의 발행 시각을 반환하는 함수"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(published_at) FROM articles WHERE query_category = ?",
+                (query_category,)
+            ).fetchone()
+        return row[0]
+
+    def coverage(self, query_category):
+        """
+        카테고리별로 API에서 빠짐없이 가져온 (시작, 끝) 기간을 반환하는 함수 (없으면 None)
+
+        끝이 기록되지 않은 이전 버전 항목은 마지막 저장 기사 시각(시 단위 내림)까지로 봅니다.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT covered_from, covered_to FROM coverage WHERE query_category = ?",
+                (query_category,)
+            ).fetchone()
+        if row is None:
+            return None
+        covered_from, covered_to = row
+        if covered_to is None:
+            latest = self.latest_published_at(query_category)
+            if latest is None:
+                return None
+            covered_to = to_api_datetime(latest)
+        return covered_from, covered_to
+
+    def mark_covered(self, query_category, window_start, window_end):
+        """
+        window_start ~ window_end 기간을 빠짐없이 가져왔다고 기록하는 함수
+
+        기존 기간과 겹치거나 맞닿으면 합치고, 떨어져 있으면 더 최근 기간만 남깁니다.
+        """
+        with self._write_lock:
+            current = self.coverage(query_category)
+            if current is not None:
+                covered_from, covered_to = current
+                if window_start <= covered_to and window_end >= covered_from:
+                    window_start, window_end = min(window_start, covered_from), max(window_end, covered_to)
+                elif window_end < covered_from:
+                    return
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO coverage (query_category, covered_from, covered_to) VALUES (?, ?, ?)
+                    ON CONFLICT (query_category) DO UPDATE
+                    SET covered_from = excluded.covered_from, covered_to = excluded.covered_to
+                    """,
+                    (query_category, window_start, window_end)
+                )
+
+    def missing_windows(self, query_category, from_date, to_date):
+        """
+        요청 기간 중 아직 가져오지 않은 (from, to) 구간 목록을 반환하는 함수
+
+        두 경계 모두 UTC 시 단위 API 형식 문자열입니다.
+        - 앞쪽: 요청 시작이 이미 가져온 기간보다 이르면 그 사이를 채움 (기간을 늘린 경우)
+        - 뒤쪽: 이미 가져온 기간의 끝부터 현재까지
+        """
+        window_start = floor_hour(from_date)
+        window_end = ceil_hour(to_date)
+        current = self.coverage(query_category)
+        if current is None:
+            return [(window_start, window_end)]
+
+        covered_from, covered_to = current
+        windows = []
+        if window_start < covered_from:
+            windows.append((window_start, min(covered_from, window_end)))
+        windows.append((max(window_start, covered_to), window_end))
+        return [(start, end) for start, end in windows if start < end]
+
+    def add_articles(self, query_category, news_df):
+        """기사 데이터프레임 중 아직 저장되지 않은 기사만 저장하고 저장한 수를 반환하는 함수"""
+        articles = {}
+        for article in news_df.to_dict('records'):
+            if article.get('publishedAt'):
+                articles.setdefault(article_hash(article.get('url'), article.get('title')), article)
+        if not articles:
+            return 0
+
+        with self._connect() as conn:
+            existing = set()
+            hashes = list(articles)
+            for start in range(0, len(hashes), HASH_BATCH):
+                batch = hashes[start:start + HASH_BATCH]
+                existing.update(row[0] for row in conn.execute(
+                    f"SELECT article_hash FROM articles WHERE query_category = ? "
+                    f"AND article_hash IN ({','.join('?' * len(batch))})",
+                    (query_category, *batch)
+                ))
+
+        fetched_at = datetime.now(timezone.utc).strftime(PUBLISHED_TIME_FORMAT)
+        rows = [
+            (
+                query_category,
+                key,
+                article.get('title'),
+                article.get('description'),
+                article.get('url'),
+                article.get('author'),
+                (article.get('source') or {}).get('name'),
+                normalize_published_at(article.get('publishedAt')),
+                article.get('category'),
+                fetched_at,
+            )
+            for key, article in articles.items()
+            if key not in existing
+        ]
+        if not rows:
+            return 0
+
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def query(self, query_category, since):
+        """카테고리와 기간(since 이후, UTC로 비교)으로 저장된 기사를 조회하는 함수"""
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                """
+                SELECT title, description, url, author, source_name, published_at, category
+                FROM articles
+                WHERE query_category = ? AND published_at >= ?
+                ORDER BY published_at DESC
+                """,
+                conn,
+                params=(query_category, to_utc(since).strftime(API_TIME_FORMAT))
+            )
+
+        # NewsAPI 응답과 같은 형태로 변환
+        df['source'] = [{'name': name} for name in df.pop('source_name')]
+        return df.rename(columns={'published_at': 'publishedAt'})
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_news_archive():
+    """프로세스에서 공유하는 뉴스 아카이브를 반환하는 함수"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = NewsArchive()
+    return _archive
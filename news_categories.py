@@ -0,0 +1,56 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from perf import timed
+
+# 카테고리별 검색어 설정 (한글 + 영문)
+SEARCH_QUERIES = {
+    "전체": "(반도체 OR 삼성전자 OR SK하이닉스) OR (semiconductor OR Samsung OR SK Hynix OR TSMC OR Intel)",
+    "기업 동향": "(삼성전자 반도체 OR SK하이닉스) OR (Samsung semiconductor OR SK Hynix OR TSMC OR Intel)",
+    "시장 동향": "(반도체 시장 OR 메모리 시장) OR (semiconductor market OR memory market)",
+    "기술 동향": "(반도체 기술 OR 파운드리) OR (semiconductor technology OR foundry)",
+    "정책": "(반도체 정책 OR 반도체 지원) OR (semiconductor policy OR CHIPS Act)"
+}
+
+# 뉴스 분류 키워드 (앞에 있는 카테고리가 우선)
+NEWS_CATEGORY_KEYWORDS = {
+    '기업/재무': ['실적', '매출', '영업이익', '투자', '주가'],
+    '기술/연구': ['기술', '공정', '개발', '나노', '연구'],
+    '시장/산업': ['시장', '수요', '공급', '전망', '예측'],
+    '정책/규제': ['정책', '규제', '지원', 'chips act', '보조금']
+}
+DEFAULT_NEWS_CATEGORY = '기타'
+
+
+@lru_cache(maxsize=8)
+def _compile_category_pattern(keyword_items):
+    """카테고리별 키워드를 하나의 정규식으로 컴파일하는 함수"""
+    groups = '|'.join(
+        f"(?P<c{i}>{'|'.join(re.escape(keyword.lower()) for keyword in keywords)})"
+        for i, (_, keywords) in enumerate(keyword_items)
+    )
+    # 전방탐색으로 모든 위치에서 매칭 (겹치는 키워드도 놓치지 않도록)
+    return re.compile(f"(?=(?:{groups}))")
+
+
+@timed()
+def classify_news(news_df, keyword_sets=None):
+    """뉴스 기사 카테고리를 데이터프레임 전체에 대해 한 번에 분류하는 함수"""
+    keyword_sets = keyword_sets or NEWS_CATEGORY_KEYWORDS
+    keyword_items = tuple((category, tuple(keywords)) for category, keywords in keyword_sets.items())
+    pattern = _compile_category_pattern(keyword_items)
+    categories = np.array([category for category, _ in keyword_items], dtype=object)
+
+    content = news_df['title'].fillna('').str.lower() + " " + news_df['description'].astype(str).str.lower()
+    result = pd.Series(DEFAULT_NEWS_CATEGORY, index=news_df.index, dtype=object)
+
+    matches = content.str.extractall(pattern)
+    if not matches.empty:
+        # 기사별로 매칭된 카테고리 중 우선순위가 가장 높은 것을 선택
+        matched = matches.notna().groupby(level=0).any()
+        result.loc[matched.index] = categories[matched.to_numpy().argmax(axis=1)]
+
+    return result
@@ -1,11 +1,14 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
-from newsapi import NewsApiClient
+from datetime import datetime, timedelta, timezone
+from news_fetcher import news_fetcher
+from news_archive import get_news_archive, floor_hour, ceil_hour
+from news_categories import SEARCH_QUERIES, classify_news
+from perf import timed
 
 def get_sample_news():
     """샘플 뉴스 데이터를 생성하는 함수"""
-    current_time = datetime.now()
+    current_time = datetime.now(timezone.utc)
     
     sample_news = [
         {
@@ -52,38 +55,47 @@ def get_sample_news():
     
     return pd.DataFrame(sample_news)
 
+@timed()
 def fetch_news(api_key, category, days=7):
-    """뉴스 데이터를 가져오는 함수"""
+    """뉴스 데이터를 가져오는 함수 (새 기사만 요청해 아카이브에 누적한 뒤 아카이브에서 조회)"""
+    # 날짜 범위 설정 (NewsAPI publishedAt과 같은 UTC 기준)
+    to_date = datetime.now(timezone.utc)
+    from_date = to_date - timedelta(days=days)
+    
     try:
-        newsapi = NewsApiClient(api_key=api_key)
+        archive = get_news_archive()
         
-        # 날짜 범위 설정
-        to_date = datetime.now()
-        from_date = to_date - timedelta(days=days)
+        # 모든 카테고리를 동시에 미리 요청 (아직 가져오지 않은 구간만, 캐시가 최신이면 건너뜀)
+        for name, query in SEARCH_QUERIES.items():
+            for window_from, window_to in archive.missing_windows(name, from_date, to_date):
+                news_fetcher.prefetch(api_key, [query], window_from, window_to)
         
-        # 카테고리별 검색어 설정 (한글 + 영문)
-        search_queries = {
-            "전체": "(반도체 OR 삼성전자 OR SK하이닉스) OR (semiconductor OR Samsung OR SK Hynix OR TSMC OR Intel)",
-            "기업 동향": "(삼성전자 반도체 OR SK하이닉스) OR (Samsung semiconductor OR SK Hynix OR TSMC OR Intel)",
-            "시장 동향": "(반도체 시장 OR 메모리 시장) OR (semiconductor market OR memory market)",
-            "기술 동향": "(반도체 기술 OR 파운드리) OR (semiconductor technology OR foundry)",
-            "정책": "(반도체 정책 OR 반도체 지원) OR (semiconductor policy OR CHIPS Act)"
-        }
+        # 뉴스 검색 (새 기사만 아카이브에 저장)
+        query = SEARCH_QUERIES.get(category, SEARCH_QUERIES["전체"])
+        for window_from, window_to in archive.missing_windows(category, from_date, to_date):
+            # 결과 수 제한으로 일부만 받으면 받은 가장 오래된 기사 이전 구간을 이어서 요청
+            request_to = window_to
+            while True:
+                articles, complete = news_fetcher.get(api_key, query, window_from, request_to)
+                
+                if articles:
+                    new_df = pd.DataFrame(articles)
+                    new_df['category'] = classify_news(new_df)
+                    archive.add_articles(category, new_df)
+                if complete or not articles:
+                    break
+                oldest = ceil_hour(pd.to_datetime(new_df['publishedAt'], utc=True).min().to_pydatetime())
+                if oldest >= request_to:
+                    # 한 시간 안의 기사가 제한보다 많아 더 나눌 수 없음
+                    break
+                request_to = oldest
+            
+            # 현재 시각 이후(올림한 구간 끝)는 아직 가져온 것이 아니므로 현재 시각(시 단위 내림)까지만 기록
+            archive.mark_covered(category, window_from, min(window_to, floor_hour(to_date)))
         
-        # 뉴스 검색
-        query = search_queries.get(category, search_queries["전체"])
-        response = newsapi.get_everything(
-            q=query,
-            from_param=from_date.strftime('%Y-%m-%d'),
-            to=to_date.strftime('%Y-%m-%d'),
-            sort_by='publishedAt',
-            page_size=30  # 한 번에 가져올 뉴스 수
-        )
+        df = archive.query(category, since=from_date)
         
-        if response['status'] == 'ok' and response['articles']:
-            articles = response['articles']
-            df = pd.DataFrame(articles)
-            
+        if not df.empty:
             # 중복 제거 및 정렬
             df = df.drop_duplicates(subset=['title'])
             df = df.sort_values('publishedAt', ascending=False)
@@ -107,23 +119,6 @@ def fetch_news(api_key, category, days=7):
         st.error(f"뉴스를 가져오는 중 오류가 발생했습니다: {str(e)}")
         return get_sample_news()  # 에러 발생 시 샘플 데이터 반환
 
-def categorize_news(article):
-    """뉴스 기사 카테고리 분류"""
-    title = article['title'].lower()
-    description = str(article['description']).lower()
-    content = title + " " + description
-    
-    if any(keyword in content for keyword in ['실적', '매출', '영업이익', '투자', '주가']):
-        return '기업/재무'
-    elif any(keyword in content for keyword in ['기술', '공정', '개발', '나노', '연구']):
-        return '기술/연구'
-    elif any(keyword in content for keyword in ['시장', '수요', '공급', '전망', '예측']):
-        return '시장/산업'
-    elif any(keyword in content for keyword in ['정책', '규제', '지원', 'chips act', '보조금']):
-        return '정책/규제'
-    else:
-        return '기타'
-
 def simple_summarize(text, max_sentences=3):
     """간단한 텍스트 요약 함수"""
     try:
@@ -149,6 +144,7 @@ def simple_summarize(text, max_sentences=3):
         st.warning(f"텍스트 요약 중 오류가 발생했습니다: {str(e)}")
         return text
 
+@timed()
 def show_news():
     """반도체 관련 뉴스를 표시하는 함수"""
     st.title("반도체 산업 뉴스")
@@ -181,7 +177,8 @@ def show_news():
         
         if news_df is not None and not news_df.empty:
             # 뉴스 카테고리 분류
-            news_df['category'] = news_df.apply(categorize_news, axis=1)
+            if 'category' not in news_df.columns:
+                news_df['category'] = classify_news(news_df)
             
             # 카테고리별 탭 생성
             unique_categories = sorted(news_df['category'].unique())
@@ -0,0 +1,123 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from newsapi import NewsApiClient
+
+from metrics import news_api_seconds
+
+# 뉴스 캐시 유효 시간 (초, 환경변수로 변경 가능)
+NEWS_CACHE_TTL = int(os.environ.get('NEWS_CACHE_TTL', '600'))
+
+# 한 페이지에 가져올 뉴스 수 (NewsAPI 최대값)
+PAGE_SIZE = 100
+
+
+class NewsFetcher:
+    """
+    NewsAPI 응답을 (검색어, 시작일, 종료일) 단위로 캐시하는 동시 요청기
+
+    만료된 항목은 기존 결과를 바로 반환하고 백그라운드에서 갱신합니다.
+    """
+
+    def __init__(self, ttl=NEWS_CACHE_TTL, max_workers=5):
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='newsapi')
+        self._cache = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _request(self, api_key, query, from_date, to_date):
+        """
+        기간 내 검색 결과를 모든 페이지에 걸쳐 가져오는 함수
+
+        (최신순 기사 목록, totalResults만큼 모두 받았는지)를 반환합니다.
+        요금제의 결과 수 제한에 걸리면 그때까지 받은 기사만 반환합니다.
+        """
+        newsapi = NewsApiClient(api_key=api_key)
+        start = time.perf_counter()
+        status = 'error'
+        articles = []
+        total = None
+        try:
+            page = 1
+            while total is None or len(articles) < total:
+                try:
+                    response = newsapi.get_everything(
+                        q=query,
+                        from_param=from_date,
+                        to=to_date,
+                        sort_by='publishedAt',
+                        page_size=PAGE_SIZE,
+                        page=page
+                    )
+                except Exception as e:
+                    # 결과 수 제한을 넘는 페이지는 maximumResultsReached 오류로 응답
+                    code = e.get_code() if hasattr(e, 'get_code') else None
+                    if page > 1 and code == 'maximumResultsReached':
+                        break
+                    raise
+                if response['status'] != 'ok':
+                    raise RuntimeError(response.get('message', 'NewsAPI 요청 실패'))
+                total = response.get('totalResults', 0)
+                if not response['articles']:
+                    break
+                articles.extend(response['articles'])
+                page += 1
+            status = 'ok'
+            return articles, total is not None and len(articles) >= total
+        finally:
+            news_api_seconds.observe(time.perf_counter() - start, status=status)
+
+    def _run(self, key, api_key):
+        try:
+            result = self._request(api_key, *key)
+            with self._lock:
+                self._cache[key] = (time.monotonic(), result)
+                self._prune()
+            return result
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _prune(self):
+        """오래 사용되지 않은 날짜 범위의 항목을 제거하는 함수 (잠금 안에서 호출)"""
+        expired = time.monotonic() - self.ttl * 10
+        for key in [k for k, (fetched_at, _) in self._cache.items() if fetched_at < expired]:
+            del self._cache[key]
+
+    def _submit(self, key, api_key):
+        """같은 키의 요청이 진행 중이면 그 요청을 재사용하는 함수 (잠금 안에서 호출)"""
+        future = self._pending.get(key)
+        if future is None:
+            future = self._executor.submit(self._run, key, api_key)
+            self._pending[key] = future
+        return future
+
+    def get(self, api_key, query, from_date, to_date):
+        """검색 결과 (기사 목록, 모두 받았는지)를 반환하는 함수"""
+        key = (query, from_date, to_date)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                fetched_at, result = cached
+                if time.monotonic() - fetched_at > self.ttl:
+                    self._submit(key, api_key)
+                return result
+            future = self._submit(key, api_key)
+        return future.result()
+
+    def prefetch(self, api_key, queries, from_date, to_date):
+        """여러 검색어를 동시에 미리 요청하는 함수 (캐시가 최신이면 건너뜀)"""
+        now = time.monotonic()
+        with self._lock:
+            for query in queries:
+                key = (query, from_date, to_date)
+                cached = self._cache.get(key)
+                if cached is None or now - cached[0] > self.ttl:
+                    self._submit(key, api_key)
+
+
+# 모든 세션이 공유하는 뉴스 요청기
+news_fetcher = NewsFetcher()
@@ -0,0 +1,125 @@
+import os
+import json
+import time
+import functools
+import threading
+from contextlib import contextmanager
+
+# 리런별 트레이스를 JSON lines로 저장할 파일 (환경변수로 지정, 없으면 저장하지 않음)
+TRACE_PATH = os.environ.get('PERF_TRACE_PATH')
+
+# 리런은 세션별 스크립트 스레드에서 실행되므로 스레드별로 현재 트레이스를 보관
+_local = threading.local()
+_write_lock = threading.Lock()
+
+
+class Trace:
+    """
+    리런 한 번의 구간별 소요 시간 기록
+
+    구간은 시작 순서대로 (이름, 깊이, 시작 시점, 소요 시간)으로 저장됩니다.
+    """
+
+    def __init__(self, page=None):
+        self.page = page
+        self.started_at = time.time()
+        self.spans = []
+        self.depth = 0
+        self.total_ms = None
+        self._start = time.perf_counter()
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self._start) * 1000
+
+    def to_dict(self):
+        return {
+            'page': self.page,
+            'started_at': self.started_at,
+            'total_ms': self.total_ms,
+            'spans': self.spans,
+        }
+
+
+def start_trace(page=None):
+    """현재 리런의 트레이스를 시작하는 함수 (이전 트레이스가 남아 있으면 버림)"""
+    trace = Trace(page)
+    _local.trace = trace
+    return trace
+
+
+def current_trace():
+    """현재 스레드에서 진행 중인 트레이스를 반환하는 함수 (없으면 None)"""
+    return getattr(_local, 'trace', None)
+
+
+def finish_trace(path=None):
+    """현재 트레이스를 종료하고 반환하는 함수 (path 또는 PERF_TRACE_PATH가 있으면 저장)"""
+    trace = current_trace()
+    if trace is None:
+        return None
+
+    trace.total_ms = trace.elapsed_ms()
+    _local.trace = None
+
+    path = path or TRACE_PATH
+    if path:
+        dump_trace(trace, path)
+    return trace
+
+
+@contextmanager
+def stage(name):
+    """
+    구간 소요 시간을 현재 트레이스에 기록하는 컨텍스트 매니저
+
+    진행 중인 트레이스가 없으면 아무것도 기록하지 않습니다.
+    """
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+
+    span = {'name': name, 'depth': trace.depth, 'start_ms': trace.elapsed_ms(), 'duration_ms': None}
+    trace.spans.append(span)
+    trace.depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        span['duration_ms'] = (time.perf_counter() - start) * 1000
+        trace.depth -= 1
+
+
+def timed(name=None):
+    """함수 실행 시간을 구간으로 기록하는 데코레이터 (이름을 생략하면 함수 이름 사용)"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def dump_trace(trace, path):
+    """트레이스를 JSON lines 파일에 한 줄로 추가하는 함수"""
+    line = json.dumps(trace.to_dict(), ensure_ascii=False)
+    with _write_lock:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+def trace_report(trace):
+    """트레이스를 구간별 표 형식(들여쓰기로 중첩 표시)으로 반환하는 함수"""
+    total = trace.total_ms or trace.elapsed_ms()
+    return [
+        {
+            '구간': '　' * span['depth'] + span['name'],
+            '시작(ms)': round(span['start_ms'], 1),
+            '소요 시간(ms)': round(span['duration_ms'], 1) if span['duration_ms'] is not None else None,
+            '비율(%)': round(span['duration_ms'] / total * 100, 1) if span['duration_ms'] and total else None,
+        }
+        for span in trace.spans
+    ]
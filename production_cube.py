@@ -0,0 +1,91 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_store import load_dataset, dataset_version
+
+PRODUCTION_FILE = 'semiconductor_production.csv'
+MONTHS = np.arange(1, 13)
+
+
+class ProductionCube:
+    """
+    연도 x 모델 x 기업 x 월 생산 데이터를 배열로 미리 집계한 큐브
+
+    연도/모델 선택은 배열 인덱싱 한 번으로 처리됩니다.
+    """
+
+    def __init__(self, production_data):
+        self.years = np.sort(production_data['Year'].unique())
+        self.models = np.sort(production_data['Model'].unique())
+        # 기업 순서는 원본 데이터 순서를 유지 (차트 색상 순서 보존)
+        self.companies = pd.unique(production_data['Company'])
+
+        year_idx = np.searchsorted(self.years, production_data['Year'].to_numpy())
+        model_idx = np.searchsorted(self.models, production_data['Model'].to_numpy())
+        company_idx = pd.Index(self.companies).get_indexer(production_data['Company'])
+        month_idx = production_data['Month'].to_numpy() - 1
+
+        shape = (len(self.years), len(self.models), len(self.companies), len(MONTHS))
+        index = (year_idx, model_idx, company_idx, month_idx)
+
+        self.volume = np.zeros(shape)
+        efficiency_sum = np.zeros(shape)
+        self.count = np.zeros(shape, dtype=np.int32)
+        np.add.at(self.volume, index, production_data['Production_Volume'].to_numpy())
+        np.add.at(efficiency_sum, index, production_data['Efficiency'].to_numpy())
+        np.add.at(self.count, index, 1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.efficiency = efficiency_sum / self.count
+
+        self._year_pos = {year: i for i, year in enumerate(self.years)}
+        self._model_pos = {model: i for i, model in enumerate(self.models)}
+
+    def slice(self, year, model):
+        """선택한 연도/모델의 (기업 x 월) 생산액, 효율성, 데이터 존재 여부를 반환하는 함수"""
+        y = self._year_pos[year]
+        m = self._model_pos[model]
+        return self.volume[y, m], self.efficiency[y, m], self.count[y, m] > 0
+
+    def to_frame(self, year, model):
+        """선택한 연도/모델을 원본과 같은 형태의 데이터프레임으로 반환하는 함수"""
+        volume, efficiency, present = self.slice(year, model)
+        # 월 -> 기업 순서로 정렬 (원본 CSV 순서와 동일)
+        month_pos, company_pos = np.nonzero(present.T)
+        return pd.DataFrame({
+            'Year': year,
+            'Month': MONTHS[month_pos],
+            'Company': self.companies[company_pos],
+            'Model': model,
+            'Production_Volume': volume[company_pos, month_pos],
+            'Efficiency': efficiency[company_pos, month_pos],
+        })
+
+    def efficiency_traces(self, year, model):
+        """기업별 (이름, 월 배열, 효율성 배열) 목록을 반환하는 함수"""
+        _, efficiency, present = self.slice(year, model)
+        traces = []
+        for i, company in enumerate(self.companies):
+            if present[i].any():
+                traces.append((company, MONTHS[present[i]], efficiency[i, present[i]]))
+        return traces
+
+
+_cube_lock = threading.Lock()
+_cube_cache = {}
+
+
+def get_production_cube():
+    """데이터 버전별로 한 번만 생성한 생산 큐브를 반환하는 함수"""
+    version = dataset_version(PRODUCTION_FILE)
+    with _cube_lock:
+        cube = _cube_cache.get(version)
+    if cube is None:
+        cube = ProductionCube(load_dataset(PRODUCTION_FILE))
+        with _cube_lock:
+            # 이전 버전 큐브는 버림
+            _cube_cache.clear()
+            _cube_cache[version] = cube
+    return cube
@@ -0,0 +1,195 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import sys
+import plotly.express as px
+import plotly.graph_objects as go
+from material_store import (
+    get_material_store,
+    get_indicator_store,
+    pct_change,
+    moving_average,
+    weighted_cost_index,
+    IMPORTANCE_WEIGHTS
+)
+from correlation_engine import get_correlations, TRANSFORMS
+from perf import stage, timed
+from utils.visualization_utils import set_plotly_theme
+
+# 상관관계 계산에 사용할 최대 시차 (분기)
+MAX_CORRELATION_LAG = 2
+
+# 상위 디렉토리 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def series_frame(names, periods, values, id_label):
+    """(시계열 x 기간) 배열을 차트용 long 형식 데이터프레임으로 변환하는 함수"""
+    n_series, n_periods = values.shape
+    return pd.DataFrame({
+        id_label: np.repeat(names, n_periods),
+        '분기': np.tile(periods.astype(str), n_series),
+        '값': values.ravel()
+    })
+
+@timed()
+def show_raw_materials():
+    """
+    반도체 건설 원자재 가격 페이지를 표시하는 함수
+    """
+    st.title("반도체 건설 원자재 가격")
+    
+    try:
+        store = get_material_store()
+        indicator_store = get_indicator_store()
+    except Exception as e:
+        st.error(f'데이터를 불러오는 중 오류가 발생했습니다: {str(e)}')
+        return
+    
+    names = store.names
+    periods = store.periods
+    values = store.values
+    
+    # 원자재 선택
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected = st.multiselect("원자재 선택", list(names), default=list(names), key='materials_selected')
+    with col2:
+        ma_window = st.selectbox("이동평균 기간 (분기)", [2, 3, 4], index=2, key='materials_ma')
+    
+    if not selected:
+        st.info("원자재를 하나 이상 선택해주세요.")
+        return
+    
+    mask = np.isin(names, selected)
+    
+    # 모든 원자재의 변화율/이동평균을 한 번에 계산
+    qoq = pct_change(values, 1)
+    yoy = pct_change(values, 4)
+    ma = moving_average(values, ma_window)
+    
+    # 최신 분기 요약 테이블
+    st.subheader(f"{periods[-1]} 원자재 가격 요약")
+    summary = pd.DataFrame({
+        '원자재': names,
+        '가격': values[:, -1],
+        '단위': store.attributes['unit'].to_numpy(),
+        '재료비 비중': store.attributes['importance'].to_numpy(),
+        '전분기 대비(%)': qoq[:, -1],
+        '전년 동기 대비(%)': yoy[:, -1],
+        f'{ma_window}분기 이동평균': ma[:, -1]
+    })[mask]
+    st.dataframe(summary.round(2), hide_index=True, use_container_width=True)
+    
+    # 원자재 가격 추이
+    st.subheader("원자재 가격 추이")
+    normalize = st.checkbox("첫 분기 = 100 기준으로 표시", value=True, key='materials_normalize')
+    chart_values = values[mask] / values[mask][:, [0]] * 100 if normalize else values[mask]
+    fig_prices = px.line(
+        series_frame(names[mask], periods, chart_values, '원자재'),
+        x='분기',
+        y='값',
+        color='원자재',
+        markers=True,
+        title='원자재별 가격 추이' + (' (첫 분기 = 100)' if normalize else ''),
+        template=set_plotly_theme()
+    )
+    st.plotly_chart(fig_prices, use_container_width=True)
+    
+    # 전분기 대비 변화율 히트맵
+    st.subheader("전분기 대비 변화율")
+    fig_qoq = go.Figure(go.Heatmap(
+        z=qoq[mask][:, 1:],
+        x=periods[1:].astype(str),
+        y=names[mask],
+        colorscale='RdBu_r',
+        zmid=0,
+        hovertemplate="%{y}<br>%{x}: %{z:.2f}%<extra></extra>"
+    ))
+    fig_qoq.update_layout(template=set_plotly_theme(), title='원자재별 전분기 대비 변화율 (%)')
+    st.plotly_chart(fig_qoq, use_container_width=True)
+    
+    # 중요도 가중 원자재 비용 지수
+    st.subheader("재료비 비중 가중 원자재 비용 지수")
+    weights = store.attributes['importance'].map(IMPORTANCE_WEIGHTS).fillna(1.0).to_numpy()
+    cost_index = weighted_cost_index(values[mask], weights[mask])
+    fig_index = go.Figure(go.Scatter(
+        x=periods.astype(str),
+        y=cost_index,
+        mode='lines+markers',
+        name='가중 비용 지수'
+    ))
+    fig_index.update_layout(
+        template=set_plotly_theme(),
+        title=f'원자재 비용 지수 ({periods[0]} = 100, 가중치: 높음 3 / 중간 2 / 낮음 1)',
+        xaxis_title="분기",
+        yaxis_title="지수"
+    )
+    st.plotly_chart(fig_index, use_container_width=True)
+    
+    # 시장 지표 추이
+    st.subheader("시장 지표 추이 (첫 분기 = 100)")
+    indicator_values = indicator_store.values / indicator_store.values[:, [0]] * 100
+    fig_indicators = px.line(
+        series_frame(indicator_store.names, indicator_store.periods, indicator_values, '지표'),
+        x='분기',
+        y='값',
+        color='지표',
+        markers=True,
+        title='시장 지표 추이',
+        template=set_plotly_theme()
+    )
+    st.plotly_chart(fig_indicators, use_container_width=True)
+    
+    # 원자재-시장 지표 상관관계
+    st.subheader("원자재-시장 지표 상관관계")
+    col1, col2 = st.columns(2)
+    with col1:
+        transform = st.radio(
+            "기준",
+            list(TRANSFORMS),
+            format_func=TRANSFORMS.get,
+            horizontal=True,
+            key='materials_corr_transform'
+        )
+    with col2:
+        lag = st.slider("시차 (분기, 지표가 선행)", 0, MAX_CORRELATION_LAG, 0, key='materials_corr_lag')
+    
+    try:
+        with stage('aggregate'):
+            correlations = get_correlations(transform, MAX_CORRELATION_LAG)
+    except ValueError as e:
+        st.warning(str(e))
+        return
+    
+    corr_mask = np.isin(correlations.materials, selected)
+    fig_corr = go.Figure(go.Heatmap(
+        z=correlations.at_lag(lag)[corr_mask],
+        x=correlations.indicators,
+        y=correlations.materials[corr_mask],
+        colorscale='RdBu_r',
+        zmin=-1,
+        zmax=1,
+        hovertemplate="%{y} / %{x}<br>상관계수: %{z:.2f}<extra></extra>"
+    ))
+    fig_corr.update_layout(
+        template=set_plotly_theme(),
+        title=f'원자재-시장 지표 상관계수 ({TRANSFORMS[transform]}, 시차 {lag}분기)'
+    )
+    st.plotly_chart(fig_corr, use_container_width=True)
+    
+    # 원자재-지표 쌍별 가장 강한 상관관계
+    best_lags, best_values = correlations.strongest()
+    strongest = pd.DataFrame({
+        '원자재': np.repeat(correlations.materials, len(correlations.indicators)),
+        '시장 지표': np.tile(correlations.indicators, len(correlations.materials)),
+        '시차(분기)': best_lags.ravel(),
+        '상관계수': best_values.ravel()
+    })
+    strongest = strongest[np.repeat(corr_mask, len(correlations.indicators))]
+    strongest = strongest.reindex(strongest['상관계수'].abs().sort_values(ascending=False).index)
+    with st.expander("쌍별 가장 강한 상관관계"):
+        st.dataframe(strongest.round(3), hide_index=True, use_container_width=True)
+
+if __name__ == "__main__":
+    show_raw_materials()
@@ -1,14 +1,22 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import json
 import os
 import sys
 import plotly.express as px
 import plotly.graph_objects as go
 from st_cytoscape import cytoscape
 from st_aggrid import AgGrid, GridOptionsBuilder, JsCode
-from utils.data_utils import load_semiconductor_data
+from data_store import load_dataset, dataset_version
+from figure_cache import cached_figure
+from downsample import dense_trace
+from grid_paging import server_side_controls
+from lazy_sections import render_sections
+from production_cube import get_production_cube
+from supply_chain_graph import get_supply_chain_graph, get_layout
+from supply_chain_analytics import get_bottleneck_report
+from perf import stage, timed
+from static_content import get_fragment
 from utils.visualization_utils import (
     create_line_chart, 
     create_bar_chart, 
@@ -22,7 +30,13 @@ from utils.visualization_utils import (
 # 상위 디렉토리 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 필터 없이 한 번에 표시할 최대 노드 수 (넘으면 연결 수가 많은 노드만 표시)
+MAX_RENDER_NODES = int(os.environ.get('SUPPLY_CHAIN_MAX_NODES', '500'))
+
 def create_supply_chain_elements():
+    """
+    기본 공급망 요소 목록을 반환하는 함수 (공급망 데이터 파일이 없을 때 사용)
+    """
     nodes = [
         # 제조사
         {"data": {"id": "삼성전자", "label": "삼성전자", "type": "제조사"}},
@@ -54,18 +68,26 @@ def create_supply_chain_elements():
     
     return nodes + edges
 
-def show_aggrid(df, key=None):
+@timed('grid')
+def show_aggrid(df, key=None, server_side=False, page_size=10):
     """
     AgGrid를 사용하여 데이터프레임을 표시하는 함수
+
+    server_side=True이면 정렬/필터/페이지 처리를 서버에서 수행하고
+    현재 페이지 행만 AgGrid로 전송합니다.
     """
+    if server_side:
+        df = server_side_controls(df, key, page_size=page_size)
+    
     gb = GridOptionsBuilder.from_dataframe(df)
-    gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=10)
+    if not server_side:
+        gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=page_size)
     gb.configure_side_bar()
     gb.configure_selection('multiple', use_checkbox=True, groupSelectsChildren=True)
     gb.configure_default_column(groupable=True, value=True, enableRowGroup=True, aggFunc='sum', editable=False)
     
     # 숫자 형식 지정
-    for col in df.select_dtypes(include=['float64']).columns:
+    for col in df.select_dtypes(include='floating').columns:
         gb.configure_column(col, type=["numericColumn", "numberColumnFilter"], precision=2)
     
     grid_options = gb.build()
@@ -74,7 +96,7 @@ def show_aggrid(df, key=None):
         df,
         gridOptions=grid_options,
         data_return_mode='AS_INPUT',
-        update_mode='MODEL_CHANGED',
+        update_mode='NO_UPDATE' if server_side else 'MODEL_CHANGED',
         fit_columns_on_grid_load=True,
         theme='streamlit',
         enable_enterprise_modules=False,
@@ -83,6 +105,127 @@ def show_aggrid(df, key=None):
         key=key
     )
 
+def build_sales_figure(filtered_data, selected_year, theme):
+    """
+    제조사별 판매액 막대 차트를 생성하는 함수
+    """
+    fig_sales = px.bar(
+        filtered_data,
+        x='Company',
+        y='Sales_Volume',
+        color='Model',
+        title=f'{selected_year}년 제조사별 판매액',
+        template=theme,
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig_sales.update_layout(
+        xaxis_title="제조사",
+        yaxis_title="판매액 (억원)",
+    )
+    # 판매량을 억원 단위로 표시
+    fig_sales.update_traces(
+        hovertemplate="제조사: %{x}<br>모델: %{fullData.name}<br>판매액: %{y:.0f}억원"
+    )
+    # y축 값에 100을 곱해서 억원 단위로 표시
+    fig_sales.update_yaxes(tickprefix="", ticksuffix="억원")
+    fig_sales.update_layout(yaxis=dict(tickformat=",d"))
+    
+    return fig_sales
+
+def build_share_figure(filtered_data, selected_year, theme):
+    """
+    시장 점유율 파이 차트를 생성하는 함수
+    """
+    fig_share = px.pie(
+        filtered_data,
+        values='Market_Share',
+        names='Company',
+        title=f'{selected_year}년 시장 점유율',
+        template=theme,
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig_share.update_traces(
+        textinfo='percent+label',
+        hovertemplate="회사: %{label}<br>점유율: %{percent}<br>매출액: %{value:.1f}%"
+    )
+    
+    return fig_share
+
+def build_production_figure(filtered_data, selected_year, selected_model, theme):
+    """
+    월별 생산액 막대 차트를 생성하는 함수
+    """
+    fig_production = px.bar(
+        filtered_data,
+        x='Month',
+        y='Production_Volume',
+        color='Company',
+        title=f'{selected_year}년 {selected_model} 월별 생산액',
+        template=theme,
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    
+    # x축을 1월부터 12월까지 표시
+    fig_production.update_layout(
+        xaxis=dict(
+            tickmode='array',
+            tickvals=list(range(1, 13)),
+            ticktext=[f"{i}월" for i in range(1, 13)]
+        ),
+        xaxis_title="월",
+        yaxis_title="생산액 (억원)",
+    )
+    
+    # 생산량을 억원 단위로 표시
+    fig_production.update_traces(
+        hovertemplate="월: %{x}월<br>기업: %{fullData.name}<br>생산액: %{y:.0f}억원"
+    )
+    # y축 값에 100을 곱해서 억원 단위로 표시
+    fig_production.update_yaxes(tickprefix="", ticksuffix="억원")
+    fig_production.update_layout(yaxis=dict(tickformat=",d"))
+    
+    return fig_production
+
+def build_efficiency_figure(production_cube, selected_year, selected_model, theme):
+    """
+    기업별 생산 효율성 라인 차트를 생성하는 함수
+    """
+    fig_efficiency = go.Figure()
+    
+    # 포인트가 많은 트레이스는 WebGL + 다운샘플링으로 전환
+    for company, months, efficiency in production_cube.efficiency_traces(selected_year, selected_model):
+        fig_efficiency.add_trace(
+            dense_trace(
+                months,
+                efficiency,
+                company,
+                mode='lines+markers'
+            )
+        )
+    
+    # x축을 1월부터 12월까지 표시
+    fig_efficiency.update_layout(
+        xaxis=dict(
+            tickmode='array',
+            tickvals=list(range(1, 13)),
+            ticktext=[f"{i}월" for i in range(1, 13)]
+        ),
+        title=f'{selected_year}년 {selected_model} 생산 효율성',
+        template=theme,
+        showlegend=True,
+        xaxis_title="월",
+        yaxis_title="생산 효율성 (%)",
+    )
+    
+    # 효율성을 퍼센트로 표시
+    fig_efficiency.update_traces(
+        hovertemplate="월: %{x}월<br>기업: %{fullData.name}<br>효율성: %{y:.1f}%"
+    )
+    fig_efficiency.update_yaxes(ticksuffix="%")
+    
+    return fig_efficiency
+
+@timed()
 def show_semiconductor_industry(section="sales"):
     """
     반도체 산업 데이터를 표시하는 함수
@@ -90,76 +233,59 @@ def show_semiconductor_industry(section="sales"):
     try:
         if section == "sales":
             # 판매 현황 데이터 로드
-            sales_data = load_semiconductor_data('semiconductor_sales.csv')
+            sales_data = load_dataset('semiconductor_sales.csv')
+            sales_version = dataset_version('semiconductor_sales.csv')
+            theme = set_plotly_theme()
             
             # 연도 선택
             years = sorted(sales_data['Year'].unique())
             selected_year = st.selectbox('연도 선택', years, key='sales_year')
             
             # 필터링된 데이터
-            filtered_data = sales_data[sales_data['Year'] == selected_year]
+            with stage('filter'):
+                filtered_data = sales_data[sales_data['Year'] == selected_year]
             
             # 데이터 테이블 표시 (AgGrid 사용)
             st.subheader(f"{selected_year}년 반도체 판매 데이터")
             
-            # 데이터 단위 변환 (억원 단위로 통일)
-            display_data = filtered_data.copy()
-            display_data['Sales_Volume'] = display_data['Sales_Volume'] * 100  # 백만 개 -> 억원 단위로 변환
-            display_data.rename(columns={
-                'Company': '기업명',
-                'Model': '모델',
-                'Sales_Volume': '판매액(억원)',
-                'Market_Share': '시장점유율(%)'
-            }, inplace=True)
+            # 데이터 단위 변환 (억원 단위로 통일, 변환한 컬럼 외에는 복사하지 않음)
+            with stage('aggregate'):
+                display_data = pd.DataFrame({
+                    'Year': filtered_data['Year'],
+                    '기업명': filtered_data['Company'],
+                    '모델': filtered_data['Model'],
+                    '판매액(억원)': filtered_data['Sales_Volume'] * 100,  # 백만 개 -> 억원 단위로 변환
+                    '시장점유율(%)': filtered_data['Market_Share']
+                }, copy=False)
             
             show_aggrid(display_data, key='sales_table')
             
             # 판매량 차트
-            fig_sales = px.bar(
-                filtered_data,
-                x='Company',
-                y='Sales_Volume',
-                color='Model',
-                title=f'{selected_year}년 제조사별 판매액',
-                template=set_plotly_theme(),
-                color_discrete_sequence=px.colors.qualitative.Set3
+            fig_sales = cached_figure(
+                'sales', sales_version, (selected_year,), theme,
+                lambda: build_sales_figure(filtered_data, selected_year, theme)
             )
-            fig_sales.update_layout(
-                xaxis_title="제조사",
-                yaxis_title="판매액 (억원)",
-            )
-            # 판매량을 억원 단위로 표시
-            fig_sales.update_traces(
-                hovertemplate="제조사: %{x}<br>모델: %{fullData.name}<br>판매액: %{y:.0f}억원"
-            )
-            # y축 값에 100을 곱해서 억원 단위로 표시
-            fig_sales.update_yaxes(tickprefix="", ticksuffix="억원")
-            fig_sales.update_layout(yaxis=dict(tickformat=",d"))
             
             st.plotly_chart(fig_sales, use_container_width=True)
             
             # 점유율 파이 차트
-            fig_share = px.pie(
-                filtered_data,
-                values='Market_Share',
-                names='Company',
-                title=f'{selected_year}년 시장 점유율',
-                template=set_plotly_theme(),
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            fig_share.update_traces(
-                textinfo='percent+label',
-                hovertemplate="회사: %{label}<br>점유율: %{percent}<br>매출액: %{value:.1f}%"
+            fig_share = cached_figure(
+                'share', sales_version, (selected_year,), theme,
+                lambda: build_share_figure(filtered_data, selected_year, theme)
             )
+            
             st.plotly_chart(fig_share, use_container_width=True)
             
         elif section == "production":
-            # 생산 현황 데이터 로드
-            production_data = load_semiconductor_data('semiconductor_production.csv')
+            # 생산 현황 데이터 로드 (데이터 버전별로 미리 집계된 큐브)
+            with stage('aggregate'):
+                production_cube = get_production_cube()
+            production_version = dataset_version('semiconductor_production.csv')
+            theme = set_plotly_theme()
             
             # 연도 및 모델 선택
-            years = sorted(production_data['Year'].unique())
-            models = sorted(production_data['Model'].unique())
+            years = list(production_cube.years)
+            models = list(production_cube.models)
             
             col1, col2 = st.columns(2)
             with col1:
@@ -167,98 +293,45 @@ def show_semiconductor_industry(section="sales"):
             with col2:
                 selected_model = st.selectbox('모델 선택', models, key='prod_model')
             
-            # 필터링된 데이터
-            filtered_data = production_data[
-                (production_data['Year'] == selected_year) &
-                (production_data['Model'] == selected_model)
-            ]
+            # 필터링된 데이터 (큐브 슬라이스)
+            with stage('filter'):
+                filtered_data = production_cube.to_frame(selected_year, selected_model)
             
             # 데이터 테이블 표시 (AgGrid 사용)
             st.subheader(f"{selected_year}년 {selected_model} 생산 데이터")
             
-            # 데이터 단위 변환 (억원 단위로 통일)
-            display_data = filtered_data.copy()
-            display_data['Production_Volume'] = display_data['Production_Volume'] * 100  # 백만 개 -> 억원 단위로 변환
-            display_data.rename(columns={
-                'Company': '기업명',
-                'Month': '월',
-                'Production_Volume': '생산액(억원)',
-                'Efficiency': '효율성(%)'
-            }, inplace=True)
+            # 데이터 단위 변환 (억원 단위로 통일, 변환한 컬럼 외에는 복사하지 않음)
+            display_data = pd.DataFrame({
+                'Year': filtered_data['Year'],
+                '월': filtered_data['Month'],
+                '기업명': filtered_data['Company'],
+                'Model': filtered_data['Model'],
+                '생산액(억원)': filtered_data['Production_Volume'] * 100,  # 백만 개 -> 억원 단위로 변환
+                '효율성(%)': filtered_data['Efficiency']
+            }, copy=False)
             
-            show_aggrid(display_data, key='production_table')
+            show_aggrid(display_data, key='production_table', server_side=True)
             
             # 생산량 차트
-            fig_production = px.bar(
-                filtered_data,
-                x='Month',
-                y='Production_Volume',
-                color='Company',
-                title=f'{selected_year}년 {selected_model} 월별 생산액',
-                template=set_plotly_theme(),
-                color_discrete_sequence=px.colors.qualitative.Set3
+            fig_production = cached_figure(
+                'production', production_version, (selected_year, selected_model), theme,
+                lambda: build_production_figure(filtered_data, selected_year, selected_model, theme)
             )
             
-            # x축을 1월부터 12월까지 표시
-            fig_production.update_layout(
-                xaxis=dict(
-                    tickmode='array',
-                    tickvals=list(range(1, 13)),
-                    ticktext=[f"{i}월" for i in range(1, 13)]
-                ),
-                xaxis_title="월",
-                yaxis_title="생산액 (억원)",
-            )
-            
-            # 생산량을 억원 단위로 표시
-            fig_production.update_traces(
-                hovertemplate="월: %{x}월<br>기업: %{fullData.name}<br>생산액: %{y:.0f}억원"
-            )
-            # y축 값에 100을 곱해서 억원 단위로 표시
-            fig_production.update_yaxes(tickprefix="", ticksuffix="억원")
-            fig_production.update_layout(yaxis=dict(tickformat=",d"))
-            
             st.plotly_chart(fig_production, use_container_width=True)
             
             # 생산 효율성 라인 차트
-            fig_efficiency = go.Figure()
-            
-            for company in filtered_data['Company'].unique():
-                company_data = filtered_data[filtered_data['Company'] == company]
-                fig_efficiency.add_trace(
-                    go.Scatter(
-                        x=company_data['Month'],
-                        y=company_data['Efficiency'],
-                        name=company,
-                        mode='lines+markers'
-                    )
-                )
-            
-            # x축을 1월부터 12월까지 표시
-            fig_efficiency.update_layout(
-                xaxis=dict(
-                    tickmode='array',
-                    tickvals=list(range(1, 13)),
-                    ticktext=[f"{i}월" for i in range(1, 13)]
-                ),
-                title=f'{selected_year}년 {selected_model} 생산 효율성',
-                template=set_plotly_theme(),
-                showlegend=True,
-                xaxis_title="월",
-                yaxis_title="생산 효율성 (%)",
+            fig_efficiency = cached_figure(
+                'efficiency', production_version, (selected_year, selected_model), theme,
+                lambda: build_efficiency_figure(production_cube, selected_year, selected_model, theme)
             )
             
-            # 효율성을 퍼센트로 표시
-            fig_efficiency.update_traces(
-                hovertemplate="월: %{x}월<br>기업: %{fullData.name}<br>효율성: %{y:.1f}%"
-            )
-            fig_efficiency.update_yaxes(ticksuffix="%")
-            
             st.plotly_chart(fig_efficiency, use_container_width=True)
             
     except Exception as e:
         st.error(f'데이터를 불러오는 중 오류가 발생했습니다: {str(e)}')
 
+@timed()
 def show_supply_chain():
     """
     반도체 산업 공급망을 시각화하는 함수
@@ -342,18 +415,43 @@ def show_supply_chain():
         "힘 기반 레이아웃": "cose"
     }
     
-    selected_layout = st.selectbox(
-        "레이아웃 선택",
-        options=list(layout_options.keys()),
-        key="supply_chain_layout"
-    )
+    # 공급망 그래프 (데이터 버전별로 한 번만 생성)
+    fallback_elements = create_supply_chain_elements()
+    graph = get_supply_chain_graph(fallback_elements)
+    
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        selected_layout = st.selectbox(
+            "레이아웃 선택",
+            options=list(layout_options.keys()),
+            key="supply_chain_layout"
+        )
+    with col2:
+        focus_company = st.selectbox(
+            "기업 중심 보기",
+            ["(전체)"] + sorted(graph.labels.tolist()),
+            key="supply_chain_focus"
+        )
+    with col3:
+        ego_radius = st.number_input("연결 단계", min_value=1, max_value=3, value=1, key="supply_chain_radius")
+    
+    # 레이아웃 좌표는 서버에서 그래프 버전/레이아웃별로 한 번만 계산 (브라우저는 preset으로 배치만 수행)
+    with stage('aggregate'):
+        positions = get_layout(layout_options[selected_layout], fallback_elements)
+        if focus_company == "(전체)":
+            node_idx = np.arange(graph.n)
+            if graph.n > MAX_RENDER_NODES:
+                node_idx = np.sort(np.argsort(-graph.degree(), kind='stable')[:MAX_RENDER_NODES])
+                st.caption(f"전체 {graph.n:,}개 기업 중 연결 수 상위 {MAX_RENDER_NODES:,}개만 표시합니다. 기업을 선택하면 주변 공급망을 볼 수 있습니다.")
+        else:
+            node_idx = graph.ego_network(graph.ids[graph.labels == focus_company][0], radius=ego_radius)
+        elements = graph.elements(node_idx, positions)
     
     # Cytoscape 그래프 표시
-    elements = create_supply_chain_elements()
     cytoscape(
         elements=elements,
         stylesheet=stylesheet,
-        layout={"name": layout_options[selected_layout]},
+        layout={"name": "preset", "fit": True},
         height="600px"
     )
     
@@ -404,6 +502,48 @@ def show_supply_chain():
     # 공급망 분석 인사이트
     st.markdown("### 공급망 분석 인사이트")
     
+    # 병목 분석 (그래프 버전별로 한 번만 계산)
+    with stage('aggregate'):
+        report = get_bottleneck_report(fallback_elements)
+    table = report.table
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**매개 중심성 상위 기업**")
+        st.dataframe(
+            table.nlargest(10, '매개 중심성')[['기업', '유형', '매개 중심성', '공급하는 기업 수 중심성']].round(3),
+            hide_index=True,
+            use_container_width=True
+        )
+    with col2:
+        st.markdown("**단일 장애점 (장애 시 공급이 끊기는 기업이 있는 공급사)**")
+        spof_table = table[table['장애 시 공급 단절 기업 수'] > 0]
+        if spof_table.empty:
+            st.caption("단일 공급사에 의존하는 기업이 없습니다.")
+        else:
+            st.dataframe(
+                spof_table.nlargest(10, '장애 시 공급 단절 기업 수')[['기업', '유형', '장애 시 공급 단절 기업 수']],
+                hide_index=True,
+                use_container_width=True
+            )
+    
+    if len(report.articulation):
+        cut_labels = graph.labels[report.articulation]
+        st.caption(f"단절점 (제거 시 공급망이 분리되는 기업) {len(cut_labels):,}곳: {', '.join(cut_labels[:20])}"
+                   + (" 외" if len(cut_labels) > 20 else ""))
+    
+    # 공급사 장애 시나리오
+    suppliers = sorted(graph.labels[np.diff(graph.out_indptr) > 0].tolist())
+    if suppliers:
+        failed_company = st.selectbox("장애 발생 공급사", suppliers, key="supply_chain_failure")
+        reach, cut_off = report.what_if(graph.ids[graph.labels == failed_company][0])
+        st.markdown(
+            f"**{failed_company}** 장애 시 하류 영향 기업 **{len(reach):,}곳**, "
+            f"공급이 완전히 끊기는 기업 **{len(cut_off):,}곳**"
+        )
+        if len(cut_off):
+            st.caption("공급 단절 기업: " + ', '.join(cut_off[:50]) + (" 외" if len(cut_off) > 50 else ""))
+    
     with st.expander("주요 인사이트 보기"):
         st.markdown("""
         1. **장비사 의존성**: 첨단 반도체 제조에 필수적인 EUV 장비는 ASML이 독점하고 있어, 모든 주요 제조사가 ASML에 의존하는 구조입니다.
@@ -415,88 +555,53 @@ def show_supply_chain():
         4. **병목 현상**: 특정 장비나 소재의 공급 부족은 전체 산업에 병목 현상을 일으킬 수 있으며, 이는 최근 글로벌 반도체 부족 사태의 원인 중 하나입니다.
         """)
 
-def show_semiconductor_industry_main():
+@timed()
+def show_semiconductor_swot():
+    """
+    반도체 산업 SWOT 분석을 표시하는 함수 (미리 변환한 HTML 조각 하나로 표시)
+    """
+    try:
+        industry_fragment = get_fragment('swot_analysis')
+        company_fragment = get_fragment('swot_semiconductor')
+        
+        if industry_fragment is None and company_fragment is None:
+            return
+        
+        st.markdown("---")
+        st.header("SWOT 분석")
+        
+        if industry_fragment is not None:
+            st.markdown(industry_fragment, unsafe_allow_html=True)
+        
+        # 한국 반도체 기업 관점의 SWOT 분석
+        if company_fragment is not None:
+            st.subheader("한국 반도체 기업 SWOT 분석")
+            st.markdown(company_fragment, unsafe_allow_html=True)
+    
+    except Exception as e:
+        st.warning(f"SWOT 분석 데이터를 불러오는 중 오류가 발생했습니다: {str(e)}")
+
+@timed()
+def show_semiconductor_industry_main(lazy=True):
     """
     반도체 산업 동향을 표시하는 함수
+
+    lazy=True이면 선택된 섹션(판매/생산/SWOT)만 데이터 로드와 차트 생성을 수행합니다.
     """
     st.title("반도체 산업 동향")
     
-    # 탭 생성
-    tabs = st.tabs(["판매 현황", "생산 현황"])
-    
-    # 판매 현황 탭
-    with tabs[0]:
-        show_semiconductor_industry("sales")
+    sections = {
+        "판매 현황": lambda: show_semiconductor_industry("sales"),
+        "생산 현황": lambda: show_semiconductor_industry("production"),
+    }
+    if lazy:
+        sections["SWOT 분석"] = show_semiconductor_swot
     
-    # 생산 현황 탭
-    with tabs[1]:
-        show_semiconductor_industry("production")
+    render_sections(sections, key='semiconductor_section', lazy=lazy)
     
     # SWOT 분석 표시
-    try:
-        # SWOT 분석 데이터 로드
-        swot_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'swot_analysis.json')
-        
-        if os.path.exists(swot_file):
-            with open(swot_file, 'r', encoding='utf-8') as f:
-                swot_data = json.load(f)
-            
-            st.markdown("---")
-            st.header("SWOT 분석")
-            
-            # 반도체 산업 SWOT 분석
-            if "반도체 산업 SWOT 분석" in swot_data:
-                st.subheader("반도체 산업 SWOT 분석")
-                
-                swot = swot_data["반도체 산업 SWOT 분석"]
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("#### 강점 (Strengths)")
-                    for item in swot["strengths"]:
-                        st.markdown(f"- {item}")
-                    
-                    st.markdown("#### 약점 (Weaknesses)")
-                    for item in swot["weaknesses"]:
-                        st.markdown(f"- {item}")
-                
-                with col2:
-                    st.markdown("#### 기회 (Opportunities)")
-                    for item in swot["opportunities"]:
-                        st.markdown(f"- {item}")
-                    
-                    st.markdown("#### 위협 (Threats)")
-                    for item in swot["threats"]:
-                        st.markdown(f"- {item}")
-            
-            # 트럼프 2기 가정 시나리오 SWOT 분석
-            if "트럼프 2기 가정 시나리오 SWOT 분석" in swot_data:
-                st.markdown("---")
-                st.subheader("트럼프 2기 가정 시나리오 SWOT 분석")
-                
-                swot = swot_data["트럼프 2기 가정 시나리오 SWOT 분석"]
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("#### 강점 (Strengths)")
-                    for item in swot["strengths"]:
-                        st.markdown(f"- {item}")
-                    
-                    st.markdown("#### 약점 (Weaknesses)")
-                    for item in swot["weaknesses"]:
-                        st.markdown(f"- {item}")
-                
-                with col2:
-                    st.markdown("#### 기회 (Opportunities)")
-                    for item in swot["opportunities"]:
-                        st.markdown(f"- {item}")
-                    
-                    st.markdown("#### 위협 (Threats)")
-                    for item in swot["threats"]:
-                        st.markdown(f"- {item}")
-    
-    except Exception as e:
-        st.warning(f"SWOT 분석 데이터를 불러오는 중 오류가 발생했습니다: {str(e)}")
+    if not lazy:
+        show_semiconductor_swot()
 
 if __name__ == "__main__":
     show_semiconductor_industry_main() 
\ No newline at end of file
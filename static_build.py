@@ -0,0 +1,189 @@
+"""
+정적 콘텐츠(SWOT 분석, 데이터 출처) HTML 조각 빌드
+
+JSON 원본을 HTML 조각으로 변환해 데이터 디렉토리의 .static에 저장합니다.
+조각 파일 이름에 원본 내용의 해시가 들어가므로 내용이 바뀔 때만 다시 만들어집니다.
+streamlit 없이 동작하므로 백그라운드 갱신 작업기와 CLI에서 사용합니다.
+
+    python static_build.py            # 데이터 디렉토리의 .static에 조각 저장
+    python static_build.py --check    # 저장하지 않고 조각 크기만 출력
+"""
+import os
+import json
+import html
+import hashlib
+import argparse
+import threading
+
+from data_store import DATA_DIR
+
+# 미리 빌드한 조각을 저장할 디렉토리 (데이터 디렉토리 아래)
+STATIC_DIR_NAME = '.static'
+
+SWOT_HEADINGS = (
+    ('strengths', '강점 (Strengths)', '#2563EB'),
+    ('weaknesses', '약점 (Weaknesses)', '#DC2626'),
+    ('opportunities', '기회 (Opportunities)', '#16A34A'),
+    ('threats', '위협 (Threats)', '#D97706'),
+)
+
+# 카테고리 목록 순서대로 사용할 SWOT 색상
+SWOT_COLORS = tuple(color for _, _, color in SWOT_HEADINGS)
+
+
+def _text(value):
+    """HTML 이스케이프 (st.markdown의 수식 표기로 해석되지 않도록 $도 변환)"""
+    return html.escape(str(value)).replace('$', '&#36;')
+
+
+def _swot_grid(quadrants):
+    """(제목, 색상, 항목 목록) 4개를 2열 격자로 변환하는 함수"""
+    cells = []
+    for title, color, items in quadrants:
+        entries = ''.join(f"<li>{_text(item)}</li>" for item in items)
+        cells.append(
+            f"<div style='border-top: 3px solid {color}; padding: 0.75rem 1rem; background: #F8FAFC; border-radius: 0.5rem;'>"
+            f"<h4 style='margin: 0 0 0.5rem; color: {color};'>{_text(title)}</h4>"
+            f"<ul style='margin: 0; padding-left: 1.25rem; line-height: 1.6;'>{entries}</ul>"
+            f"</div>"
+        )
+    return (
+        "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 1rem; margin-bottom: 1.5rem;'>"
+        + ''.join(cells) + "</div>"
+    )
+
+
+def render_swot_scenarios(data):
+    """{시나리오 이름: {strengths, weaknesses, opportunities, threats}} 형식을 HTML로 변환하는 함수"""
+    sections = []
+    for name, swot in data.items():
+        quadrants = [(title, color, swot.get(key, [])) for key, title, color in SWOT_HEADINGS]
+        sections.append(f"<h3>{_text(name)}</h3>" + _swot_grid(quadrants))
+    return '<hr>'.join(sections)
+
+
+def render_swot_table(data):
+    """{category: [...], content: [[...], ...]} 형식을 HTML로 변환하는 함수"""
+    quadrants = [
+        (title, SWOT_COLORS[i % len(SWOT_COLORS)], items)
+        for i, (title, items) in enumerate(zip(data['category'], data['content']))
+    ]
+    return _swot_grid(quadrants)
+
+
+def render_data_sources(data):
+    """데이터 출처 정보(시장/기업 보고서, 방법론, 유의사항)를 HTML로 변환하는 함수"""
+    market = ''.join(
+        f"<li><strong>{_text(r['name'])}</strong> ({_text(r['year'])})"
+        f"<ul><li>발행: {_text(r['publisher'])}</li><li>설명: {_text(r['description'])}</li></ul></li>"
+        for r in data.get('market_reports', [])
+    )
+    company = ''.join(
+        f"<li><strong>{_text(r['name'])}</strong> ({_text(min(r['years']))}~{_text(max(r['years']))})"
+        f"<ul><li>기업: {_text(r['company'])}</li><li>유형: {_text(r['type'])}</li></ul></li>"
+        for r in data.get('company_reports', [])
+    )
+    methodology = data.get('methodology', {})
+    methods = ''.join(
+        f"<li>{_text(methodology[key])}</li>"
+        for key in ('data_collection', 'forecast', 'verification') if key in methodology
+    )
+
+    parts = [
+        f"<h3>시장 보고서</h3><ul>{market}</ul>",
+        f"<h3>기업 보고서</h3><ul>{company}</ul>",
+        f"<h3>데이터 수집 방법론</h3><ul>{methods}</ul>",
+    ]
+    if 'disclaimer' in methodology:
+        parts.append(
+            "<div style='padding: 1rem; border-radius: 0.5rem; background: #FFFBEB; color: #92400E; border: 1px solid #FDE68A;'>"
+            f"⚠️ {_text(methodology['disclaimer'])}</div>"
+        )
+    return ''.join(parts)
+
+
+# 조각 이름: (원본 JSON 파일, 변환 함수)
+STATIC_SOURCES = {
+    'swot_analysis': ('swot_analysis.json', render_swot_scenarios),
+    'swot_construction': ('swot_construction.json', render_swot_table),
+    'swot_semiconductor': ('swot_semiconductor.json', render_swot_table),
+    'data_sources': ('data_sources.json', render_data_sources),
+}
+
+_digest_lock = threading.Lock()
+# (파일 경로, 수정 시각, 크기) -> 내용 해시 (변경되지 않은 파일은 다시 읽지 않음)
+_digest_cache = {}
+
+
+def content_digest(path):
+    """파일 내용의 SHA-1 해시를 반환하는 함수 (수정 시각과 크기가 같으면 이전 값 사용)"""
+    stat = os.stat(path)
+    signature = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _digest_lock:
+        digest = _digest_cache.get(signature)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        with _digest_lock:
+            _digest_cache[signature] = digest
+    return digest
+
+
+def static_path(name, digest, data_dir=None):
+    """미리 빌드한 조각 파일 경로를 반환하는 함수"""
+    return os.path.join(data_dir or DATA_DIR, STATIC_DIR_NAME, f"{name}-{digest[:16]}.html")
+
+
+def build_fragment(name, path):
+    """JSON 원본을 읽어 HTML 조각으로 변환하는 함수"""
+    _, renderer = STATIC_SOURCES[name]
+    with open(path, 'r', encoding='utf-8') as f:
+        return renderer(json.load(f))
+
+
+def build_static(data_dir=None):
+    """
+    데이터 디렉토리의 JSON 원본을 모두 조각 파일로 저장하고 경로 목록을 반환하는 함수
+
+    파일 이름에 내용 해시가 들어가므로 원본이 바뀌지 않은 조각은 다시 만들지 않고,
+    이전 해시의 조각 파일은 삭제합니다.
+    """
+    data_dir = data_dir or DATA_DIR
+    output_dir = os.path.join(data_dir, STATIC_DIR_NAME)
+    os.makedirs(output_dir, exist_ok=True)
+
+    built = []
+    for name, (filename, _) in STATIC_SOURCES.items():
+        path = os.path.join(data_dir, filename)
+        if not os.path.exists(path):
+            continue
+        target = static_path(name, content_digest(path), data_dir)
+        if not os.path.exists(target):
+            tmp_target = target + '.tmp'
+            with open(tmp_target, 'w', encoding='utf-8') as f:
+                f.write(build_fragment(name, path))
+            os.replace(tmp_target, target)
+            built.append(target)
+
+        for stale in os.listdir(output_dir):
+            if stale.startswith(name + '-') and stale.endswith('.html') and stale != os.path.basename(target):
+                os.remove(os.path.join(output_dir, stale))
+    return built
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="정적 콘텐츠 HTML 조각 빌드")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="JSON 원본이 있는 데이터 디렉토리")
+    parser.add_argument('--check', action='store_true', help="저장하지 않고 조각 크기만 출력")
+    args = parser.parse_args()
+
+    if args.check:
+        for name, (filename, _) in STATIC_SOURCES.items():
+            path = os.path.join(args.data_dir, filename)
+            if os.path.exists(path):
+                print(f"{name}: {len(build_fragment(name, path)):,} 글자")
+            else:
+                print(f"{name}: 원본 없음 ({filename})")
+    else:
+        for path in build_static(args.data_dir):
+            print(f"빌드 완료: {path}")
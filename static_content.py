@@ -0,0 +1,59 @@
+"""
+정적 콘텐츠(SWOT 분석, 데이터 출처) HTML 조각 표시
+
+static_build.py로 변환한 HTML 조각을 st.markdown 한 번으로 표시합니다.
+조각은 원본 파일 내용의 해시로 캐시하므로 내용이 바뀔 때만 다시 만들어집니다.
+"""
+import os
+import threading
+
+import streamlit as st
+
+from data_store import data_path
+from static_build import STATIC_SOURCES, build_fragment, content_digest, static_path
+
+_fragment_lock = threading.Lock()
+# (조각 이름, 내용 해시) -> HTML
+_fragment_cache = {}
+
+
+def get_fragment(name):
+    """
+    현재 데이터의 HTML 조각을 반환하는 함수 (원본 파일이 없으면 None)
+
+    메모리 캐시 -> 미리 빌드한 .static 파일 -> 직접 변환 순서로 찾습니다.
+    """
+    filename, _ = STATIC_SOURCES[name]
+    path = data_path(filename)
+    if not os.path.exists(path):
+        return None
+
+    digest = content_digest(path)
+    key = (name, digest)
+    with _fragment_lock:
+        fragment = _fragment_cache.get(key)
+    if fragment is not None:
+        return fragment
+
+    prebuilt = static_path(name, digest, os.path.dirname(path))
+    if os.path.exists(prebuilt):
+        with open(prebuilt, 'r', encoding='utf-8') as f:
+            fragment = f.read()
+    else:
+        fragment = build_fragment(name, path)
+
+    with _fragment_lock:
+        # 같은 조각의 이전 버전은 버림
+        for stale in [k for k in _fragment_cache if k[0] == name]:
+            del _fragment_cache[stale]
+        _fragment_cache[key] = fragment
+    return fragment
+
+
+def render_fragment(name):
+    """HTML 조각을 하나의 st.markdown 요소로 표시하고 표시 여부를 반환하는 함수"""
+    fragment = get_fragment(name)
+    if fragment is None:
+        return False
+    st.markdown(fragment, unsafe_allow_html=True)
+    return True
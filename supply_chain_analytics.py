@@ -0,0 +1,236 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from supply_chain_graph import get_supply_chain_graph, graph_version, gather_rows
+
+# 매개 중심성 계산에 사용할 출발 노드 수 (노드가 이보다 적으면 정확히 계산)
+BETWEENNESS_SAMPLES = int(os.environ.get('BETWEENNESS_SAMPLES', '128'))
+
+
+def degree_centrality(graph):
+    """노드별 (공급 수, 고객 수) 기준 연결 중심성을 반환하는 함수 (n - 1로 정규화)"""
+    scale = 1.0 / max(graph.n - 1, 1)
+    in_degree = np.diff(graph.in_indptr)
+    out_degree = np.diff(graph.out_indptr)
+    return in_degree * scale, out_degree * scale
+
+
+def _single_source_dependency(graph, source):
+    """
+    한 출발 노드에서 Brandes 알고리즘의 의존도(delta)를 계산하는 함수
+
+    BFS를 단계(거리) 단위로 진행하고, 단계별 최단 경로 엣지를 모아 역순으로 누적합니다.
+    단계별 합산은 np.bincount로 한 번에 처리합니다.
+    """
+    n = graph.n
+    dist = np.full(n, -1, dtype=np.int64)
+    sigma = np.zeros(n)
+    dist[source] = 0
+    sigma[source] = 1.0
+
+    frontier = np.array([source], dtype=np.int64)
+    level_edges = []
+    depth = 0
+    while len(frontier):
+        lengths = graph.indptr[frontier + 1] - graph.indptr[frontier]
+        parents = np.repeat(frontier, lengths)
+        children = gather_rows(graph.indptr, graph.indices, frontier)
+
+        child_dist = dist[children]
+        dist[children[child_dist == -1]] = depth + 1
+
+        on_path = (child_dist == -1) | (child_dist == depth + 1)
+        parents, children = parents[on_path], children[on_path]
+        sigma += np.bincount(children, weights=sigma[parents], minlength=n)
+        level_edges.append((parents, children))
+
+        # 다음 단계 노드 (중복 제거에 np.unique 대신 거리 배열을 사용, 노드 수만큼의 비교가 정렬보다 빠름)
+        frontier = np.flatnonzero(dist == depth + 1)
+        depth += 1
+
+    delta = np.zeros(n)
+    for parents, children in reversed(level_edges):
+        delta += np.bincount(parents, weights=sigma[parents] / sigma[children] * (1.0 + delta[children]), minlength=n)
+    delta[source] = 0.0
+    return delta
+
+
+def betweenness_centrality(graph, samples=None, seed=0):
+    """
+    무방향 매개 중심성을 계산하는 함수 ((n - 1)(n - 2) / 2로 정규화)
+
+    노드 수가 samples보다 많으면 seed로 고정해 무작위로 고른 samples개 출발 노드로 추정합니다.
+    """
+    n = graph.n
+    samples = samples or BETWEENNESS_SAMPLES
+    if n < 3:
+        return np.zeros(n)
+
+    if n <= samples:
+        sources = np.arange(n)
+    else:
+        sources = np.random.default_rng(seed).choice(n, samples, replace=False)
+
+    centrality = np.zeros(n)
+    for source in sources:
+        centrality += _single_source_dependency(graph, source)
+
+    # 표본 보정 후, 무방향 그래프에서 각 경로가 양쪽 끝에서 두 번 세어진 것을 보정
+    centrality *= n / len(sources) / 2
+    return centrality / ((n - 1) * (n - 2) / 2)
+
+
+def articulation_points(graph):
+    """
+    제거하면 무방향 그래프가 분리되는 노드(단절점)를 반환하는 함수
+
+    재귀 없이 스택으로 Tarjan 알고리즘을 수행합니다 (반복문이 많아 파이썬 리스트 사용).
+    """
+    n = graph.n
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    order = [-1] * n
+    low = [0] * n
+    parent = [-1] * n
+    is_cut = [False] * n
+    counter = 0
+
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        root_children = 0
+        stack = [(root, indptr[root])]
+        while stack:
+            node, pos = stack[-1]
+            if pos < indptr[node + 1]:
+                stack[-1] = (node, pos + 1)
+                neighbor = indices[pos]
+                if order[neighbor] == -1:
+                    parent[neighbor] = node
+                    order[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    if node == root:
+                        root_children += 1
+                    stack.append((neighbor, indptr[neighbor]))
+                elif neighbor != parent[node]:
+                    low[node] = min(low[node], order[neighbor])
+            else:
+                stack.pop()
+                up = parent[node]
+                if up != -1:
+                    low[up] = min(low[up], low[node])
+                    if up != root and low[node] >= order[up]:
+                        is_cut[up] = True
+        if root_children > 1:
+            is_cut[root] = True
+    return np.flatnonzero(is_cut)
+
+
+def downstream(graph, node):
+    """노드에서 공급 방향(공급사 -> 고객사)으로 도달 가능한 노드 인덱스를 반환하는 함수"""
+    visited = np.zeros(graph.n, dtype=bool)
+    frontier = np.array([node], dtype=np.int64)
+    visited[node] = True
+    while len(frontier):
+        children = gather_rows(graph.out_indptr, graph.out_indices, frontier)
+        frontier = np.unique(children[~visited[children]])
+        visited[frontier] = True
+    visited[node] = False
+    return np.flatnonzero(visited)
+
+
+def failure_cascade(graph, failed_nodes):
+    """
+    공급사 장애가 전파되는 노드를 반환하는 함수
+
+    공급사가 있는 노드의 모든 공급사가 장애 상태가 되면 그 노드도 공급이 끊긴 것으로 보고,
+    더 이상 늘어나지 않을 때까지 반복합니다. 처음 장애 노드는 결과에서 제외됩니다.
+    """
+    in_degree = np.diff(graph.in_indptr)
+    failed = np.zeros(graph.n, dtype=bool)
+    failed_suppliers = np.zeros(graph.n, dtype=np.int64)
+
+    newly_failed = np.unique(np.asarray(failed_nodes, dtype=np.int64))
+    failed[newly_failed] = True
+    while len(newly_failed):
+        customers = gather_rows(graph.out_indptr, graph.out_indices, newly_failed)
+        failed_suppliers += np.bincount(customers, minlength=graph.n)
+        candidates = np.unique(customers)
+        cut_off = candidates[~failed[candidates] & (failed_suppliers[candidates] == in_degree[candidates])]
+        failed[cut_off] = True
+        newly_failed = cut_off
+
+    failed[np.asarray(failed_nodes, dtype=np.int64)] = False
+    return np.flatnonzero(failed)
+
+
+def single_points_of_failure(graph):
+    """
+    장애 시 다른 노드의 공급이 완전히 끊기는 공급사와 영향 노드를 반환하는 함수
+
+    {공급사 인덱스: 공급이 끊기는 노드 인덱스 배열}
+    단일 공급사에 의존하는 노드의 공급사만 후보로 검사합니다.
+    """
+    in_degree = np.diff(graph.in_indptr)
+    sole_customers = np.flatnonzero(in_degree == 1)
+    candidates = np.unique(graph.in_indices[graph.in_indptr[sole_customers]])
+    return {int(node): failure_cascade(graph, [node]) for node in candidates}
+
+
+class BottleneckReport:
+    """공급망 그래프 한 버전의 병목 분석 결과"""
+
+    def __init__(self, graph):
+        self.graph = graph
+        in_centrality, out_centrality = degree_centrality(graph)
+        self.betweenness = betweenness_centrality(graph)
+        self.articulation = articulation_points(graph)
+        self.spof = single_points_of_failure(graph)
+
+        is_cut = np.zeros(graph.n, dtype=bool)
+        is_cut[self.articulation] = True
+        cut_off_counts = np.zeros(graph.n, dtype=np.int64)
+        for node, affected in self.spof.items():
+            cut_off_counts[node] = len(affected)
+
+        self.table = pd.DataFrame({
+            '기업': graph.labels,
+            '유형': graph.types,
+            '공급받는 기업 수 중심성': in_centrality,
+            '공급하는 기업 수 중심성': out_centrality,
+            '매개 중심성': self.betweenness,
+            '단절점': is_cut,
+            '장애 시 공급 단절 기업 수': cut_off_counts,
+        })
+
+    def what_if(self, node_id):
+        """공급사 장애 시 (하류 전체 기업, 공급이 완전히 끊기는 기업) 이름 배열을 반환하는 함수"""
+        node = self.graph.node_index(node_id)
+        if node is None:
+            return np.empty(0, dtype=object), np.empty(0, dtype=object)
+        labels = self.graph.labels
+        return labels[downstream(self.graph, node)], labels[failure_cascade(self.graph, [node])]
+
+
+_report_lock = threading.Lock()
+_report_cache = {}
+
+
+def get_bottleneck_report(fallback_elements=None):
+    """그래프 버전별로 한 번만 계산한 병목 분석 결과를 반환하는 함수"""
+    graph = get_supply_chain_graph(fallback_elements)
+    version = graph_version()
+    with _report_lock:
+        report = _report_cache.get(version)
+    if report is None:
+        report = BottleneckReport(graph)
+        with _report_lock:
+            # 이전 버전 결과는 버림
+            _report_cache.clear()
+            _report_cache[version] = report
+    return report
@@ -0,0 +1,286 @@
+import os
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_store import load_dataset, dataset_version
+
+NODES_FILE = 'supply_chain_nodes.csv'
+EDGES_FILE = 'supply_chain_edges.csv'
+
+# 엣지에만 등장하는 기업의 유형
+UNKNOWN_TYPE = '기타'
+
+# 레이아웃 좌표 간격 (픽셀)
+NODE_SPACING = 120.0
+
+# 힘 기반 레이아웃의 반발력 계산에 사용할 표본 노드 수 (노드가 이보다 적으면 모든 쌍을 계산)
+REPULSION_SAMPLE = int(os.environ.get('LAYOUT_REPULSION_SAMPLE', '512'))
+
+# 반발력 계산 시 한 번에 처리할 (노드 x 표본) 쌍 수 (메모리 사용량 제한)
+PAIR_BLOCK = 2_000_000
+
+
+def gather_rows(indptr, indices, rows):
+    """CSR에서 여러 행의 열 인덱스를 한 번에 모아 반환하는 함수"""
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=indices.dtype)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return indices[offsets + np.arange(total)]
+
+
+def _csr(rows, cols, n):
+    """(행, 열) 쌍으로 CSR (indptr, indices)를 만드는 함수"""
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order]
+
+
+class SupplyChainGraph:
+    """
+    공급망 그래프를 CSR 인접 배열로 보관하는 클래스
+
+    엣지 방향은 공급사 -> 고객사이며, 정방향(out)/역방향(in)/무방향 인접 배열을 함께 보관합니다.
+    """
+
+    def __init__(self, nodes_df, edges_df):
+        ids = nodes_df['id'].astype(str).to_numpy()
+        sources = edges_df['source'].astype(str).to_numpy()
+        targets = edges_df['target'].astype(str).to_numpy()
+
+        # 노드 목록에 없는 기업은 '기타' 유형으로 추가
+        extra = pd.unique(np.concatenate([sources, targets]))
+        extra = extra[~pd.Index(extra).isin(ids)]
+        self.ids = np.concatenate([ids, extra]).astype(object)
+        labels = nodes_df['label'].astype(str).to_numpy() if 'label' in nodes_df.columns else ids
+        types = nodes_df['type'].astype(str).to_numpy() if 'type' in nodes_df.columns else np.full(len(ids), UNKNOWN_TYPE)
+        self.labels = np.concatenate([labels, extra]).astype(object)
+        self.types = np.concatenate([types, np.full(len(extra), UNKNOWN_TYPE, dtype=object)]).astype(object)
+        self.n = len(self.ids)
+        self._position = {node_id: i for i, node_id in enumerate(self.ids)}
+
+        # 자기 자신으로 가는 엣지와 중복 엣지 제거
+        index = pd.Index(self.ids)
+        src = index.get_indexer(sources).astype(np.int64)
+        dst = index.get_indexer(targets).astype(np.int64)
+        keep = src != dst
+        pairs = np.unique(src[keep] * self.n + dst[keep])
+        self.src = pairs // self.n
+        self.dst = pairs % self.n
+
+        self.out_indptr, self.out_indices = _csr(self.src, self.dst, self.n)
+        self.in_indptr, self.in_indices = _csr(self.dst, self.src, self.n)
+        self.indptr, self.indices = _csr(
+            np.concatenate([self.src, self.dst]), np.concatenate([self.dst, self.src]), self.n
+        )
+
+    @classmethod
+    def from_elements(cls, elements):
+        """Cytoscape 요소 목록(노드 + 엣지)으로 그래프를 만드는 함수"""
+        nodes = [e['data'] for e in elements if 'source' not in e['data']]
+        edges = [e['data'] for e in elements if 'source' in e['data']]
+        return cls(
+            pd.DataFrame(nodes, columns=['id', 'label', 'type']),
+            pd.DataFrame(edges, columns=['source', 'target'])
+        )
+
+    @property
+    def edge_count(self):
+        return len(self.src)
+
+    def node_index(self, node_id):
+        """노드 id의 인덱스를 반환하는 함수 (없으면 None)"""
+        return self._position.get(node_id)
+
+    def degree(self):
+        """노드별 (무방향) 연결 수를 반환하는 함수"""
+        return np.diff(self.indptr)
+
+    def ego_network(self, node_id, radius=1):
+        """노드에서 radius 단계 이내에 있는 노드 인덱스를 반환하는 함수 (엣지 방향 무시)"""
+        start = self.node_index(node_id)
+        if start is None:
+            return np.empty(0, dtype=np.int64)
+
+        visited = np.zeros(self.n, dtype=bool)
+        visited[start] = True
+        frontier = np.array([start], dtype=np.int64)
+        for _ in range(radius):
+            neighbors = gather_rows(self.indptr, self.indices, frontier)
+            frontier = np.unique(neighbors[~visited[neighbors]])
+            if len(frontier) == 0:
+                break
+            visited[frontier] = True
+        return np.flatnonzero(visited)
+
+    def elements(self, node_idx=None, positions=None):
+        """
+        Cytoscape 요소 목록을 만드는 함수
+
+        node_idx: 표시할 노드 인덱스 (None이면 전체), positions: (노드 수 x 2) 좌표 배열
+        좌표를 주면 각 노드에 position을 넣어 preset 레이아웃으로 표시할 수 있습니다.
+        """
+        if node_idx is None:
+            node_idx = np.arange(self.n)
+        selected = np.zeros(self.n, dtype=bool)
+        selected[node_idx] = True
+
+        nodes = []
+        for i in node_idx:
+            node = {"data": {"id": self.ids[i], "label": self.labels[i], "type": self.types[i]}}
+            if positions is not None:
+                node["position"] = {"x": float(positions[i, 0]), "y": float(positions[i, 1])}
+            nodes.append(node)
+
+        edge_mask = selected[self.src] & selected[self.dst]
+        edges = [
+            {"data": {"source": self.ids[s], "target": self.ids[t]}}
+            for s, t in zip(self.src[edge_mask], self.dst[edge_mask])
+        ]
+        return nodes + edges
+
+
+def circle_layout(graph):
+    """노드를 원형으로 배치하는 함수"""
+    n = graph.n
+    radius = max(NODE_SPACING, n * NODE_SPACING / (2 * math.pi))
+    angles = 2 * math.pi * np.arange(n) / max(n, 1)
+    return np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+
+
+def grid_layout(graph):
+    """노드를 격자로 배치하는 함수"""
+    columns = max(1, int(math.ceil(math.sqrt(graph.n))))
+    idx = np.arange(graph.n)
+    return np.column_stack([idx % columns, idx // columns]) * NODE_SPACING
+
+
+def concentric_layout(graph):
+    """연결 수가 많은 노드일수록 안쪽 원에 배치하는 함수"""
+    order = np.argsort(-graph.degree(), kind='stable')
+    positions = np.zeros((graph.n, 2))
+    placed = 0
+    ring = 0
+    while placed < graph.n:
+        radius = ring * NODE_SPACING
+        capacity = 1 if ring == 0 else int(2 * math.pi * ring)
+        members = order[placed:placed + capacity]
+        angles = 2 * math.pi * np.arange(len(members)) / len(members)
+        positions[members] = np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+        placed += len(members)
+        ring += 1
+    return positions
+
+
+def force_layout(graph, iterations=100, seed=0):
+    """
+    Fruchterman-Reingold 힘 기반 레이아웃 (브라우저의 cose 대신 서버에서 계산)
+
+    노드가 많으면 반복마다 REPULSION_SAMPLE개 표본 노드와의 반발력만 계산하고
+    전체 노드 수에 맞게 보정합니다.
+    """
+    n = graph.n
+    if n == 0:
+        return np.zeros((0, 2))
+
+    rng = np.random.default_rng(seed)
+    side = math.sqrt(n)
+    positions = rng.uniform(-side / 2, side / 2, (n, 2))
+    temperature = side / 10
+    cooling = temperature / (iterations + 1)
+    src, dst = graph.src, graph.dst
+
+    for _ in range(iterations):
+        if n <= REPULSION_SAMPLE:
+            others, weight = positions, 1.0
+        else:
+            others = positions[rng.choice(n, REPULSION_SAMPLE, replace=False)]
+            weight = n / REPULSION_SAMPLE
+
+        # 반발력 (이상적 거리 k = 1): delta * k^2 / d^2
+        displacement = np.zeros((n, 2))
+        block = max(1, PAIR_BLOCK // len(others))
+        for start in range(0, n, block):
+            delta = positions[start:start + block, None, :] - others[None, :, :]
+            dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+            displacement[start:start + block] = (delta / dist2[:, :, None]).sum(axis=1) * weight
+
+        # 인력: delta * d / k
+        delta = positions[src] - positions[dst]
+        attraction = delta * np.sqrt((delta ** 2).sum(axis=1))[:, None]
+        np.subtract.at(displacement, src, attraction)
+        np.add.at(displacement, dst, attraction)
+
+        # 이동 거리를 온도로 제한
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-9)
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    positions -= positions.mean(axis=0)
+    return positions * NODE_SPACING
+
+
+LAYOUTS = {
+    'circle': circle_layout,
+    'grid': grid_layout,
+    'concentric': concentric_layout,
+    'cose': force_layout,
+}
+
+_graph_lock = threading.Lock()
+_graph_cache = {}
+_layout_cache = {}
+
+
+def graph_version():
+    """공급망 데이터 파일의 버전을 반환하는 함수 (파일이 없으면 'builtin')"""
+    try:
+        return (dataset_version(NODES_FILE), dataset_version(EDGES_FILE))
+    except FileNotFoundError:
+        return 'builtin'
+
+
+def get_supply_chain_graph(fallback_elements=None):
+    """
+    데이터 버전별로 한 번만 생성한 공급망 그래프를 반환하는 함수
+
+    데이터 파일이 없으면 fallback_elements(Cytoscape 요소 목록)로 그래프를 만듭니다.
+    """
+    version = graph_version()
+    with _graph_lock:
+        graph = _graph_cache.get(version)
+    if graph is not None:
+        return graph
+
+    if version == 'builtin':
+        graph = SupplyChainGraph.from_elements(fallback_elements or [])
+    else:
+        graph = SupplyChainGraph(load_dataset(NODES_FILE), load_dataset(EDGES_FILE))
+
+    with _graph_lock:
+        # 이전 버전 그래프와 레이아웃은 버림
+        _graph_cache.clear()
+        _graph_cache[version] = graph
+        for stale in [k for k in _layout_cache if k[0] != version]:
+            del _layout_cache[stale]
+    return graph
+
+
+def get_layout(layout_name, fallback_elements=None):
+    """그래프 버전과 레이아웃 이름별로 한 번만 계산한 (노드 수 x 2) 좌표를 반환하는 함수"""
+    graph = get_supply_chain_graph(fallback_elements)
+    key = (graph_version(), layout_name)
+    with _graph_lock:
+        positions = _layout_cache.get(key)
+    if positions is None:
+        positions = LAYOUTS[layout_name](graph)
+        positions.flags.writeable = False
+        with _graph_lock:
+            _layout_cache[key] = positions
+    return positions
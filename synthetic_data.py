@@ -0,0 +1,339 @@
+"""
+대규모 합성 데이터 생성기
+
+같은 seed와 scale이면 항상 같은 데이터를 생성합니다 (뉴스는 기간 끝 시각 news_end도
+같아야 하며, 지정하지 않으면 현재 UTC 시각을 시 단위로 내림한 값). 최대 CHUNK_ROWS행 블록
+단위로 생성해 파일에 이어 쓰므로, 데이터프레임 메모리 사용량은 scale과 관계없이
+블록 크기로 제한됩니다 (기업/건설사 이름 목록만 scale에 비례).
+
+scale=1은 현재 샘플 CSV와 비슷한 크기이고, 생산 데이터는 scale에 비례해
+팹(Company) 수가 늘어납니다. (예: scale=1000, 6년 -> 약 144만 행)
+
+사용 예:
+    python synthetic_data.py --scale 1000 --seed 42 --out data
+    python synthetic_data.py --scale 100 --years 2015 2027 --news-archive
+    python synthetic_data.py --news-end 2025-01-01T00:00:00 --news-archive
+"""
+import os
+import json
+import argparse
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from data_store import DATA_DIR
+from news_categories import SEARCH_QUERIES, classify_news
+
+BASE_COMPANIES = ['삼성전자', 'SK하이닉스', 'TSMC', 'Intel', 'Micron']
+MODELS = ['DRAM', 'NAND', 'SSD', 'CPU']
+COUNTRIES = {
+    'Korea': (36.9, 127.3),
+    'Taiwan': (23.5, 120.6),
+    'USA': (37.0, -100.0),
+    'China': (31.2, 121.0),
+    'Japan': (33.0, 131.0),
+    'Germany': (51.5, 10.5),
+}
+STATUSES = ['Completed', 'In Progress', 'Planned']
+CONTRACTORS = ['Samsung C&T', 'SK Ecoplant', 'Bechtel', 'CTCI', 'Hyundai E&C', 'Daewoo E&C']
+SUPPLIER_TYPES = ['장비사', '소재사', '부품사']
+NEWS_TEMPLATES = [
+    ("{company}, {model} 실적 발표", "{company}의 {model} 매출과 영업이익이 발표되었습니다."),
+    ("{company}, 차세대 {model} 공정 개발", "{company}가 차세대 {model} 나노 공정 기술 연구 성과를 공개했습니다."),
+    ("{model} 시장 수요 전망", "{model} 시장의 수요와 공급 전망이 발표되었습니다."),
+    ("{company}, 반도체 보조금 지원 확정", "정부가 {company}에 대한 반도체 정책 지원과 보조금을 확정했습니다."),
+]
+
+CHUNK_ROWS = 100_000
+
+
+def _rng(seed, *stream):
+    """(seed, 스트림 번호) 조합별로 독립적이고 재현 가능한 난수 생성기를 반환하는 함수"""
+    return np.random.default_rng([seed, *stream])
+
+
+def _write_chunk(df, path, first):
+    df.to_csv(path, mode='w' if first else 'a', header=first, index=False)
+
+
+def company_names(scale):
+    """scale에 비례하는 팹(Company) 이름 목록을 반환하는 함수"""
+    names = []
+    for k in range(scale):
+        for company in BASE_COMPANIES:
+            names.append(company if k == 0 else f"{company} Fab{k}")
+    return np.array(names, dtype=object)
+
+
+def row_blocks(count, rows_per_item):
+    """항목 count개를 한 블록이 CHUNK_ROWS행을 넘지 않도록 나눈 (시작, 끝) 목록을 반환하는 함수"""
+    per_block = max(1, CHUNK_ROWS // rows_per_item)
+    return [(start, min(start + per_block, count)) for start in range(0, count, per_block)]
+
+
+def generate_production(path, scale, years, seed):
+    """반도체 생산 데이터를 (연도, 기업 블록) 단위로 생성해 이어 쓰는 함수"""
+    companies = company_names(scale)
+    blocks = row_blocks(len(companies), 12 * len(MODELS))
+    rows = 0
+    for year in years:
+        for b, (start, end) in enumerate(blocks):
+            rng = _rng(seed, 1, year, b)
+            # 월 x 기업 x 모델 격자
+            month, company, model = np.meshgrid(
+                np.arange(1, 13), np.arange(start, end), np.arange(len(MODELS)), indexing='ij'
+            )
+            n = month.size
+            chunk = pd.DataFrame({
+                'Year': year,
+                'Month': month.ravel(),
+                'Company': companies[company.ravel()],
+                'Model': np.array(MODELS, dtype=object)[model.ravel()],
+                'Production_Volume': rng.integers(50, 200, n),
+                'Efficiency': rng.uniform(70, 95, n),
+            })
+            _write_chunk(chunk, path, first=(rows == 0))
+            rows += n
+    return rows
+
+
+def generate_sales(path, scale, years, seed):
+    """
+    반도체 판매 데이터를 (연도, 기업 블록) 단위로 생성해 이어 쓰는 함수
+
+    시장 점유율은 연도 전체 합계로 정규화하므로, 블록별 난수를 한 번 더 생성해 합계를 먼저 구합니다.
+    """
+    companies = company_names(scale)
+    blocks = row_blocks(len(companies), len(MODELS))
+    rows = 0
+    for year in years:
+        # 1차: 연도 전체 점유율 합계
+        share_total = sum(
+            _rng(seed, 2, year, b).uniform(1, 30, (end - start) * len(MODELS)).sum()
+            for b, (start, end) in enumerate(blocks)
+        )
+        for b, (start, end) in enumerate(blocks):
+            rng = _rng(seed, 2, year, b)
+            company, model = np.meshgrid(np.arange(start, end), np.arange(len(MODELS)), indexing='ij')
+            n = company.size
+            share = rng.uniform(1, 30, n)
+            chunk = pd.DataFrame({
+                'Year': year,
+                'Company': companies[company.ravel()],
+                'Model': np.array(MODELS, dtype=object)[model.ravel()],
+                'Sales_Volume': rng.integers(100, 500, n),
+                'Market_Share': share / share_total * 100 * len(MODELS),
+            })
+            _write_chunk(chunk, path, first=(rows == 0))
+            rows += n
+    return rows
+
+
+def generate_construction(projects_path, revenue_path, scale, years, seed):
+    """건설 프로젝트/매출 데이터를 블록 단위로 생성해 이어 쓰는 함수"""
+    countries = list(COUNTRIES)
+    centers = np.array([COUNTRIES[c] for c in countries])
+    total = 27 * scale
+    written = 0
+    block = 0
+    while written < total:
+        n = min(CHUNK_ROWS, total - written)
+        rng = _rng(seed, 3, block)
+        country_idx = rng.integers(0, len(countries), n)
+        company = np.array(BASE_COMPANIES, dtype=object)[rng.integers(0, len(BASE_COMPANIES), n)]
+        ids = np.arange(written, written + n)
+        chunk = pd.DataFrame({
+            'Year': rng.choice(years, n),
+            'Country': np.array(countries, dtype=object)[country_idx],
+            'Company': company,
+            'Project_Name': [f"Fab {i}" for i in ids],
+            'City': [f"City {i % 997}" for i in ids],
+            'Investment_Amount': rng.integers(5_000, 50_000, n),
+            'Status': np.array(STATUSES, dtype=object)[rng.integers(0, len(STATUSES), n)],
+            'Latitude': centers[country_idx, 0] + rng.normal(0, 2.0, n),
+            'Longitude': centers[country_idx, 1] + rng.normal(0, 2.0, n),
+            'Source': 'Synthetic',
+        })
+        _write_chunk(chunk, projects_path, first=(block == 0))
+        written += n
+        block += 1
+
+    # 건설사 매출은 (건설사 수 x 연도) 규모
+    contractors = np.array([c if k == 0 else f"{c} {k}" for k in range(scale) for c in CONTRACTORS], dtype=object)
+    first = True
+    for year in years:
+        for b, (start, end) in enumerate(row_blocks(len(contractors), 1)):
+            rng = _rng(seed, 4, year, b)
+            n = end - start
+            chunk = pd.DataFrame({
+                'Year': year,
+                'Country': np.array(countries, dtype=object)[rng.integers(0, len(countries), n)],
+                'Company': contractors[start:end],
+                'Revenue': rng.integers(1_000, 10_000, n),
+                'Source': 'Synthetic',
+            })
+            _write_chunk(chunk, revenue_path, first=first)
+            first = False
+    return total
+
+
+def news_end_time(end=None):
+    """합성 뉴스 기간의 끝 시각을 UTC 시 단위로 내림해 반환하는 함수 (None이면 현재 시각 기준)"""
+    end = pd.Timestamp(end if end is not None else datetime.now(timezone.utc))
+    end = end.tz_localize('UTC') if end.tzinfo is None else end.tz_convert('UTC')
+    return end.floor('h')
+
+
+def generate_news(path, scale, days, seed, archive=None, end=None):
+    """
+    뉴스 기사를 JSON Lines로 블록 단위 생성하는 함수
+
+    기사는 end(기본값: 현재 UTC 시각의 시 단위 내림) 이전 days일 동안에 분포합니다.
+    archive가 있으면 모든 검색 카테고리에 함께 저장하고, 그 기간을 가져온 기간으로 기록합니다.
+    """
+    total = 100 * scale
+    end = news_end_time(end)
+    written = 0
+    block = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < total:
+            n = min(CHUNK_ROWS, total - written)
+            rng = _rng(seed, 5, block)
+            template = rng.integers(0, len(NEWS_TEMPLATES), n)
+            company = rng.integers(0, len(BASE_COMPANIES), n)
+            model = rng.integers(0, len(MODELS), n)
+            offsets = pd.to_timedelta(rng.integers(0, days * 86400, n), unit='s')
+            published = (end - offsets).strftime('%Y-%m-%dT%H:%M:%SZ')
+            articles = []
+            for i in range(n):
+                title, description = NEWS_TEMPLATES[template[i]]
+                fields = {'company': BASE_COMPANIES[company[i]], 'model': MODELS[model[i]]}
+                articles.append({
+                    'source': {'id': None, 'name': 'Synthetic News'},
+                    'author': None,
+                    'title': f"{title.format(**fields)} #{written + i}",
+                    'description': description.format(**fields),
+                    'url': f"https://example.com/synthetic/{written + i}",
+                    'publishedAt': published[i],
+                })
+            f.writelines(json.dumps(article, ensure_ascii=False) + '\n' for article in articles)
+            if archive is not None:
+                news_df = pd.DataFrame(articles)
+                news_df['category'] = classify_news(news_df)
+                for query_category in SEARCH_QUERIES:
+                    archive.add_articles(query_category, news_df)
+            written += n
+            block += 1
+
+    if archive is not None:
+        start = end - pd.Timedelta(days=days)
+        for query_category in SEARCH_QUERIES:
+            archive.mark_covered(
+                query_category, start.strftime('%Y-%m-%dT%H:%M:%S'), end.strftime('%Y-%m-%dT%H:%M:%S'))
+    return total
+
+
+def generate_supply_chain(nodes_path, edges_path, scale, seed):
+    """
+    공급망 노드/엣지 데이터를 생성하는 함수
+
+    제조사는 company_names(scale), 공급사는 20 x scale개입니다. 공급사는 1~3곳의
+    제조사에 공급하고, 소재사 일부는 부품사에도 공급하며, 소수의 핵심 장비사는
+    제조사의 10%에 공급합니다.
+    """
+    rng = _rng(seed, 6)
+    manufacturers = company_names(scale)
+    n_suppliers = 20 * scale
+    supplier_types = np.array(SUPPLIER_TYPES, dtype=object)[rng.integers(0, len(SUPPLIER_TYPES), n_suppliers)]
+    suppliers = np.array([f"{t} {i}" for i, t in enumerate(supplier_types)], dtype=object)
+
+    ids = np.concatenate([manufacturers, suppliers])
+    nodes = pd.DataFrame({
+        'id': ids,
+        'label': ids,
+        'type': np.concatenate([np.full(len(manufacturers), '제조사', dtype=object), supplier_types]),
+    })
+    _write_chunk(nodes, nodes_path, first=True)
+
+    # 공급사 -> 제조사
+    n_links = rng.integers(1, 4, n_suppliers)
+    sources = [np.repeat(suppliers, n_links)]
+    targets = [manufacturers[rng.integers(0, len(manufacturers), n_links.sum())]]
+
+    # 소재사 -> 부품사 (2차 공급망)
+    materials = suppliers[(supplier_types == '소재사') & (rng.random(n_suppliers) < 0.5)]
+    parts = suppliers[supplier_types == '부품사']
+    if len(materials) and len(parts):
+        sources.append(materials)
+        targets.append(parts[rng.integers(0, len(parts), len(materials))])
+
+    # 핵심 장비사 -> 제조사 10%
+    core = suppliers[supplier_types == '장비사'][:max(1, scale // 5)]
+    reach = max(1, len(manufacturers) // 10)
+    for supplier in core:
+        sources.append(np.full(reach, supplier, dtype=object))
+        targets.append(rng.choice(manufacturers, reach, replace=False))
+
+    edges = pd.DataFrame({
+        'source': np.concatenate(sources),
+        'target': np.concatenate(targets),
+    }).drop_duplicates()
+    _write_chunk(edges, edges_path, first=True)
+    return len(edges)
+
+
+def generate_all(out_dir=None, scale=1, years=range(2020, 2026), seed=42, news_days=30, news_archive=False,
+                 news_end=None):
+    """모든 합성 데이터셋을 생성하고 {파일 이름: 행 수}를 반환하는 함수"""
+    out_dir = out_dir or DATA_DIR
+    os.makedirs(out_dir, exist_ok=True)
+    years = list(years)
+
+    archive = None
+    if news_archive:
+        from news_archive import NewsArchive
+        archive = NewsArchive(os.path.join(out_dir, 'news_archive.sqlite'))
+
+    return {
+        'semiconductor_production.csv': generate_production(
+            os.path.join(out_dir, 'semiconductor_production.csv'), scale, years, seed),
+        'semiconductor_sales.csv': generate_sales(
+            os.path.join(out_dir, 'semiconductor_sales.csv'), scale, years, seed),
+        'construction_projects.csv': generate_construction(
+            os.path.join(out_dir, 'construction_projects.csv'),
+            os.path.join(out_dir, 'construction_revenue.csv'), scale, years, seed),
+        'supply_chain_edges.csv': generate_supply_chain(
+            os.path.join(out_dir, 'supply_chain_nodes.csv'),
+            os.path.join(out_dir, 'supply_chain_edges.csv'), scale, seed),
+        'news_articles.jsonl': generate_news(
+            os.path.join(out_dir, 'news_articles.jsonl'), scale, news_days, seed, archive, news_end),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대규모 합성 데이터 생성기")
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--years', type=int, nargs=2, default=[2020, 2025], metavar=('START', 'END'))
+    parser.add_argument('--news-days', type=int, default=30)
+    parser.add_argument('--news-archive', action='store_true', help="뉴스를 SQLite 아카이브에도 저장")
+    parser.add_argument('--news-end', default=None, help="뉴스 기간의 끝 시각 (UTC, 기본값: 현재 시각)")
+    parser.add_argument('--out', default=None)
+    args = parser.parse_args(argv)
+
+    counts = generate_all(
+        out_dir=args.out,
+        scale=args.scale,
+        years=range(args.years[0], args.years[1] + 1),
+        seed=args.seed,
+        news_days=args.news_days,
+        news_archive=args.news_archive,
+        news_end=args.news_end,
+    )
+    for filename, rows in counts.items():
+        print(f"{filename}: {rows:,}행")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import pytest
+
+from benchmark import summarize_trace, find_regressions
+
+
+def span(name, depth, duration_ms):
+    return {'name': name, 'depth': depth, 'start_ms': 0.0, 'duration_ms': duration_ms}
+
+
+def test_nested_spans_count_only_in_innermost_stage():
+    trace = {'total_ms': 100.0, 'spans': [
+        span('show_semiconductor_industry_main', 0, 100.0),
+        span('aggregate', 1, 50.0),
+        span('get_production_cube', 2, 45.0),
+        span('load:semiconductor_production.csv', 3, 20.0),
+        span('aggregate', 3, 10.0),
+        span('filter', 1, 5.0),
+        span('figure:sales', 1, 8.0),
+    ]}
+    times = summarize_trace(trace)
+    assert times['load'] == pytest.approx(0.020)
+    assert times['aggregate'] == pytest.approx(0.030)
+    assert times['filter'] == pytest.approx(0.005)
+    assert times['figure'] == pytest.approx(0.008)
+    assert times['page'] == pytest.approx(0.100)
+
+
+def test_missing_baseline_entries_are_reported():
+    results = {'1': {'show_news': {'page': 0.2, 'load': 0.0}}, '10': {'show_news': {'page': 1.0}}}
+    baseline = {'1': {'show_news': {'page': 0.1}}}
+    regressions, missing = find_regressions(results, baseline)
+    assert regressions == [('1', 'show_news', 'page', 0.1, 0.2)]
+    assert missing == [('1', 'show_news', 'load'), ('10', 'show_news', 'page')]
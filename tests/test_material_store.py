@@ -0,0 +1,43 @@
+import pandas as pd
+
+import material_store
+from material_store import QuarterlySeriesStore
+
+
+def wide_prices(copper_q1=8950.0, extra_quarter=False):
+    df = pd.DataFrame({
+        'material': ['구리', '니켈'],
+        '2023_Q1': [copper_q1, 21000.0],
+        '2023_Q2': [9120.0, 20500.0],
+        '2023_Q3': [9350.0, 19800.0],
+        'unit': ['USD/t', 'USD/t'],
+    })
+    if extra_quarter:
+        df.insert(4, '2023_Q4', [9400.0, 19500.0])
+    return df
+
+
+def test_extend_appends_new_quarter():
+    store = QuarterlySeriesStore.from_wide(wide_prices(), 'material')
+    extended = store.extend(wide_prices(extra_quarter=True))
+    assert extended is not None
+    assert [str(p) for p in extended.periods] == ['2023Q1', '2023Q2', '2023Q3', '2023Q4']
+    assert extended.values[0].tolist() == [8950.0, 9120.0, 9350.0, 9400.0]
+
+
+def test_extend_rejects_revised_existing_quarter():
+    store = QuarterlySeriesStore.from_wide(wide_prices(), 'material')
+    assert store.extend(wide_prices(copper_q1=1.0)) is None
+    assert store.extend(wide_prices(copper_q1=1.0, extra_quarter=True)) is None
+
+
+def test_get_store_rebuilds_after_revision(monkeypatch):
+    frames = {'v1': wide_prices(), 'v2': wide_prices(copper_q1=1.0)}
+    version = {'current': 'v1'}
+    monkeypatch.setattr(material_store, '_stores', {})
+    monkeypatch.setattr(material_store, 'dataset_version', lambda filename: version['current'])
+    monkeypatch.setattr(material_store, 'load_dataset', lambda filename: frames[version['current']])
+
+    assert material_store.get_material_store().values[0].tolist() == [8950.0, 9120.0, 9350.0]
+    version['current'] = 'v2'
+    assert material_store.get_material_store().values[0].tolist() == [1.0, 9120.0, 9350.0]
@@ -0,0 +1,36 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from synthetic_data import generate_supply_chain
+from supply_chain_graph import SupplyChainGraph
+from supply_chain_analytics import BottleneckReport, betweenness_centrality
+
+
+def synthetic_graph(tmp_path, scale, seed=42):
+    nodes_path, edges_path = tmp_path / 'nodes.csv', tmp_path / 'edges.csv'
+    generate_supply_chain(nodes_path, edges_path, scale, seed)
+    return SupplyChainGraph(pd.read_csv(nodes_path), pd.read_csv(edges_path))
+
+
+def test_betweenness_matches_networkx(tmp_path):
+    nx = pytest.importorskip('networkx')
+    graph = synthetic_graph(tmp_path, scale=3, seed=1)
+    reference = nx.Graph()
+    reference.add_nodes_from(range(graph.n))
+    reference.add_edges_from(zip(graph.src, graph.dst))
+    expected = nx.betweenness_centrality(reference)
+
+    result = betweenness_centrality(graph, samples=graph.n)
+    assert np.allclose(result, [expected[i] for i in range(graph.n)], atol=1e-12)
+
+
+def test_bottleneck_report_under_a_second_at_10k_nodes(tmp_path):
+    graph = synthetic_graph(tmp_path, scale=400)
+    assert graph.n >= 10_000
+
+    start = time.perf_counter()
+    BottleneckReport(graph)
+    assert time.perf_counter() - start < 1.0